@@ -0,0 +1,46 @@
+"""
+Cost of toggling multiplayer, which builds a new player 2 cloud, with a cold
+asset cache (load and rotate cloud.png again, as before) and a warm one.
+Also prints what every cached asset costs in memory and load time.
+
+Run from the repository root:
+    python -m benchmarks.bench_asset_cache
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.core.simulation import create_headless_game  # noqa: E402
+from src.utils import constants as c  # noqa: E402
+from src.utils.assets import get_asset_cache  # noqa: E402
+
+import pygame  # noqa: E402
+
+TOGGLES = 500
+
+
+def bench_toggle(clear_cache: bool) -> float:
+    game_state = create_headless_game()
+    assets = get_asset_cache()
+    start = time.perf_counter()
+    for _ in range(TOGGLES):
+        if clear_cache:
+            assets.clear()
+        game_state.toggle_multiplayer()
+    return (time.perf_counter() - start) / TOGGLES
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((c.WIDTH, c.HEIGHT))
+    print(f"toggle, cold cache: {bench_toggle(True) * 1e6:9.1f} us")
+    print(f"toggle, warm cache: {bench_toggle(False) * 1e6:9.1f} us")
+    print()
+    for entry in get_asset_cache().stats():
+        print(
+            f"{entry.path:<32} {str(entry.transform):<20} "
+            f"{entry.size / 1024:9.1f} KiB {entry.load_time * 1e3:8.2f} ms"
+        )
+    pygame.quit()
@@ -0,0 +1,32 @@
+"""
+Match-steps per second of the headless GameState against BatchSimulation.
+
+Run from the repository root:
+    python -m benchmarks.bench_batch_simulation
+"""
+
+import time
+
+from src.core.batch_simulation import BatchSimulation
+from src.core.simulation import create_headless_game, run_headless
+
+
+def bench_reference(ticks: int) -> float:
+    game_state = create_headless_game(opponent="tracker")
+    start = time.perf_counter()
+    run_headless(game_state, ticks)
+    return ticks / (time.perf_counter() - start)
+
+
+def bench_batch(matches: int, ticks: int) -> float:
+    simulation = BatchSimulation(matches, seed=0)
+    start = time.perf_counter()
+    simulation.run(ticks)
+    return matches * ticks / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(f"GameState (headless): {bench_reference(5_000):>14,.0f} match-steps/s")
+    for matches in (1_000, 10_000, 100_000):
+        rate = bench_batch(matches, 200)
+        print(f"BatchSimulation x{matches:<7,}: {rate:>12,.0f} match-steps/s")
@@ -0,0 +1,38 @@
+"""
+Decision cost and strength of each registered AI controller: every controller
+plays player 2 in a headless game against the tracker, then its decision
+timings, budget overruns, late answers of the out-of-process "remote"
+controller (the echo bot) and score are printed.
+
+Run from the repository root:
+    python -m benchmarks.bench_controllers
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.core.controllers import CONTROLLERS  # noqa: E402
+from src.core.simulation import create_headless_game, run_headless  # noqa: E402
+from src.utils import constants as c  # noqa: E402
+
+TICKS = 30_000
+
+
+if __name__ == "__main__":
+    print(f"{TICKS} ticks against the tracker, {c.AI_DECISION_BUDGET} us budget")
+    for name in CONTROLLERS:
+        game_state = create_headless_game(opponent=name, player1="tracker")
+        # Headless games play without a budget: turn it on to count overruns
+        game_state.cloud_player2.harness.budget = c.AI_DECISION_BUDGET
+        run_headless(game_state, TICKS)
+        harness = game_state.cloud_player2.harness
+        late = getattr(harness.controller, "late", 0)
+        print(
+            f"{name:<11} mean {harness.timings.mean * 1e6:5.2f} us  "
+            f"worst {harness.timings.worst * 1e6:7.2f} us  "
+            f"overruns {harness.overruns:3}  late {late:4}  "
+            f"score {game_state.player2_score:3} - {game_state.player1_score:3}"
+        )
+        if hasattr(harness.controller, "close"):
+            harness.controller.close()
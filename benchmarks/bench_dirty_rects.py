@@ -0,0 +1,51 @@
+"""
+Frame cost of the playing screen: full redraw and flip against dirty-rect
+rendering. Also checks both paths end on the same pixels.
+
+Run from the repository root:
+    python -m benchmarks.bench_dirty_rects
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.core.simulation import create_headless_game  # noqa: E402
+from src.ui.renderer import Renderer  # noqa: E402
+from src.utils import constants as c  # noqa: E402
+
+import pygame  # noqa: E402
+
+FRAMES = 3_000
+
+
+def bench(dirty_rects: bool) -> tuple[float, pygame.Surface]:
+    random.seed(0)
+    screen = pygame.Surface((c.WIDTH, c.HEIGHT))
+    renderer = Renderer(screen, dirty_rects)
+    game_state = create_headless_game()
+    game_state.bonus_star.spawn()
+    game_state.bonus_star.particle_system.spawn_particles(
+        100, 100, c.STAR_PARTICLES_COLOR
+    )
+    elapsed = 0.0
+    for _ in range(FRAMES):
+        game_state.update()
+        start = time.perf_counter()
+        renderer.render(game_state)
+        elapsed += time.perf_counter() - start
+    return elapsed / FRAMES, screen
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((c.WIDTH, c.HEIGHT))
+    full, full_screen = bench(dirty_rects=False)
+    dirty, dirty_screen = bench(dirty_rects=True)
+    same = full_screen.get_view("2").raw == dirty_screen.get_view("2").raw
+    print(f"full redraw + flip: {full * 1e6:8.1f} us/frame")
+    print(f"dirty rects:        {dirty * 1e6:8.1f} us/frame")
+    print(f"same final frame:   {same}")
+    pygame.quit()
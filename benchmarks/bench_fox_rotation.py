@@ -0,0 +1,50 @@
+"""
+Per-frame cost of spinning the fox: rotozoom every frame against a lookup in
+the pre-rendered rotation frames.
+
+Run from the repository root:
+    python -m benchmarks.bench_fox_rotation
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.core.fox import Fox  # noqa: E402
+from src.utils import constants as c  # noqa: E402
+
+import pygame  # noqa: E402
+
+FRAMES = 20_000
+
+
+def bench_rotozoom(fox: Fox) -> float:
+    angle = 0.0
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        angle += c.FOX_SPIN_SPEED
+        image = pygame.transform.rotozoom(fox.original_image, angle, 1)
+        old_center = fox.rect.center
+        fox.rect = image.get_rect()
+        fox.rect.center = old_center
+    return (time.perf_counter() - start) / FRAMES
+
+
+def bench_rotation_frames(fox: Fox) -> float:
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        fox._rotate_image()
+    return (time.perf_counter() - start) / FRAMES
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((c.WIDTH, c.HEIGHT))
+    start = time.perf_counter()
+    fox = Fox(c.BASE_SPEED)
+    build = time.perf_counter() - start
+    print(f"build {c.FOX_ROTATION_STEPS} frames (once): {build * 1e3:8.2f} ms")
+    print(f"rotozoom per frame:      {bench_rotozoom(fox) * 1e6:8.2f} us")
+    print(f"frame lookup per frame:  {bench_rotation_frames(fox) * 1e6:8.2f} us")
+    pygame.quit()
@@ -0,0 +1,108 @@
+"""
+Rect allocations and time per tick spent on hitboxes, in a headless single
+player game with player 1 following the fox. Before: every hitbox read built
+a new Rect, as the hitbox properties used to. After: hitboxes are kept by a
+HitboxCache, which allocates once per sprite and then rebuilds in place when
+the sprite rect changed.
+
+Run from the repository root:
+    python -m benchmarks.bench_hitboxes
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.core.bonus_star import BonusStar  # noqa: E402
+from src.core.cloud import Cloud  # noqa: E402
+from src.core.fox import Fox  # noqa: E402
+from src.core.simulation import create_headless_game  # noqa: E402
+from src.utils import constants as c  # noqa: E402
+
+import pygame  # noqa: E402
+
+TICKS = 30_000
+
+
+def uncached_hitboxes(reads: list[int]) -> dict:
+    """
+    The hitbox properties as they were before HitboxCache, counting reads
+
+    Args:
+        reads (list[int]): A one element counter of hitbox reads
+
+    Returns:
+        dict: The property for each sprite class
+    """
+
+    def fox_hitbox(self) -> pygame.Rect:
+        reads[0] += 1
+        diameter = self.rect.width - c.FOX_HITBOX_DIFF
+        box = pygame.Rect(0, 0, diameter, diameter)
+        box.center = self.rect.center
+        return box
+
+    def cloud_hitbox(self) -> pygame.Rect:
+        reads[0] += 1
+        box = self.rect.copy()
+        box.width = self.rect.width - c.CLOUD_HITBOX_WIDTH_DIFF
+        box.height = self.rect.height + c.CLOUD_HITBOX_HEIGHT_DIFF
+        box.center = self.rect.center
+        if self.player == "player1":
+            box.left = self.rect.left
+        elif self.player == "player2":
+            box.right = self.rect.right
+        return box
+
+    def bonus_star_hitbox(self) -> pygame.Rect:
+        reads[0] += 1
+        box = self.rect.copy()
+        box.width = self.rect.width - c.BONUS_HITBOX_DIFF
+        box.height = self.rect.height - c.BONUS_HITBOX_DIFF
+        box.center = self.rect.center
+        return box
+
+    return {
+        Fox: property(fox_hitbox),
+        Cloud: property(cloud_hitbox),
+        BonusStar: property(bonus_star_hitbox),
+    }
+
+
+def run_game():
+    game_state = create_headless_game()
+    game_state.bonus_star._active = True
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        game_state.cloud_player1.rect.centery = game_state.fox.rect.centery
+        game_state.update()
+    return game_state, (time.perf_counter() - start) / TICKS
+
+
+if __name__ == "__main__":
+    reads = [0]
+    cached = {cls: cls.hitbox for cls in (Fox, Cloud, BonusStar)}
+    for cls, hitbox in uncached_hitboxes(reads).items():
+        cls.hitbox = hitbox
+    _, before_time = run_game()
+    for cls, hitbox in cached.items():
+        cls.hitbox = hitbox
+
+    game_state, after_time = run_game()
+    sprites = (
+        game_state.fox,
+        game_state.cloud_player1,
+        game_state.cloud_player2,
+        game_state.bonus_star,
+    )
+    builds = sum(sprite._hitbox_cache.builds for sprite in sprites)
+    print(
+        f"before: {reads[0] / TICKS:5.2f} Rect allocations per tick, "
+        f"{before_time * 1e6:6.2f} us per tick"
+    )
+    print(
+        f"after:  {2 * len(sprites) / TICKS:5.2f} Rect allocations per tick, "
+        f"{builds / TICKS:5.2f} hitbox rebuilds per tick, "
+        f"{after_time * 1e6:6.2f} us per tick"
+    )
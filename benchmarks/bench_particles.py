@@ -0,0 +1,83 @@
+"""
+Cost of updating and drawing a particle burst: one Python object and one
+pygame.draw.circle per particle against the NumPy columns of ParticleSystem,
+drawn as alpha-faded stamps in one Surface.blits call.
+
+Run from the repository root:
+    python -m benchmarks.bench_particles
+"""
+
+import os
+from random import randint, uniform
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.effects.particle_system import ParticleSystem  # noqa: E402
+from src.utils import constants as c  # noqa: E402
+
+import pygame  # noqa: E402
+
+FRAMES = 30
+BURSTS = (100, 1_000, 10_000, 50_000)
+
+
+class ObjectParticle:
+    """The per-object particle ParticleSystem used to be built from."""
+
+    def __init__(self, x: int, y: int, color: tuple):
+        self.x = x
+        self.y = y
+        self.velocity_x = uniform(-2, 2)
+        self.velocity_y = uniform(-2, 2)
+        self.lifetime = randint(30, 60)
+        self.initial_lifetime = self.lifetime
+        self.color = color
+
+    def update(self) -> bool:
+        self.x += self.velocity_x
+        self.y += self.velocity_y
+        self.lifetime -= 1
+        alpha = int((self.lifetime / self.initial_lifetime) * 255)
+        self.color = (*self.color[:3], alpha)
+        return self.lifetime > 0
+
+
+def bench_objects(screen: pygame.Surface, burst: int) -> float:
+    particles = [
+        ObjectParticle(c.WIDTH // 2, c.HEIGHT // 2, c.STAR_PARTICLES_COLOR)
+        for _ in range(burst)
+    ]
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        particles = [particle for particle in particles if particle.update()]
+        for particle in particles:
+            pygame.draw.circle(
+                screen, particle.color, (int(particle.x), int(particle.y)), 2
+            )
+    return (time.perf_counter() - start) / FRAMES
+
+
+def bench_columns(screen: pygame.Surface, burst: int) -> float:
+    particle_system = ParticleSystem(capacity=burst)
+    particle_system.spawn_particles(
+        c.WIDTH // 2, c.HEIGHT // 2, c.STAR_PARTICLES_COLOR, count=burst
+    )
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        particle_system.update()
+        particle_system.draw(screen)
+    return (time.perf_counter() - start) / FRAMES
+
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode((c.WIDTH, c.HEIGHT))
+    for burst in BURSTS:
+        objects = bench_objects(screen, burst)
+        columns = bench_columns(screen, burst)
+        print(
+            f"{burst:>6,} particles: objects {objects * 1e3:8.2f} ms/frame, "
+            f"columns {columns * 1e3:7.2f} ms/frame"
+        )
+    pygame.quit()
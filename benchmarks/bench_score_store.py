@@ -0,0 +1,58 @@
+"""
+Cost of saving one game and querying the top five against the number of
+stored scores, for the SQLite store and the old whole-file pickle.
+
+Run from the repository root:
+    python -m benchmarks.bench_score_store
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from src.utils.score_store import PickleScoreStore, Score, SqliteScoreStore
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+REPEATS = 20
+
+
+def history(size: int) -> list[Score]:
+    return [Score("2025-01-01 10:00", random.randint(0, 500)) for _ in range(size)]
+
+
+def bench(store, repeats: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        store.add([Score("2025-01-02 10:00", random.randint(0, 500))])
+    save = (time.perf_counter() - start) / repeats
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        store.top(5)
+    top = (time.perf_counter() - start) / repeats
+    return save, top
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            scores = history(size)
+
+            sqlite_store = SqliteScoreStore(os.path.join(directory, f"{size}.db"))
+            sqlite_store.add(scores)
+            save, top = bench(sqlite_store, REPEATS)
+            sqlite_store.close()
+            print(
+                f"sqlite {size:>9,} scores: save {save * 1e3:8.2f} ms, "
+                f"top 5 {top * 1e3:8.3f} ms"
+            )
+
+            pickle_store = PickleScoreStore(os.path.join(directory, f"{size}.pkl"))
+            pickle_store.add(scores)
+            save, top = bench(pickle_store, 1 if size >= 100_000 else REPEATS)
+            print(
+                f"pickle {size:>9,} scores: save {save * 1e3:8.2f} ms, "
+                f"top 5 {top * 1e3:8.3f} ms"
+            )
@@ -0,0 +1,73 @@
+"""
+Collision-to-play() cost of a bounce sound while other sounds are playing:
+Sound.play(), which looks for a free channel, against play() on the reserved
+channel of the sound's class. Also prints how long the mixer buffer holds a
+sound back at pygame's default buffer size and at c.AUDIO_BUFFER_SIZE.
+
+Run from the repository root:
+    python -m benchmarks.bench_sound_latency
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from src.core.sound_manager import SoundManager  # noqa: E402
+from src.utils import constants as c  # noqa: E402
+
+import pygame  # noqa: E402
+
+PLAYS = 20_000
+DEFAULT_BUFFER_SIZE = 512  # pygame 2
+
+
+def bench_free_channel(sound: pygame.mixer.Sound) -> float:
+    start = time.perf_counter()
+    for _ in range(PLAYS):
+        sound.play()
+    return (time.perf_counter() - start) / PLAYS
+
+
+def bench_reserved_channel(sound: pygame.mixer.Sound, channel) -> float:
+    start = time.perf_counter()
+    for _ in range(PLAYS):
+        channel.play(sound)
+    return (time.perf_counter() - start) / PLAYS
+
+
+def bench_play_sound(sound_manager: SoundManager) -> float:
+    sound_manager._cooldown_times["fox-bounce"] = -1
+    start = time.perf_counter()
+    for _ in range(PLAYS):
+        sound_manager.play_sound("fox-bounce")
+    return (time.perf_counter() - start) / PLAYS
+
+
+if __name__ == "__main__":
+    pygame.mixer.pre_init(
+        c.AUDIO_FREQUENCY, c.AUDIO_SIZE, c.AUDIO_CHANNELS, c.AUDIO_BUFFER_SIZE
+    )
+    pygame.init()
+    sound_manager = SoundManager()
+    sound = sound_manager._sounds["fox-bounce"]
+    for name in ("fox-fly-away", "bonus-collect", "mouse-click"):
+        sound_manager._sounds[name].play(loops=-1)
+
+    channel = sound_manager._channels["fox-bounce"]
+    free = bench_free_channel(sound)
+    reserved = bench_reserved_channel(sound, channel)
+    print(f"Sound.play():             {free * 1e6:6.2f} us")
+    print(f"reserved Channel.play():  {reserved * 1e6:6.2f} us")
+    print(f"play_sound():             {bench_play_sound(sound_manager) * 1e6:6.2f} us")
+    latency = sound_manager.play_latency
+    print(
+        f"play_sound latency:       mean {latency.mean * 1e6:.2f} us, "
+        f"worst {latency.worst * 1e6:.2f} us"
+    )
+    for buffer_size in (DEFAULT_BUFFER_SIZE, c.AUDIO_BUFFER_SIZE):
+        print(
+            f"mixer buffer {buffer_size:4} samples: "
+            f"{buffer_size / c.AUDIO_FREQUENCY * 1e3:5.1f} ms"
+        )
+    pygame.quit()
@@ -0,0 +1,33 @@
+"""
+Per-phase cost of a simulation tick: a headless single player game is run
+for a while with player 1 following the fox, then the scheduler timings are
+printed, mean and worst per phase.
+
+Run from the repository root:
+    python -m benchmarks.bench_tick_phases
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.core.simulation import create_headless_game  # noqa: E402
+
+TICKS = 60_000
+
+
+if __name__ == "__main__":
+    game_state = create_headless_game()
+    for _ in range(TICKS):
+        game_state.cloud_player1.rect.centery = game_state.fox.rect.centery
+        game_state.update()
+
+    scheduler = game_state.scheduler
+    total = sum(stats.mean for stats in scheduler.timings.values())
+    print(f"{scheduler.ticks} ticks, {total * 1e6:.2f} us per tick")
+    for name, stats in scheduler.timings.items():
+        print(
+            f"{name:<11} mean {stats.mean * 1e6:6.2f} us  "
+            f"worst {stats.worst * 1e6:8.2f} us  "
+            f"({stats.mean / total:4.0%})"
+        )
@@ -1,12 +1,14 @@
+import argparse
 import datetime
+import logging
 import os
+import shlex
 import sys
+import time
 
-from src.core.game_loop import game_loop
-from src.core.game_state import GameState
-from src.utils import constants as c
+from src.utils.profiling import ImportTimer, format_startup_report
 
-import pygame
+LAUNCH_TIME = time.perf_counter()
 
 # To create a standalone executable:
 # pyinstaller --windowed --onedir --name "Snake"
@@ -27,25 +29,144 @@ def get_resource_path() -> str:
     return os.path.dirname(os.path.abspath(__file__))
 
 
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line options.
+
+    Returns:
+        argparse.Namespace: The parsed options
+    """
+    parser = argparse.ArgumentParser(description="Sleepy Fox")
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="redraw only the changed areas of the playing screen",
+    )
+    parser.add_argument(
+        "--opponent",
+        help="the single player AI: tracker, predictive or random",
+    )
+    bot = parser.add_mutually_exclusive_group()
+    bot.add_argument(
+        "--bot",
+        help="run the single player AI as this command, talking over its stdin "
+        "and stdout (try: python -m src.core.echo_bot)",
+    )
+    bot.add_argument(
+        "--bot-socket",
+        help="play against an AI listening on this Unix socket",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print import and startup timings once the start screen is up, then quit",
+    )
+    return parser.parse_args()
+
+
+def create_opponent(args: argparse.Namespace):
+    """
+    Create the single player AI asked for on the command line
+
+    Args:
+        args (argparse.Namespace): The parsed options
+
+    Returns:
+        str | Controller: A controller running in another process for --bot
+            and --bot-socket, else the name of the AI to play
+    """
+    from src.utils import constants as c
+
+    if args.bot is not None or args.bot_socket is not None:
+        from src.core.remote_controller import RemoteController
+
+        command = shlex.split(args.bot) if args.bot is not None else None
+        return RemoteController(command, args.bot_socket)
+    return args.opponent or c.AI_OPPONENT
+
+
 def main() -> None:
     """
     Main function to run the game.
-    Creates a game state, initializes pygame, and runs the game loop.
+    Initializes pygame and opens the window, shows a loading screen while
+    the assets are decoded in the background, then creates a game state and
+    runs the game loop.
     """
+    args = parse_args()
+    import_timer = ImportTimer()
+    if args.profile_startup:
+        import_timer.install()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    # Imported here, not at the top, so that --profile-startup times them and
+    # the game modules can be imported on the loader thread, behind the
+    # loading screen.
+    from src.core.input import filter_events
+    from src.core.startup import AssetLoader, StartupTimer, show_loading_screen
+    from src.utils import constants as c
+    from src.utils.assets import get_asset_cache
+
+    import pygame
+
+    startup_timer = StartupTimer(LAUNCH_TIME)
+    base_path = None
     try:
         base_path = get_resource_path()
         os.chdir(base_path)
 
-        pygame.init()
-        icon_path = os.path.join(base_path, "assets", "images", "icon.png")
-        pygame.display.set_icon(pygame.image.load(icon_path))
-        screen = pygame.display.set_mode((c.WIDTH, c.HEIGHT), pygame.SCALED, vsync=1)
-        pygame.display.set_caption("Sleepy Fox")
+        with startup_timer.phase("pygame.init"):
+            pygame.mixer.pre_init(
+                c.AUDIO_FREQUENCY, c.AUDIO_SIZE, c.AUDIO_CHANNELS, c.AUDIO_BUFFER_SIZE
+            )
+            pygame.init()
+        with startup_timer.phase("set_mode"):
+            icon_path = os.path.join(base_path, "assets", "images", "icon.png")
+            pygame.display.set_icon(pygame.image.load(icon_path))
+            screen = pygame.display.set_mode(
+                (c.WIDTH, c.HEIGHT), pygame.SCALED, vsync=1
+            )
+            pygame.display.set_caption("Sleepy Fox")
+        filter_events()
         clock = pygame.time.Clock()
+
+        loader = AssetLoader(get_asset_cache(), startup_timer=startup_timer)
+        with startup_timer.phase("loading screen"):
+            loader.start()
+            if not show_loading_screen(screen, clock, loader, startup_timer):
+                return
+            loader.wait()
+
+        from src.core.game_loop import game_loop
+        from src.core.game_state import GameState
+
         pygame.time.set_timer(c.BONUS_SPAWN_EVENT, c.BONUS_SPAWN_INTERVAL)
+        opponent = create_opponent(args)
+        try:
+            with startup_timer.phase("game state (sprites, SoundManager)"):
+                game_state = GameState(opponent=opponent)
+
+            if args.profile_startup:
+                from src.ui.renderer import Renderer
 
-        game_state = GameState()
-        game_loop(screen, game_state, clock)
+                try:
+                    with startup_timer.phase("renderer"):
+                        renderer = Renderer(screen)
+                    renderer.render(game_state)
+                    startup_timer.mark("interactive")
+                finally:
+                    game_state.close()
+                import_timer.uninstall()
+                print(
+                    format_startup_report(
+                        import_timer.times, startup_timer.phases, startup_timer.marks
+                    )
+                )
+            else:
+                game_loop(screen, game_state, clock, args.dirty_rects, startup_timer)
+        finally:
+            if not isinstance(opponent, str):
+                # Passed in, so the game state leaves it open
+                opponent.close()
     except Exception as e:
         error_path = os.path.join(os.path.expanduser("~"), "sleepyfox_error.txt")
         with open(error_path, "w") as f:
@@ -1,19 +1,48 @@
 from src.core.cloud import Cloud
+from src.core.controllers import (
+    Controller,
+    ControllerHarness,
+    Observation,
+    create_controller,
+)
 from src.core.fox import Fox
+from src.core.input import InputSnapshot
 from src.utils import constants as c
 
 
 class AICloud(Cloud):
     """
-    A class to represent an AI cloud.
+    A cloud moved by a controller instead of the keyboard. The controller
+    observes the game once per tick and decides the move, through a harness
+    that times it and keeps the previous move when it runs over its budget.
+
+    Args:
+        headless (bool): Skip what needs a display
+        controller (Controller | str): The controller, or the name of a
+            registered one
+        player (str): The cloud to drive, "player1" or "player2"
+        budget (float | None): The time a decision may take, in microseconds.
+            None lets it take as long as it needs. Only enforced in the real
+            time game: headless, the budget is off so that a simulation plays
+            the same on a busy machine as on an idle one.
     """
 
-    def __init__(self) -> None:
-        super().__init__("player2", is_multiplayer=False)
+    def __init__(
+        self,
+        headless: bool = False,
+        controller: Controller | str = "tracker",
+        player: str = "player2",
+        budget: float | None = c.AI_DECISION_BUDGET,
+    ) -> None:
+        super().__init__(player, is_multiplayer=False, headless=headless)
         self._speed = c.BASE_SPEED * 0.8
-        self._dead_zone = 10
-        self._reaction_delay = 2
-        self._delay_counter = 0
+        self._level = 1
+        # A controller created here is closed with the cloud, one passed in
+        # belongs to the caller
+        self._owns_controller = isinstance(controller, str)
+        if self._owns_controller:
+            controller = create_controller(controller)
+        self._harness = ControllerHarness(controller, None if headless else budget)
 
     @property
     def speed(self) -> float:
@@ -24,45 +53,90 @@ class AICloud(Cloud):
         self._speed = value
 
     @property
-    def dead_zone(self) -> int:
-        return self._dead_zone
+    def controller(self) -> Controller:
+        return self._harness.controller
 
     @property
-    def reaction_delay(self) -> int:
-        return self._reaction_delay
+    def harness(self) -> ControllerHarness:
+        return self._harness
 
     @property
-    def delay_counter(self) -> int:
-        return self._delay_counter
+    def level(self) -> int:
+        """The game level, for controllers that play better as it rises"""
+        return self._level
 
-    def update(self, fox: Fox) -> None:
+    def adapt_to_difficulty(self, game_speed: float, level: int) -> None:
+        """
+        Keep up with the game: the AI moves faster than a player's cloud.
+
+        Args:
+            game_speed (float): The current fox speed
+            level (int): The game level
+        """
+        self.speed = game_speed * 0.6
+        self._level = level
+
+    def close(self) -> None:
+        """
+        Close the controller if the cloud created it and it holds resources,
+        e.g. the process of a remote controller.
+        """
+        close = getattr(self.controller, "close", None)
+        if self._owns_controller and close is not None:
+            close()
+
+    def reset(self) -> None:
+        """
+        Reset the cloud to its initial state
+        """
+        super().reset()
+        self._level = 1
+
+    def update(self, fox: Fox, inputs: InputSnapshot | None = None) -> None:
         """
         Update the AI cloud's position based on the fox's position.
 
         Args:
             fox (Fox): The fox object to track.
+            inputs (InputSnapshot | None): Ignored, the AI does not read the keys.
         """
         super().update(fox)
         self._handle_ai_movement(fox)
 
     def _handle_ai_movement(self, fox: Fox) -> None:
         """
-        Handle the AI cloud's movement based on the fox's position.
+        Show the controller the fox and play the move it decides.
 
         Args:
             fox (Fox): The fox object to track.
         """
-        self._delay_counter += 1
+        decision = self._harness.decide(self._observe(fox))
+        if decision:
+            direction = "down" if decision > 0 else "up"
+            self._move_with_speed(direction, abs(decision))
 
-        if self.delay_counter >= self.reaction_delay:
-            self._delay_counter = 0
-            distance = fox.rect.centery - self.rect.centery
+    def _observe(self, fox: Fox) -> Observation:
+        """
+        Describe the tick to the controller
 
-            if abs(distance) > self.dead_zone:
-                direction = "down" if distance > 0 else "up"
+        Args:
+            fox (Fox): The fox
 
-                speed_factor = min(abs(distance) / 100, 1.0)
-                self._move_with_speed(direction, speed_factor)
+        Returns:
+            Observation: What the controller sees
+        """
+        hitbox = self.hitbox
+        return Observation(
+            player=self.player,
+            cloud_y=self.rect.centery,
+            face_x=hitbox.left if self.player == "player2" else hitbox.right,
+            fox_x=fox.rect.centerx,
+            fox_y=fox.rect.centery,
+            fox_velocity=(fox.velocity.x, fox.velocity.y),
+            fox_width=fox.hitbox.width,
+            fox_height=fox.rect.height,
+            level=self._level,
+        )
 
     def _move_with_speed(self, direction: str, speed_factor: float) -> None:
         """
@@ -0,0 +1,444 @@
+from src.core.controllers import TrackerController
+from src.utils import constants as c
+from src.utils.assets import get_asset_cache
+
+import numpy as np
+
+
+def _round(values: np.ndarray) -> np.ndarray:
+    """
+    Round the way pygame.Rect does when a float is assigned: half away from zero.
+
+    Args:
+        values (np.ndarray): The values to round
+
+    Returns:
+        np.ndarray: The rounded values as integers
+    """
+    return np.trunc(values + np.copysign(0.5, values)).astype(np.int64)
+
+
+def _time_of_impact(
+    left: np.ndarray,
+    top: np.ndarray,
+    size: np.ndarray,
+    delta_x: np.ndarray,
+    delta_y: np.ndarray,
+    target_left: int,
+    target_top: np.ndarray,
+    target_width: int,
+    target_height: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    hitbox.time_of_impact for a square box in every match
+
+    Args:
+        left (np.ndarray): The left of the moving box, at the end of the move
+        top (np.ndarray): The top of the moving box, at the end of the move
+        size (np.ndarray): The side of the moving box
+        delta_x (np.ndarray): How far the box moved along x
+        delta_y (np.ndarray): How far the box moved along y
+        target_left (int): The left of the fixed box
+        target_top (np.ndarray): The top of the fixed box
+        target_width (int): The width of the fixed box
+        target_height (int): The height of the fixed box
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The time of impact, NaN where the box
+            did not run into the target, and whether the boxes met on x
+    """
+    entries, exits = [], []
+    for start, delta, target_start, target_size in (
+        (left - delta_x, delta_x, target_left, target_width),
+        (top - delta_y, delta_y, target_top, target_height),
+    ):
+        near = target_start - (start + size)
+        far = target_start + target_size - start
+        with np.errstate(divide="ignore", invalid="ignore"):
+            entry = np.where(delta > 0, near / delta, far / delta)
+            exit = np.where(delta > 0, far / delta, near / delta)
+        overlapping = (start < target_start + target_size) & (
+            start + size > target_start
+        )
+        entries.append(
+            np.where(delta == 0, np.where(overlapping, -np.inf, np.nan), entry)
+        )
+        exits.append(np.where(delta == 0, np.inf, exit))
+
+    entry = np.maximum(entries[0], entries[1])
+    hit = (entry < np.minimum(exits[0], exits[1])) & (entry >= 0) & (entry <= 1)
+    return np.where(hit, entry, np.nan), entries[0] > entries[1]
+
+
+def _rotated_size(size: int, angle: np.ndarray) -> np.ndarray:
+    """
+    Side of the square surface pygame.transform.rotozoom returns for a square
+    sprite rotated by the given angle.
+
+    rotozoom takes the angle as a C float, so it is narrowed the same way.
+
+    Args:
+        size (int): The side of the unrotated sprite
+        angle (np.ndarray): The rotation angles in degrees
+
+    Returns:
+        np.ndarray: The side of each rotated surface
+    """
+    half = size // 2
+    theta = np.radians(angle.astype(np.float32).astype(np.float64))
+    cx = np.cos(theta) * half
+    sy = np.sin(theta) * half
+    extent = np.maximum(np.abs(cx + sy), np.abs(cx - sy))
+    return 2 * np.maximum(np.ceil(extent).astype(np.int64), 1)
+
+
+class BatchSimulation:
+    """
+    Many headless single player matches stepped in lockstep.
+    State lives in one NumPy array per field, one element per match.
+
+    It reproduces a headless GameState tick by tick: the fox spin, movement,
+    speed clamp, scoring and wall reflection, the AICloud tracking rule, the
+    side and vertical cloud bounces, swept when the fox started the tick clear
+    of a cloud, scoring only a fox no cloud caught,
+    and the difficulty update. Positions keep
+    pygame.Rect's integer rounding. Player 1 only moves when the caller
+    writes to cloud1_y. Bonus stars are not simulated.
+
+    Player 2 is always the tracker AI, the TrackerController with its default
+    tuning. The predictive AI, which the game plays by default
+    (c.AI_OPPONENT), is not simulated. The sprite sizes are read from the
+    same images the game loads.
+
+    Args:
+        matches (int): The number of matches to run
+        seed (int | None): Seed for the serve directions after each point
+    """
+
+    def __init__(self, matches: int, seed: int | None = None) -> None:
+        self._rng = np.random.default_rng(seed)
+        self.matches = matches
+        self.ticks = 0
+
+        assets = get_asset_cache()
+        self.fox_image_size = assets.image("assets/images/fox.png").get_width()
+        self.cloud1_width, self.cloud1_height = assets.rotated(
+            "assets/images/cloud.png", c.CLOUD_PLAYER1_ROTATION
+        ).get_size()
+        self.cloud2_width, self.cloud2_height = assets.rotated(
+            "assets/images/cloud.png", c.CLOUD_PLAYER2_ROTATION
+        ).get_size()
+        tracker = TrackerController()
+        self._dead_zone = tracker.dead_zone
+        self._reaction_delay = tracker.reaction_delay
+
+        fox_size = self.fox_image_size
+        self.angle = np.zeros(matches)
+        self.fox_size = np.full(matches, fox_size, dtype=np.int64)
+        self.fox_x = np.full(matches, c.WIDTH // 2 - fox_size // 2, dtype=np.int64)
+        self.fox_y = np.full(matches, c.HEIGHT // 2 - fox_size // 2, dtype=np.int64)
+        start_x, start_y = 1.0, 0.5
+        length = (start_x**2 + start_y**2) ** 0.5
+        self.velocity_x = np.full(matches, start_x / length * c.BASE_SPEED)
+        self.velocity_y = np.full(matches, start_y / length * c.BASE_SPEED)
+        self.is_first_throw = np.ones(matches, dtype=bool)
+
+        self.cloud1_y = np.full(matches, c.CLOUD_Y, dtype=np.int64)
+        self.cloud2_y = np.full(matches, c.CLOUD_Y, dtype=np.int64)
+        self.cloud2_speed = np.full(matches, c.BASE_SPEED * 0.8)
+        self.delay_counter = np.zeros(matches, dtype=np.int64)
+
+        self.start_x = self.fox_x + self.fox_size // 2
+        self.start_y = self.fox_y + self.fox_size // 2
+
+        self.current_speed = np.full(matches, float(c.BASE_SPEED))
+        self.player1_score = np.zeros(matches, dtype=np.int64)
+        self.player2_score = np.zeros(matches, dtype=np.int64)
+
+    @property
+    def level(self) -> np.ndarray:
+        return np.floor(self.current_speed).astype(np.int64) - 5
+
+    def run(self, ticks: int) -> None:
+        """
+        Advance every match by a number of ticks
+
+        Args:
+            ticks (int): The number of ticks to run
+        """
+        for _ in range(ticks):
+            self.step()
+
+    def step(self) -> None:
+        """Advance every match by one tick, in GameState.update order."""
+        self.start_x = self.fox_x + self.fox_size // 2
+        self.start_y = self.fox_y + self.fox_size // 2
+        self._update_ai_cloud()
+        winner = self._update_fox()
+        hit = self._check_for_fox_cloud_collision()
+        # A fox caught by a cloud is moved back in front of it: no one scored
+        self._check_for_winner(np.where(hit, 0, winner))
+        self.ticks += 1
+
+    def _update_fox(self) -> np.ndarray:
+        """
+        Fox.update: spin to the nearest pre-rendered frame, move, clamp the speed
+        and check the screen borders.
+
+        Returns:
+            np.ndarray: 1 or 2 where that player scored, 0 elsewhere
+        """
+        center_x = self.fox_x + self.fox_size // 2
+        center_y = self.fox_y + self.fox_size // 2
+        self.angle = (self.angle + c.FOX_SPIN_SPEED) % 360
+        steps = c.FOX_ROTATION_STEPS
+        frame = np.floor(self.angle * steps / 360 + 0.5) % steps
+        self.fox_size = _rotated_size(self.fox_image_size, frame * (360 / steps))
+        self.fox_x = center_x - self.fox_size // 2
+        self.fox_y = center_y - self.fox_size // 2
+
+        self.fox_x = _round(self.fox_x + self.velocity_x)
+        self.fox_y = _round(self.fox_y + self.velocity_y)
+
+        length = np.hypot(self.velocity_x, self.velocity_y)
+        scale = np.maximum(1.0, c.BASE_SPEED / length)
+        self.velocity_x *= scale
+        self.velocity_y *= scale
+
+        right = self.fox_x + self.fox_size
+        winner = np.where(right < 0, 2, np.where(self.fox_x > c.WIDTH, 1, 0)).astype(
+            np.int64
+        )
+
+        diameter = self.fox_size - c.FOX_HITBOX_DIFF
+        hitbox_top = self.fox_y + self.fox_size // 2 - diameter // 2
+        bounce = (winner == 0) & (
+            (hitbox_top <= -2) | (hitbox_top + diameter >= c.HEIGHT)
+        )
+        self.fox_y = np.where(
+            bounce,
+            np.where(self.fox_y <= 0, 0, c.HEIGHT - self.fox_size),
+            self.fox_y,
+        )
+        self.velocity_y = np.where(bounce, -self.velocity_y, self.velocity_y)
+        return winner
+
+    def _update_ai_cloud(self) -> None:
+        """AICloud._handle_ai_movement for the player 2 cloud."""
+        self.delay_counter += 1
+        react = self.delay_counter >= self._reaction_delay
+        self.delay_counter[react] = 0
+
+        fox_center_y = self.fox_y + self.fox_size // 2
+        distance = fox_center_y - (self.cloud2_y + self.cloud2_height // 2)
+        speed_factor = np.minimum(np.abs(distance) / 100, 1.0)
+        step = self.cloud2_speed * np.minimum(speed_factor * 0.8, 0.8)
+
+        hitbox_height = self.cloud2_height + c.CLOUD_HITBOX_HEIGHT_DIFF
+        hitbox_top = self.cloud2_y + self.cloud2_height // 2 - hitbox_height // 2
+        move = react & (np.abs(distance) > self._dead_zone)
+        down = move & (distance > 0) & (hitbox_top + hitbox_height < c.HEIGHT + 4)
+        up = move & (distance <= 0) & (hitbox_top > -4)
+        self.cloud2_y = np.where(down, _round(self.cloud2_y + step), self.cloud2_y)
+        self.cloud2_y = np.where(up, _round(self.cloud2_y - step), self.cloud2_y)
+
+    def _check_for_winner(self, winner: np.ndarray) -> None:
+        """
+        GameState._check_for_winner: score, raise the difficulty, serve again.
+
+        Args:
+            winner (np.ndarray): 1 or 2 where that player scored, 0 elsewhere
+        """
+        scored = winner > 0
+        if not scored.any():
+            return
+
+        self.player1_score += winner == 1
+        self.player2_score += winner == 2
+
+        total = self.player1_score + self.player2_score
+        new_speed = np.minimum(c.BASE_SPEED + total / 10, c.MAX_SPEED)
+        self.current_speed = np.where(scored, new_speed, self.current_speed)
+        self.cloud2_speed = np.where(
+            scored, self.current_speed * 0.6, self.cloud2_speed
+        )
+
+        count = int(scored.sum())
+        direction_x = self._rng.choice((-1.0, 1.0), count)
+        direction_y = self._rng.choice((1.0, -1.0), count)
+        serve_speed = np.minimum(c.BASE_SPEED * 1.5, self.current_speed[scored])
+        velocity_x = direction_x * (serve_speed / np.sqrt(2))
+        velocity_y = direction_y * (serve_speed / np.sqrt(2))
+
+        size = self.fox_size[scored]
+        self.velocity_x[scored] = velocity_x
+        self.velocity_y[scored] = velocity_y
+        self.fox_x[scored] = _round(c.WIDTH // 2 - size // 2 + velocity_x)
+        self.fox_y[scored] = _round(c.HEIGHT // 2 - size // 2 + velocity_y)
+        self.is_first_throw[scored] = False
+
+    def _check_for_fox_cloud_collision(self) -> np.ndarray:
+        """
+        GameState._check_for_fox_cloud_collision: player 1's cloud is tested
+        first, player 2's only where the fox missed player 1.
+
+        Returns:
+            np.ndarray: Where the fox hit a cloud
+        """
+        hit1 = self._handle_fox_collision(
+            c.CLOUD_PLAYER1_X,
+            self.cloud1_y,
+            self.cloud1_width,
+            self.cloud1_height,
+            player=1,
+        )
+        hit2 = self._handle_fox_collision(
+            c.CLOUD_PLAYER2_X,
+            self.cloud2_y,
+            self.cloud2_width,
+            self.cloud2_height,
+            player=2,
+            active=~hit1,
+        )
+        rescale = (hit1 | hit2) & ~self.is_first_throw
+        length = np.hypot(self.velocity_x, self.velocity_y)
+        scale = np.where(rescale, self.current_speed / length, 1.0)
+        self.velocity_x *= scale
+        self.velocity_y *= scale
+        self.is_first_throw |= hit1 | hit2
+        return hit1 | hit2
+
+    def _handle_fox_collision(
+        self,
+        cloud_x: int,
+        cloud_y: np.ndarray,
+        cloud_width: int,
+        cloud_height: int,
+        player: int,
+        active: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Cloud.handle_fox_collision for one side of every match
+
+        Args:
+            cloud_x (int): The left of the cloud rect
+            cloud_y (np.ndarray): The top of the cloud rect in each match
+            cloud_width (int): The width of the cloud rect
+            cloud_height (int): The height of the cloud rect
+            player (int): 1 or 2, which side the cloud is on
+            active (np.ndarray | None): Matches to test, defaults to all
+
+        Returns:
+            np.ndarray: Where the fox hit the cloud
+        """
+        box_width = cloud_width - c.CLOUD_HITBOX_WIDTH_DIFF
+        box_height = cloud_height + c.CLOUD_HITBOX_HEIGHT_DIFF
+        if player == 1:
+            box_left = cloud_x
+        else:
+            box_left = cloud_x + cloud_width - box_width
+        box_top = cloud_y + cloud_height // 2 - box_height // 2
+        box_center_x = box_left + box_width // 2
+        box_center_y = box_top + box_height // 2
+
+        diameter = self.fox_size - c.FOX_HITBOX_DIFF
+        fox_left = self.fox_x + self.fox_size // 2 - diameter // 2
+        fox_top = self.fox_y + self.fox_size // 2 - diameter // 2
+
+        delta_x = self.fox_x + self.fox_size // 2 - self.start_x
+        delta_y = self.fox_y + self.fox_size // 2 - self.start_y
+        start_left = fox_left - delta_x
+        start_top = fox_top - delta_y
+        started_inside = (
+            (start_left < box_left + box_width)
+            & (start_left + diameter > box_left)
+            & (start_top < box_top + box_height)
+            & (start_top + diameter > box_top)
+        )
+        hit = (
+            started_inside
+            & (fox_left < box_left + box_width)
+            & (fox_left + diameter > box_left)
+            & (fox_top < box_top + box_height)
+            & (fox_top + diameter > box_top)
+        )
+        if active is not None:
+            hit &= active
+
+        # Cloud._sweep_fox where the fox started clear of the cloud. Broad
+        # phase: only a fox whose path's bounds reach the cloud.
+        swept = (
+            ~started_inside
+            & (np.minimum(fox_left, start_left) <= box_left + box_width)
+            & (np.maximum(fox_left, start_left) + diameter >= box_left)
+            & (np.minimum(fox_top, start_top) <= box_top + box_height)
+            & (np.maximum(fox_top, start_top) + diameter >= box_top)
+        )
+        if active is not None:
+            swept &= active
+        axis_x = np.zeros(self.matches, dtype=bool)
+        index = np.flatnonzero(swept)
+        if index.size:
+            time, axis = _time_of_impact(
+                fox_left[index],
+                fox_top[index],
+                diameter[index],
+                delta_x[index],
+                delta_y[index],
+                box_left,
+                box_top[index],
+                box_width,
+                box_height,
+            )
+            found = ~np.isnan(time)
+            index, time = index[found], time[found]
+            swept[:] = False
+            swept[index] = True
+            axis_x[index] = axis[found]
+            size = self.fox_size[index]
+            self.fox_x[index] = (
+                _round(self.start_x[index] + delta_x[index] * time) - size // 2
+            )
+            self.fox_y[index] = (
+                _round(self.start_y[index] + delta_y[index] * time) - size // 2
+            )
+            fox_left = self.fox_x + self.fox_size // 2 - diameter // 2
+            fox_top = self.fox_y + self.fox_size // 2 - diameter // 2
+        if not (hit | swept).any():
+            return hit
+
+        fox_center_x = fox_left + diameter // 2
+        fox_center_y = fox_top + diameter // 2
+        overlap_x = np.minimum(
+            fox_left + diameter - box_left, box_left + box_width - fox_left
+        )
+        overlap_y = np.minimum(
+            fox_top + diameter - box_top, box_top + box_height - fox_top
+        )
+        side = (hit & (overlap_x < overlap_y)) | (swept & axis_x)
+        vertical = (hit | swept) & ~side
+
+        if player == 1:
+            valid = side & (fox_center_x > box_center_x)
+            velocity_x = np.abs(self.velocity_x)
+        else:
+            valid = side & (fox_center_x < box_center_x)
+            velocity_x = -np.abs(self.velocity_x)
+        bounce = (fox_center_y - box_center_y) / (box_height / 2) * c.BASE_SPEED
+        minimum = 0.3 * c.BASE_SPEED
+        bounce = np.where(
+            np.abs(bounce) < minimum, np.where(bounce >= 0, minimum, -minimum), bounce
+        )
+        self.velocity_x = np.where(valid, velocity_x, self.velocity_x)
+        self.velocity_y = np.where(valid, bounce, self.velocity_y)
+
+        gap = c.FOX_HITBOX_DIFF * 0.75
+        above = fox_center_y < box_center_y
+        new_y = np.where(
+            above,
+            _round(box_top - gap) - self.fox_size,
+            _round(box_top + box_height + gap),
+        )
+        self.fox_y = np.where(vertical, new_y, self.fox_y)
+        self.velocity_y = np.where(vertical, -self.velocity_y, self.velocity_y)
+        return hit | swept
@@ -1,6 +1,8 @@
 from src.core.fox import Fox
+from src.core.hitbox import HitboxCache
 from src.effects.particle_system import ParticleSystem
 from src.utils import constants as c
+from src.utils.assets import get_asset_cache
 from src.utils.helpers import get_random_position
 
 import pygame.sprite
@@ -11,15 +13,19 @@ class BonusStar(pygame.sprite.Sprite):
     Class to represent a bonus star in the game
     """
 
-    def __init__(self, sprite_group: pygame.sprite.Group, game_state) -> None:
+    def __init__(
+        self, sprite_group: pygame.sprite.Group, game_state, headless: bool = False
+    ) -> None:
         super().__init__()
         self.game_state = game_state
+        self._headless = headless
         self._active = False
         self.sprite_group = sprite_group
         self._collision_cooldown = 0
+        self._hitbox_cache = HitboxCache(self._build_hitbox)
         self.particle_system = ParticleSystem()
 
-        self.image = pygame.image.load("assets/images/star-bonus.png").convert_alpha()
+        self.image = get_asset_cache().image("assets/images/star-bonus.png")
         self.rect = self.image.get_rect()
 
     @property
@@ -33,16 +39,24 @@ class BonusStar(pygame.sprite.Sprite):
     @property
     def hitbox(self) -> pygame.Rect:
         """
-        Get the hitbox of the bonus star
+        Get the hitbox of the bonus star, rebuilt only when the rect changed
 
         Returns:
-            pygame.Rect: The hitbox of the bonus star
+            pygame.Rect: The hitbox of the bonus star. Do not change it.
         """
-        box = self.rect.copy()
-        box.width = self.rect.width - c.BONUS_HITBOX_DIFF
-        box.height = self.rect.height - c.BONUS_HITBOX_DIFF
-        box.center = self.rect.center
-        return box
+        return self._hitbox_cache.get(self.rect)
+
+    @staticmethod
+    def _build_hitbox(rect: pygame.Rect, box: pygame.Rect) -> None:
+        """
+        Fit the hitbox to the rect: a little smaller, centered on it
+
+        Args:
+            rect (pygame.Rect): The bonus star rect
+            box (pygame.Rect): The hitbox to update
+        """
+        box.size = (rect.width - c.BONUS_HITBOX_DIFF, rect.height - c.BONUS_HITBOX_DIFF)
+        box.center = rect.center
 
     def spawn(self) -> None:
         """
@@ -54,7 +68,7 @@ class BonusStar(pygame.sprite.Sprite):
         self._active = True
         self._set_pos()
         self.sprite_group.add(self)
-        pygame.time.set_timer(c.BONUS_DE_SPAWN_EVENT, c.BONUS_LIFETIME)
+        self._set_despawn_timer(c.BONUS_LIFETIME)
 
     def despawn(self) -> None:
         """
@@ -66,7 +80,20 @@ class BonusStar(pygame.sprite.Sprite):
         self._active = False
         self.sprite_group.remove(self)
         self._collision_cooldown = 0
-        pygame.time.set_timer(c.BONUS_DE_SPAWN_EVENT, 0)
+        self._set_despawn_timer(0)
+
+    def _set_despawn_timer(self, millis: int) -> None:
+        """
+        Arm (or with 0, cancel) the despawn event timer.
+        Headless runs have no event queue, so there is nothing to arm.
+
+        Args:
+            millis (int): The delay before the despawn event
+        """
+        if self._headless:
+            return
+
+        pygame.time.set_timer(c.BONUS_DE_SPAWN_EVENT, millis)
 
     def _set_pos(self) -> pygame.Rect:
         """
@@ -1,7 +1,10 @@
 import random
 
 from src.core.fox import Fox
+from src.core.hitbox import HitboxCache, time_of_impact
+from src.core.input import InputSnapshot
 from src.utils import constants as c
+from src.utils.assets import get_asset_cache
 
 import pygame.sprite
 
@@ -11,23 +14,26 @@ class Cloud(pygame.sprite.Sprite):
     Class to represent a cloud in the game
     """
 
-    def __init__(self, player: str, is_multiplayer: bool) -> None:
+    def __init__(
+        self, player: str, is_multiplayer: bool, headless: bool = False
+    ) -> None:
         super().__init__()
         self._player = player
         self._is_multiplayer = is_multiplayer
+        self._headless = headless
         self._speed = c.BASE_SPEED * 0.35
         self._collision_cooldown = 0
-        self.image: pygame.Surface = pygame.image.load(
-            "assets/images/cloud.png"
-        ).convert_alpha()
+        self._hitbox_cache = HitboxCache(self._build_hitbox)
+        assets = get_asset_cache()
+        self.image: pygame.Surface = assets.image("assets/images/cloud.png")
 
         if player == "player1":
-            self.image = pygame.transform.rotozoom(
-                self.image, c.CLOUD_PLAYER1_ROTATION, 1
+            self.image = assets.rotated(
+                "assets/images/cloud.png", c.CLOUD_PLAYER1_ROTATION
             )
         elif player == "player2":
-            self.image = pygame.transform.rotozoom(
-                self.image, c.CLOUD_PLAYER2_ROTATION, 1
+            self.image = assets.rotated(
+                "assets/images/cloud.png", c.CLOUD_PLAYER2_ROTATION
             )
 
         self.rect = self.image.get_rect()
@@ -47,6 +53,10 @@ class Cloud(pygame.sprite.Sprite):
     def is_multiplayer(self):
         return self._is_multiplayer
 
+    @property
+    def headless(self) -> bool:
+        return self._headless
+
     @property
     def speed(self) -> float:
         return self._speed
@@ -82,40 +92,57 @@ class Cloud(pygame.sprite.Sprite):
     @property
     def hitbox(self) -> pygame.Rect:
         """
-        Get the hitbox of the cloud
+        Get the hitbox of the cloud, rebuilt only when the rect changed
 
         Returns:
-            pygame.Rect: The hitbox of the cloud
+            pygame.Rect: The hitbox of the cloud. Do not change it.
+        """
+        return self._hitbox_cache.get(self.rect)
+
+    def _build_hitbox(self, rect: pygame.Rect, box: pygame.Rect) -> None:
+        """
+        Fit the hitbox to the rect: narrower and taller, on the player's edge
+
+        Args:
+            rect (pygame.Rect): The cloud rect
+            box (pygame.Rect): The hitbox to update
         """
-        box = self.rect.copy()
-        box.width = self.rect.width - c.CLOUD_HITBOX_WIDTH_DIFF
-        box.height = self.rect.height + c.CLOUD_HITBOX_HEIGHT_DIFF
-        box.center = self.rect.center
+        box.size = (
+            rect.width - c.CLOUD_HITBOX_WIDTH_DIFF,
+            rect.height + c.CLOUD_HITBOX_HEIGHT_DIFF,
+        )
+        box.center = rect.center
         if self.player == "player1":
-            box.left = self.rect.left
+            box.left = rect.left
         elif self.player == "player2":
-            box.right = self.rect.right
-        return box
+            box.right = rect.right
 
-    def update(self, fox: Fox) -> None:
+    def update(self, fox: Fox, inputs: InputSnapshot | None = None) -> None:
         """
-        Update the cloud by moving it and shaking if necessary
+        Update the cloud by moving it and shaking if necessary.
+        Headless clouds have no keyboard to read and are only moved by code.
+
+        Args:
+            fox (Fox): The fox
+            inputs (InputSnapshot | None): The keys held this tick.
+                Defaults to none.
         """
         self.update_shake()
-        keys = pygame.key.get_pressed()
+        if self.headless or inputs is None:
+            return
 
         # Player 1 (WASD)
         if self.player == "player1":
-            if keys[pygame.K_w]:
+            if inputs.is_pressed(pygame.K_w):
                 self.move("up")
-            if keys[pygame.K_s]:
+            if inputs.is_pressed(pygame.K_s):
                 self.move("down")
 
         # Player 2 (arrows)
         elif self.player == "player2" and self.is_multiplayer:
-            if keys[pygame.K_UP]:
+            if inputs.is_pressed(pygame.K_UP):
                 self.move("up")
-            if keys[pygame.K_DOWN]:
+            if inputs.is_pressed(pygame.K_DOWN):
                 self.move("down")
 
     def _set_position(self, player: str) -> None:
@@ -146,33 +173,92 @@ class Cloud(pygame.sprite.Sprite):
         elif direction == "down" and self.hitbox.bottom < c.HEIGHT + 4:
             self.rect.y += self.speed
 
-    def handle_fox_collision(self, fox: Fox) -> bool:
+    def handle_fox_collision(
+        self, fox: Fox, fox_start: tuple[float, float] | None = None
+    ) -> bool:
         """
-        Handle the collision between the cloud and the fox
+        Handle the collision between the cloud and the fox.
+        Given where the fox started the tick, a fox that started clear of the
+        cloud is swept along its move, so a fast fox that ran into or through
+        the cloud collides: it is moved back to where it first touched the
+        cloud. Only a fox that already overlapped the cloud at the start, e.g.
+        because the cloud moved onto it, is tested at its end position.
 
         Args:
             fox (Fox): The fox to check collision with
+            fox_start (tuple[float, float] | None): The center of the fox at
+                the start of the tick. Defaults to testing the end position only.
 
         Returns:
             bool: Whether a collision occurred
         """
-        if not fox.hitbox.colliderect(self.hitbox):
+        if fox_start is None or self._overlapped_at_start(fox, fox_start):
+            if not fox.hitbox.colliderect(self.hitbox):
+                return False
+            overlap_x, overlap_y = self._calculate_overlaps(fox)
+            side = overlap_x < overlap_y
+        elif axis := self._sweep_fox(fox, fox_start):
+            side = axis == "x"
+        else:
             return False
 
         self._init_collision_state()
-        overlap_x, overlap_y = self._calculate_overlaps(fox)
-
-        if overlap_x < overlap_y:
+        if side:
             self._handle_side_collision(fox)
         else:
             self._handle_vertical_collision(fox)
 
         return True
 
+    def _overlapped_at_start(self, fox: Fox, fox_start: tuple[float, float]) -> bool:
+        """
+        Check whether the fox hitbox overlapped the cloud at the start of the tick
+
+        Args:
+            fox (Fox): The fox, at its end position
+            fox_start (tuple[float, float]): The center of the fox at the start
+
+        Returns:
+            bool: Whether the fox started the tick overlapping the cloud
+        """
+        start_x, start_y = fox_start
+        start = fox.hitbox.move(
+            round(start_x - fox.rect.centerx), round(start_y - fox.rect.centery)
+        )
+        return start.colliderect(self.hitbox)
+
+    def _sweep_fox(self, fox: Fox, fox_start: tuple[float, float]) -> str | None:
+        """
+        Check whether the fox ran into the cloud between its start and end
+        position this tick, and move it back to the point of impact if so.
+
+        Args:
+            fox (Fox): The fox, at its end position
+            fox_start (tuple[float, float]): The center of the fox at the start
+
+        Returns:
+            str | None: The axis the fox hit the cloud on, "x" or "y", if it did
+        """
+        start_x, start_y = fox_start
+        delta_x = fox.rect.centerx - start_x
+        delta_y = fox.rect.centery - start_y
+        impact = time_of_impact(fox.hitbox, delta_x, delta_y, self.hitbox)
+        if impact is None:
+            return None
+
+        time, axis = impact
+        fox.rect.center = (start_x + delta_x * time, start_y + delta_y * time)
+        return axis
+
     def _init_collision_state(self) -> None:
         """
-        Initialize the state of the cloud when a collision occurs
+        Initialize the state of the cloud when a collision occurs.
+        Headless clouds do not shake: the shake is timed on the wall clock,
+        which does not run without pygame.
         """
+        if self.headless:
+            return
+
         self._is_shaking = True
         self._shake_start = pygame.time.get_ticks()
         self._original_pos = self.rect.copy()
@@ -309,6 +395,19 @@ class Cloud(pygame.sprite.Sprite):
         self.rect.centerx = self.original_pos.centerx + offset_x
         self.rect.centery = self.original_pos.centery + offset_y
 
+    def adapt_to_difficulty(self, game_speed: float, level: int) -> None:
+        """
+        Keep up with the game: the cloud moves faster as the fox does.
+
+        Args:
+            game_speed (float): The current fox speed
+            level (int): The game level
+        """
+        self.speed = game_speed * 0.35
+
+    def close(self) -> None:
+        """Release what the cloud holds: nothing, for a keyboard cloud."""
+
     def reset(self) -> None:
         """
         Reset the cloud to its initial state
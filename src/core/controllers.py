@@ -0,0 +1,393 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+import math
+import random
+import time
+from typing import Protocol
+
+from src.utils import constants as c
+from src.utils.profiling import LatencyStats
+
+
+@dataclass(frozen=True)
+class Observation:
+    """
+    What a controller sees of the game on one tick. Positions are in pixels.
+
+    Attributes:
+        player (str): The cloud the controller drives, "player1" or "player2"
+        cloud_y (float): The height of the cloud center
+        face_x (float): The x of the cloud edge the fox bounces off
+        fox_x (float): The x of the fox center
+        fox_y (float): The height of the fox center
+        fox_velocity (tuple[float, float]): The fox velocity, per tick
+        fox_width (float): The fox hitbox width
+        fox_height (float): The fox rect height: the walls stop the fox center
+            half of it away from the screen edge
+        level (int): The game level
+    """
+
+    player: str
+    cloud_y: float
+    face_x: float
+    fox_x: float
+    fox_y: float
+    fox_velocity: tuple[float, float]
+    fox_width: float
+    fox_height: float
+    level: int = 1
+
+
+class Controller(Protocol):
+    """
+    Decides how a cloud moves. observe() is called with the game state of the
+    tick, then decide() returns the move: -1 is full speed up, 1 full speed down
+    and 0 holds the cloud still.
+    """
+
+    def observe(self, observation: Observation) -> None: ...
+
+    def decide(self) -> float: ...
+
+
+class TrackerController:
+    """
+    Follows the fox's current height, every few ticks, slowing down as it
+    gets close. The original AI of the game.
+
+    Args:
+        dead_zone (int): How far the fox can be from the cloud center before
+            the cloud moves
+        reaction_delay (int): The cloud moves once every this many ticks
+    """
+
+    def __init__(self, dead_zone: int = 10, reaction_delay: int = 2) -> None:
+        self._dead_zone = dead_zone
+        self._reaction_delay = reaction_delay
+        self._delay_counter = 0
+        self._distance = 0.0
+
+    @property
+    def dead_zone(self) -> int:
+        return self._dead_zone
+
+    @property
+    def reaction_delay(self) -> int:
+        return self._reaction_delay
+
+    @property
+    def delay_counter(self) -> int:
+        return self._delay_counter
+
+    def observe(self, observation: Observation) -> None:
+        self._distance = observation.fox_y - observation.cloud_y
+
+    def decide(self) -> float:
+        self._delay_counter += 1
+        if self._delay_counter < self._reaction_delay:
+            return 0.0
+
+        self._delay_counter = 0
+        if abs(self._distance) <= self._dead_zone:
+            return 0.0
+        return math.copysign(min(abs(self._distance) / 100, 1.0), self._distance)
+
+
+def intercept_y(unfolded_y: float, radius: float) -> float:
+    """
+    Fold a straight line height back between the walls the fox bounces off
+
+    Args:
+        unfolded_y (float): The height the fox would reach without walls
+        radius (float): How close the fox center gets to a wall
+
+    Returns:
+        float: The height the fox center reaches after its wall bounces
+    """
+    span = c.HEIGHT - 2 * radius
+    if span <= 0:
+        return c.HEIGHT / 2
+    offset = (unfolded_y - radius) % (2 * span)
+    if offset > span:
+        offset = 2 * span - offset
+    return radius + offset
+
+
+class PredictiveController:
+    """
+    Aims where the fox will cross the cloud's side of the screen.
+    The crossing is solved once per bounce, when the fox velocity changes: the
+    flight is unfolded across the top and bottom walls, so the wall bounces on
+    the way need no simulation. Between bounces a tick only compares the fox
+    velocity with the one the target was solved for.
+
+    The aim is off by an error drawn each time the fox heads toward the cloud.
+    Its spread narrows with the level, which sets how good the AI is.
+
+    Args:
+        dead_zone (int): How far off the target the cloud center can be
+            before the cloud moves
+        seed (int | None): Seed of the aiming error. Defaults to one drawn
+            from the random module, so random.seed() makes a game repeatable.
+    """
+
+    def __init__(self, dead_zone: int = 10, seed: int | None = None) -> None:
+        self._dead_zone = dead_zone
+        self._rng = random.Random(random.random() if seed is None else seed)
+        self._target_y: float = c.CLOUD_Y
+        self._error = 0.0
+        self._solved_for = (0.0, 0.0)
+        self._level = 1
+        self._distance = 0.0
+
+    @property
+    def target_y(self) -> float:
+        return self._target_y
+
+    @property
+    def error_spread(self) -> float:
+        """The standard deviation of the aiming error at the current level"""
+        return max(
+            c.AI_PREDICTION_ERROR - c.AI_PREDICTION_ERROR_STEP * (self._level - 1),
+            c.AI_PREDICTION_ERROR_MIN,
+        )
+
+    def observe(self, observation: Observation) -> None:
+        self._level = observation.level
+        if observation.fox_velocity != self._solved_for:
+            self._solve_target(observation)
+        self._distance = self._target_y - observation.cloud_y
+
+    def decide(self) -> float:
+        if abs(self._distance) <= self._dead_zone:
+            return 0.0
+        return math.copysign(min(abs(self._distance) / 100, 1.0), self._distance)
+
+    def _solve_target(self, observation: Observation) -> None:
+        """
+        Solve the height at which the fox reaches the cloud.
+        A fox flying away sends the cloud back to the middle.
+
+        Args:
+            observation (Observation): The tick the fox velocity changed on
+        """
+        velocity_x, velocity_y = observation.fox_velocity
+        # The side the cloud defends: +1 on the right, -1 on the left
+        side = 1 if observation.player == "player2" else -1
+        heading_toward = (
+            velocity_x * side > 0
+            and (observation.face_x - observation.fox_x) * side > 0
+        )
+        if heading_toward and self._solved_for[0] * side <= 0:
+            self._error = self._rng.gauss(0, self.error_spread)
+        self._solved_for = observation.fox_velocity
+
+        if not heading_toward:
+            self._target_y = c.HEIGHT // 2
+            return
+
+        # The fox hitbox reaches the cloud's, but the walls stop the fox rect
+        contact_x = observation.face_x - side * observation.fox_width / 2
+        time_to_contact = (contact_x - observation.fox_x) / velocity_x
+        unfolded_y = observation.fox_y + velocity_y * time_to_contact
+        self._target_y = (
+            intercept_y(unfolded_y, observation.fox_height / 2) + self._error
+        )
+
+
+class RandomController:
+    """
+    Moves at random, changing its mind every few ticks. A baseline to measure
+    the other controllers against.
+
+    Args:
+        hold (int): How many ticks each random move lasts
+        seed (int | None): The random seed. Defaults to one drawn from the
+            random module, so random.seed() makes a game repeatable.
+    """
+
+    def __init__(self, hold: int = 20, seed: int | None = None) -> None:
+        self._hold = hold
+        self._rng = random.Random(random.random() if seed is None else seed)
+        self._ticks = 0
+        self._move = 0.0
+
+    def observe(self, observation: Observation) -> None:
+        pass
+
+    def decide(self) -> float:
+        if self._ticks % self._hold == 0:
+            self._move = self._rng.uniform(-1.0, 1.0)
+        self._ticks += 1
+        return self._move
+
+
+class ReplayController:
+    """
+    Plays back a fixed script of moves, one per tick, then holds still.
+    For tests and for replaying recorded games.
+
+    Args:
+        moves (Sequence[float]): The moves, in the order they are played
+        loop (bool): Start the script over once it ends instead of holding still
+    """
+
+    def __init__(self, moves: Sequence[float] = (), loop: bool = False) -> None:
+        self._moves = tuple(moves)
+        self._loop = loop
+        self._index = 0
+
+    def observe(self, observation: Observation) -> None:
+        pass
+
+    def decide(self) -> float:
+        if self._index >= len(self._moves):
+            if not self._loop or not self._moves:
+                return 0.0
+            self._index = 0
+        move = self._moves[self._index]
+        self._index += 1
+        return move
+
+
+def _remote_controller(**options) -> Controller:
+    """
+    Create a RemoteController, imported only when asked for: it pulls in
+    subprocess and socket, which the game does not need otherwise.
+
+    Args:
+        **options: Passed to RemoteController
+
+    Returns:
+        Controller: The remote controller
+    """
+    from src.core.remote_controller import RemoteController
+
+    return RemoteController(**options)
+
+
+CONTROLLERS: dict[str, Callable[..., Controller]] = {
+    "tracker": TrackerController,
+    "predictive": PredictiveController,
+    "random": RandomController,
+    "replay": ReplayController,
+    "remote": _remote_controller,
+}
+
+
+def register_controller(name: str, factory: Callable[..., Controller]) -> None:
+    """
+    Make a controller available by name, replacing any with the same name
+
+    Args:
+        name (str): The controller name
+        factory (Callable[..., Controller]): Creates the controller, from the
+            options given to create_controller
+    """
+    CONTROLLERS[name] = factory
+
+
+def create_controller(name: str, **options) -> Controller:
+    """
+    Create a registered controller
+
+    Args:
+        name (str): The controller name
+        **options: Passed to the controller factory
+
+    Returns:
+        Controller: The new controller
+
+    Raises:
+        ValueError: If no controller is registered under the name
+    """
+    try:
+        factory = CONTROLLERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown controller {name!r}, expected one of {', '.join(CONTROLLERS)}"
+        ) from None
+    return factory(**options)
+
+
+class ControllerHarness:
+    """
+    Runs a controller once per tick and times its decision. In-process code
+    cannot be interrupted, so a controller that runs over the budget still
+    finishes, but its late decision is thrown away and the previous one is
+    played again, and the overrun is counted. A controller too heavy for the
+    frame plays worse and shows up in the counts.
+
+    The controller's own state is not rolled back: a dropped decision has
+    still been observed and decided on, so e.g. the tracker's reaction delay
+    or the predictive AI's solved target move on as if it had been played.
+
+    Args:
+        controller (Controller): The controller to run
+        budget (float | None): The time a decision may take, in microseconds.
+            None lets it take as long as it needs.
+    """
+
+    def __init__(
+        self, controller: Controller, budget: float | None = c.AI_DECISION_BUDGET
+    ) -> None:
+        self._controller = controller
+        self._budget = budget
+        self._decision = 0.0
+        self._decisions = 0
+        self._overruns = 0
+        self._timings = LatencyStats()
+
+    @property
+    def controller(self) -> Controller:
+        return self._controller
+
+    @property
+    def budget(self) -> float | None:
+        return self._budget
+
+    @budget.setter
+    def budget(self, value: float | None) -> None:
+        self._budget = value
+
+    @property
+    def decision(self) -> float:
+        """The decision played on the last tick"""
+        return self._decision
+
+    @property
+    def decisions(self) -> int:
+        return self._decisions
+
+    @property
+    def overruns(self) -> int:
+        return self._overruns
+
+    @property
+    def timings(self) -> LatencyStats:
+        """Time each decision took, observing included, in seconds"""
+        return self._timings
+
+    def decide(self, observation: Observation) -> float:
+        """
+        Show the controller the tick and get its decision
+
+        Args:
+            observation (Observation): The game state of the tick
+
+        Returns:
+            float: The move to play, the previous one if the controller ran
+                over its budget
+        """
+        start = time.perf_counter()
+        self._controller.observe(observation)
+        decision = self._controller.decide()
+        elapsed = time.perf_counter() - start
+
+        self._timings.record(elapsed)
+        self._decisions += 1
+        if self._budget is not None and elapsed * 1e6 > self._budget:
+            self._overruns += 1
+        else:
+            self._decision = decision
+        return self._decision
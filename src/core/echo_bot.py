@@ -0,0 +1,115 @@
+import argparse
+from collections.abc import Sequence
+import os
+import socket
+import sys
+import time
+from typing import BinaryIO
+
+from src.core.controllers import Observation
+from src.core.remote_controller import (
+    OBSERVATION_FORMAT,
+    decode_observation,
+    encode_move,
+)
+
+
+def answer(observation: Observation) -> float:
+    """
+    Pick the move for a tick: head for the fox's height, slowing down close to it
+
+    Args:
+        observation (Observation): The tick
+
+    Returns:
+        float: The move
+    """
+    distance = observation.fox_y - observation.cloud_y
+    return max(-1.0, min(distance / 100, 1.0))
+
+
+def serve(reader: BinaryIO, writer: BinaryIO, delay: float = 0.0) -> None:
+    """
+    Answer every observation read until the game hangs up
+
+    Args:
+        reader (BinaryIO): Where the observations come from
+        writer (BinaryIO): Where the moves go
+        delay (float): How long each answer takes, in seconds, to stand in for
+            a slow bot
+    """
+    size = OBSERVATION_FORMAT.size
+    while True:
+        frame = reader.read(size)
+        if len(frame) < size:
+            return
+        tick, observation = decode_observation(frame)
+        if delay:
+            time.sleep(delay)
+        writer.write(encode_move(tick, answer(observation)))
+        writer.flush()
+
+
+def listen(path: str) -> socket.socket:
+    """
+    Open a Unix socket for the game to connect to
+
+    Args:
+        path (str): The socket path, replaced if it exists
+
+    Returns:
+        socket.socket: The listening socket
+    """
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    return server
+
+
+def serve_connection(server: socket.socket, delay: float = 0.0) -> None:
+    """
+    Wait for the game to connect, then answer it until it hangs up
+
+    Args:
+        server (socket.socket): The listening socket
+        delay (float): How long each answer takes, in seconds
+    """
+    connection, _ = server.accept()
+    with connection, connection.makefile("rb") as reader:
+        with connection.makefile("wb") as writer:
+            serve(reader, writer, delay)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """
+    Run the echo bot: a stand-in remote AI that answers every tick at once
+    with a move toward the fox, over stdin and stdout or a Unix socket.
+
+    Args:
+        argv (Sequence[str] | None): The command line options.
+            Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Sleepy Fox echo bot")
+    parser.add_argument(
+        "--socket", help="listen on this Unix socket instead of stdin and stdout"
+    )
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=0.0,
+        help="milliseconds to wait before each answer",
+    )
+    args = parser.parse_args(argv)
+    delay = args.delay / 1000
+
+    if args.socket is None:
+        serve(sys.stdin.buffer, sys.stdout.buffer, delay)
+        return
+    with listen(args.socket) as server:
+        serve_connection(server, delay)
+
+
+if __name__ == "__main__":
+    main()
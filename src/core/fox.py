@@ -1,5 +1,7 @@
+from src.core.hitbox import HitboxCache
 from src.core.sound_manager import SoundManager
 from src.utils import constants as c
+from src.utils.assets import get_asset_cache
 
 import pygame.sprite
 
@@ -9,6 +11,7 @@ class Fox(pygame.sprite.Sprite):
 
     def __init__(self, initial_speed: float) -> None:
         super().__init__()
+        self._hitbox_cache = HitboxCache(self._build_hitbox)
         self._load_image()
         self.velocity = pygame.math.Vector2(1, 0.5)
         self.velocity.scale_to_length(initial_speed)
@@ -17,24 +20,45 @@ class Fox(pygame.sprite.Sprite):
     @property
     def hitbox(self) -> pygame.Rect:
         """
-        Return the hitbox of the fox.
+        Return the hitbox of the fox, rebuilt only when the rect changed.
 
         Returns:
-            pygame.Rect: The hitbox of the fox.
+            pygame.Rect: The hitbox of the fox. Do not change it.
         """
-        diameter = self.rect.width - c.FOX_HITBOX_DIFF
-        box = pygame.Rect(0, 0, diameter, diameter)
-        box.center = self.rect.center
-        return box
+        return self._hitbox_cache.get(self.rect)
+
+    @staticmethod
+    def _build_hitbox(rect: pygame.Rect, box: pygame.Rect) -> None:
+        """
+        Fit the hitbox to the rect: a square centered on it.
+
+        Args:
+            rect (pygame.Rect): The fox rect
+            box (pygame.Rect): The hitbox to update
+        """
+        diameter = rect.width - c.FOX_HITBOX_DIFF
+        box.size = (diameter, diameter)
+        box.center = rect.center
 
     def _load_image(self) -> None:
         """Load the image of the fox."""
-        self.original_image = pygame.image.load("assets/images/fox.png").convert_alpha()
+        self.original_image = get_asset_cache().image("assets/images/fox.png")
+        self._build_rotation_frames()
         self.image = self.original_image
         self.rect = self.image.get_rect()
         self.rect.center = (c.WIDTH // 2, c.HEIGHT // 2)
         self.radius = (self.rect.width - c.FOX_HITBOX_DIFF) // 2
 
+    def _build_rotation_frames(self) -> None:
+        """
+        Pre-render fox.png at every rotation step, once per process: the
+        frames come from the asset cache, not from original_image.
+        Smooth rotation is too slow to run every frame.
+        """
+        self.rotation_frames = get_asset_cache().rotations(
+            "assets/images/fox.png", c.FOX_ROTATION_STEPS
+        )
+
     def update(self, sound_manager: SoundManager) -> str | None:
         """
         Update the fox: rotate the image, move the fox and check for collision.
@@ -57,9 +81,10 @@ class Fox(pygame.sprite.Sprite):
         self.rect.y += self.velocity.y
 
     def _rotate_image(self) -> None:
-        """Rotate the image of the fox."""
-        self.angle += 0.1
-        self.image = pygame.transform.rotozoom(self.original_image, self.angle, 1)
+        """Rotate the image of the fox to the nearest pre-rendered frame."""
+        self.angle = (self.angle + c.FOX_SPIN_SPEED) % 360
+        frame = int(self.angle * c.FOX_ROTATION_STEPS / 360 + 0.5)
+        self.image = self.rotation_frames[frame % c.FOX_ROTATION_STEPS]
         old_center = self.rect.center
         self.rect = self.image.get_rect()
         self.rect.center = old_center
@@ -77,12 +102,12 @@ class Fox(pygame.sprite.Sprite):
         """
         margin = 50
         if self.rect.right < margin:
-            sound_manager.play_sound("fox-fly-away")
+            sound_manager.queue_sound("fox-fly-away")
             if self.rect.right < 0:
                 return "player2"
 
         if self.rect.left > c.WIDTH - margin:
-            sound_manager.play_sound("fox-fly-away")
+            sound_manager.queue_sound("fox-fly-away")
             if self.rect.left > c.WIDTH:
                 return "player1"
 
@@ -1,30 +1,61 @@
 from src.core.game_state import GameState
+from src.core.startup import StartupTimer
 from src.event_handler import EventHandler
 from src.ui.renderer import Renderer
+from src.utils import constants as c
 
 import pygame
 
 
 def game_loop(
-    screen: pygame.Surface, game_state: GameState, clock: pygame.time.Clock
+    screen: pygame.Surface,
+    game_state: GameState,
+    clock: pygame.time.Clock,
+    dirty_rects: bool = False,
+    startup_timer: StartupTimer | None = None,
 ) -> None:
     """
-    Handles the game loop
+    Handles the game loop.
+    The simulation advances in fixed ticks of c.TICK_DURATION, however long
+    a frame takes, and every tick reads one snapshot of the held keys. Frames
+    render as fast as vsync allows, with sprites drawn between their last two
+    tick positions. The sounds the ticks queued are played once per frame,
+    when the music also catches up. Menus are capped lower: their screens are
+    only presented again when something on them changes. The game state is
+    closed when the loop ends.
 
     Args:
         screen (pygame.Surface): The screen to render
         game_state (GameState): The current game state
         clock (pygame.time.Clock): The game clock
+        dirty_rects (bool): Redraw only the changed areas of the playing screen
+        startup_timer (StartupTimer | None): Marks when the first game frame
+            is presented
     """
-    renderer = Renderer(screen)
+    renderer = Renderer(screen, dirty_rects)
     event_handler = EventHandler(game_state, renderer)
+    accumulator = 0.0
 
-    while True:
-        clock.tick(0)
-        game_state.update()
-        game_state.cloud_player1.update(game_state.fox)
-        game_state.cloud_player2.update(game_state.fox)
-        if not event_handler.handle_events():
-            break
+    try:
+        while True:
+            frame_rate_cap = (
+                c.FRAME_RATE_CAP
+                if game_state.current_state == c.GameStates.PLAYING
+                else c.MENU_FRAME_RATE_CAP
+            )
+            accumulator += min(clock.tick(frame_rate_cap), c.MAX_FRAME_TIME)
+            if not event_handler.handle_events():
+                break
 
-        renderer.render(game_state)
+            while accumulator >= c.TICK_DURATION:
+                game_state.update(event_handler.input_state.snapshot())
+                accumulator -= c.TICK_DURATION
+            game_state.sound_manager.play_queued()
+            game_state.sound_manager.update_music()
+
+            renderer.render(game_state, accumulator / c.TICK_DURATION)
+            if startup_timer is not None:
+                startup_timer.mark("interactive")
+                startup_timer = None
+    finally:
+        game_state.close()
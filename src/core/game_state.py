@@ -4,8 +4,11 @@ from random import choice
 from src.core.ai_cloud import AICloud
 from src.core.bonus_star import BonusStar
 from src.core.cloud import Cloud
+from src.core.controllers import Controller
 from src.core.fox import Fox
-from src.core.sound_manager import SoundManager
+from src.core.input import InputSnapshot
+from src.core.scheduler import TickScheduler
+from src.core.sound_manager import NullSoundManager, SoundManager
 from src.utils import constants as c
 from src.utils.constants import GameStates
 
@@ -15,9 +18,29 @@ import pygame
 class GameState:
     """
     Class to hold the game state
+
+    Args:
+        headless (bool): Run without display, keyboard, mixer or event timers.
+            Fox and cloud physics, scoring and difficulty are those of the
+            game, except for what the wall clock and event timers drive: no
+            bonus star spawns on its own, a star spawned by the caller stays
+            until the fox collects it or it is despawned, and the clouds do
+            not shake on a hit.
+        opponent (str | Controller): The controller playing player 2 in single
+            player, or the name of one registered in src.core.controllers
+        player1 (str | None): The controller playing player 1, None for the
+            keyboard
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        headless: bool = False,
+        opponent: str | Controller = c.AI_OPPONENT,
+        player1: str | None = None,
+    ) -> None:
+        self._headless = headless
+        self._opponent = opponent
+        self._player1 = player1
         self._current_state = GameStates.START
         self.is_first_throw = True
         self.base_speed = c.BASE_SPEED
@@ -30,33 +53,145 @@ class GameState:
 
         self.all_sprites = pygame.sprite.Group()
         self.fox = Fox(self.base_speed)
-        self.cloud_player1 = Cloud("player1", self.multiplayer)
-        self.cloud_player2 = (
-            Cloud("player2", self.multiplayer) if self.multiplayer else AICloud()
-        )
-        self.bonus_star = BonusStar(self.all_sprites, self)
+        self.cloud_player1 = self._create_cloud_player1()
+        self.cloud_player2 = self._create_cloud_player2()
+        self.bonus_star = BonusStar(self.all_sprites, self, headless)
         self.all_sprites.add(self.fox, self.cloud_player1, self.cloud_player2)
 
-        self.sound_manager = SoundManager()
+        self._previous_centers = {}
+        self._winner = None
+        self._scheduler = TickScheduler(
+            (
+                ("input", self._update_player_clouds),
+                ("ai", self._update_ai_cloud),
+                ("fox", self._update_fox),
+                ("collisions", self._update_collisions),
+                ("score", self._update_score),
+                ("bonus", self._update_bonus_star),
+                ("effects", self._update_effects),
+            )
+        )
+
+        self.sound_manager = NullSoundManager() if headless else SoundManager()
         self.sound_manager.start_music()
 
     @property
     def current_state(self):
         return self._current_state
 
-    def update(self):
+    @property
+    def headless(self) -> bool:
+        return self._headless
+
+    @property
+    def opponent(self) -> str | Controller:
+        return self._opponent
+
+    @property
+    def player1(self) -> str | None:
+        return self._player1
+
+    @property
+    def scheduler(self) -> TickScheduler:
+        return self._scheduler
+
+    def update(self, inputs: InputSnapshot | None = None):
+        """
+        Advance the simulation by one tick, through the scheduler phases.
+        Nothing moves outside of the playing state.
+
+        Args:
+            inputs (InputSnapshot | None): The keys held this tick
+        """
+        self._store_previous_centers()
         if self.current_state != c.GameStates.PLAYING:
             return
 
-        winner = self.fox.update(self.sound_manager)
-        self.cloud_player1.update(self.fox)
-        self.cloud_player2.update(self.fox)
-        self._check_for_winner(winner)
-        self._check_for_fox_cloud_collision()
+        self._scheduler.run(inputs)
+
+    def _update_player_clouds(self, inputs: InputSnapshot | None) -> None:
+        self.cloud_player1.update(self.fox, inputs)
+        if self.multiplayer:
+            self.cloud_player2.update(self.fox, inputs)
+
+    def _update_ai_cloud(self, inputs: InputSnapshot | None) -> None:
+        if not self.multiplayer:
+            self.cloud_player2.update(self.fox)
+
+    def _update_fox(self, inputs: InputSnapshot | None) -> None:
+        self._winner = self.fox.update(self.sound_manager)
+
+    def _update_collisions(self, inputs: InputSnapshot | None) -> None:
+        # A fox caught by a cloud is moved back in front of it: no one scored
+        if self._check_for_fox_cloud_collision():
+            self._winner = None
+
+    def _update_score(self, inputs: InputSnapshot | None) -> None:
+        self._check_for_winner(self._winner)
+        self._winner = None
+
+    def _update_bonus_star(self, inputs: InputSnapshot | None) -> None:
         self._check_for_bonus_star_fox_collision()
 
+    def _update_effects(self, inputs: InputSnapshot | None) -> None:
+        self.bonus_star.particle_system.update()
+
     def set_state(self, state: GameStates):
+        """
+        Switch to another screen, crossfading to its music
+
+        Args:
+            state (GameStates): The screen to switch to
+        """
         self._current_state = state
+        if state in (GameStates.PLAYING, GameStates.PAUSED):
+            self.sound_manager.play_music("gameplay")
+        else:
+            self.sound_manager.play_music("menu")
+
+    def interpolated_center(
+        self, sprite: pygame.sprite.Sprite, alpha: float
+    ) -> tuple[float, float]:
+        """
+        Get the center of a sprite between its previous and current tick
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite to place
+            alpha (float): How far into the next tick the frame is, 0 to 1
+
+        Returns:
+            tuple[float, float]: The center to draw the sprite at
+        """
+        current_x, current_y = sprite.rect.center
+        previous_x, previous_y = self._previous_centers.get(sprite, sprite.rect.center)
+        return (
+            previous_x + (current_x - previous_x) * alpha,
+            previous_y + (current_y - previous_y) * alpha,
+        )
+
+    def teleport(self, sprite: pygame.sprite.Sprite) -> None:
+        """
+        Treat the last move of a sprite as a jump, not a movement: frames drawn
+        before the next tick show it where it is, not on its way there.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite that jumped
+        """
+        self._previous_centers[sprite] = sprite.rect.center
+
+    def spawn_bonus_star(self) -> None:
+        """Spawn the bonus star where it appears, without flying in."""
+        self.bonus_star.spawn()
+        self.teleport(self.bonus_star)
+
+    def _store_previous_centers(self):
+        for sprite in (
+            self.fox,
+            self.cloud_player1,
+            self.cloud_player2,
+            self.bonus_star,
+        ):
+            self._previous_centers[sprite] = sprite.rect.center
 
     def _check_for_winner(self, winner):
         if winner is not None:
@@ -74,34 +209,34 @@ class GameState:
         if players_score > 0:
             new_speed = self.base_speed + (players_score / 10)
             self.current_speed = min(new_speed, c.MAX_SPEED)
-            self.cloud_player1.speed = self.current_speed * 0.35
-            if isinstance(self.cloud_player2, AICloud):
-                self.cloud_player2.speed = self.current_speed * 0.6
-            else:
-                self.cloud_player2.speed = self.current_speed * 0.35
         else:
             self.current_speed = self.base_speed
 
-        return floor(self.current_speed) - 5  # base speed is 6 while level starts at 1
+        level = floor(self.current_speed) - 5  # base speed is 6 while level starts at 1
+        if players_score > 0:
+            self.cloud_player1.adapt_to_difficulty(self.current_speed, level)
+            self.cloud_player2.adapt_to_difficulty(self.current_speed, level)
+        return level
 
-    def _check_for_fox_cloud_collision(self):
-        if self.cloud_player1.handle_fox_collision(self.fox):
+    def _check_for_fox_cloud_collision(self) -> bool:
+        fox_start = self._previous_centers.get(self.fox)
+        if self.cloud_player1.handle_fox_collision(self.fox, fox_start):
             self._last_player = self.player1_score
-            self.sound_manager.play_sound("fox-bounce")
-            if not self.is_first_throw:
-                self.fox.velocity.scale_to_length(self.current_speed)
-                self.is_first_throw = True
-        elif self.cloud_player2.handle_fox_collision(self.fox):
+        elif self.cloud_player2.handle_fox_collision(self.fox, fox_start):
             self._last_player = self.player2_score
-            self.sound_manager.play_sound("fox-bounce")
-            if not self.is_first_throw:
-                self.fox.velocity.scale_to_length(self.current_speed)
-                self.is_first_throw = True
+        else:
+            return False
+
+        self.sound_manager.queue_sound("fox-bounce")
+        if not self.is_first_throw:
+            self.fox.velocity.scale_to_length(self.current_speed)
+            self.is_first_throw = True
+        return True
 
     def _check_for_bonus_star_fox_collision(self):
         bonus_points = self.bonus_star.handle_fox_collision(self.fox)
         if bonus_points > 0:
-            self.sound_manager.play_sound("bonus-collect")
+            self.sound_manager.queue_sound("bonus-collect")
             if self._last_player == self.player1_score:
                 self.player1_score += bonus_points
             else:
@@ -116,6 +251,7 @@ class GameState:
         self.is_first_throw = False
         self.fox.rect.x += self.fox.velocity.x
         self.fox.rect.y += self.fox.velocity.y
+        self.teleport(self.fox)
 
     def _play_again(self):
         self._reset_fox_position()
@@ -125,11 +261,37 @@ class GameState:
         self.multiplayer = not self.multiplayer
         if hasattr(self, "cloud_player2"):
             self.all_sprites.remove(self.cloud_player2)
-            self.cloud_player2 = (
-                Cloud("player2", self.multiplayer) if self.multiplayer else AICloud()
-            )
+            self.cloud_player2.close()
+            self.cloud_player2 = self._create_cloud_player2()
             self.all_sprites.add(self.cloud_player2)
 
+    def close(self) -> None:
+        """Release what the clouds hold, e.g. remote AI processes."""
+        self.cloud_player1.close()
+        self.cloud_player2.close()
+
+    def _create_cloud_player1(self) -> Cloud:
+        """
+        Create the player 1 cloud
+
+        Returns:
+            Cloud: A keyboard controlled cloud, or the AI when player1 is set
+        """
+        if self.player1 is None:
+            return Cloud("player1", self.multiplayer, self.headless)
+        return AICloud(self.headless, self.player1, player="player1")
+
+    def _create_cloud_player2(self) -> Cloud:
+        """
+        Create the player 2 cloud for the current mode
+
+        Returns:
+            Cloud: A player controlled cloud in multiplayer, the AI otherwise
+        """
+        if self.multiplayer:
+            return Cloud("player2", self.multiplayer, self.headless)
+        return AICloud(self.headless, self.opponent)
+
     def reset(self):
         self.player1_score = 0
         self.player2_score = 0
@@ -0,0 +1,122 @@
+from collections.abc import Callable
+import math
+
+import pygame
+
+
+class HitboxCache:
+    """
+    The hitbox of a sprite, kept between reads and rebuilt only when the sprite
+    rect moved or changed size (e.g. with a new rotation frame) since the last
+    build. Sprites move their rect in place or replace it from many places,
+    so the rect is compared on every read instead of flagged on every write.
+    The hitbox and the copy of the rect it was built from are updated in
+    place: after the first build, reading a hitbox allocates nothing.
+
+    Args:
+        build (Callable[[pygame.Rect, pygame.Rect], None]): Sets the hitbox,
+            the second argument, in place from the sprite rect, the first
+    """
+
+    def __init__(self, build: Callable[[pygame.Rect, pygame.Rect], None]) -> None:
+        self._build = build
+        self._hitbox = pygame.Rect(0, 0, 0, 0)
+        self._source: pygame.Rect | None = None
+        self._valid = False
+        self._builds = 0
+
+    @property
+    def builds(self) -> int:
+        return self._builds
+
+    def get(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Get the hitbox for the sprite rect, building it if the rect changed
+
+        Args:
+            rect (pygame.Rect): The sprite rect
+
+        Returns:
+            pygame.Rect: The hitbox. It is shared between reads: do not change it.
+        """
+        if not self._valid or rect != self._source:
+            self._build(rect, self._hitbox)
+            if self._source is None:
+                self._source = rect.copy()
+            else:
+                self._source.update(rect)
+            self._valid = True
+            self._builds += 1
+        return self._hitbox
+
+    def invalidate(self) -> None:
+        """Build the hitbox again on the next read."""
+        self._valid = False
+
+
+def _axis_times(
+    start: float, size: int, delta: float, target_start: int, target_size: int
+) -> tuple[float, float] | None:
+    """
+    When a moving span starts and stops overlapping a fixed one, along one axis
+
+    Args:
+        start (float): Where the moving span starts
+        size (int): The length of the moving span
+        delta (float): How far the span moves
+        target_start (int): Where the fixed span starts
+        target_size (int): The length of the fixed span
+
+    Returns:
+        tuple[float, float] | None: The entry and exit times, in fractions of
+            the move, or None if the spans never overlap
+    """
+    if delta > 0:
+        return (
+            (target_start - (start + size)) / delta,
+            (target_start + target_size - start) / delta,
+        )
+    if delta < 0:
+        return (
+            (target_start + target_size - start) / delta,
+            (target_start - (start + size)) / delta,
+        )
+    if start < target_start + target_size and start + size > target_start:
+        return -math.inf, math.inf
+    return None
+
+
+def time_of_impact(
+    box: pygame.Rect, delta_x: float, delta_y: float, target: pygame.Rect
+) -> tuple[float, str] | None:
+    """
+    Swept AABB test: find when a box that just moved first touched a fixed box.
+    Catches a box that passed through the target within the move, which a
+    test of the end position misses once the move is longer than both boxes.
+
+    Args:
+        box (pygame.Rect): The moving box, at the end of the move
+        delta_x (float): How far the box moved along x
+        delta_y (float): How far the box moved along y
+        target (pygame.Rect): The fixed box
+
+    Returns:
+        tuple[float, str] | None: The time of impact, 0 at the start of the
+            move and 1 at the end, and the axis the boxes met on, "x" or "y".
+            None if the box did not run into the target during the move.
+    """
+    times_x = _axis_times(
+        box.left - delta_x, box.width, delta_x, target.left, target.width
+    )
+    if times_x is None:
+        return None
+    times_y = _axis_times(
+        box.top - delta_y, box.height, delta_y, target.top, target.height
+    )
+    if times_y is None:
+        return None
+
+    entry = max(times_x[0], times_y[0])
+    if entry >= min(times_x[1], times_y[1]) or entry < 0 or entry > 1:
+        return None
+    return entry, "x" if times_x[0] > times_y[0] else "y"
@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+import time
+
+from src.utils import constants as c
+from src.utils.profiling import LatencyStats
+
+import pygame
+
+# The only events the game reads. Everything else, MOUSEMOTION floods
+# included, is dropped by SDL before it reaches the queue.
+ALLOWED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWFOCUSLOST,
+    c.BONUS_SPAWN_EVENT,
+    c.BONUS_DE_SPAWN_EVENT,
+)
+
+
+def filter_events() -> None:
+    """
+    Block every event type but ALLOWED_EVENTS. Needs pygame to be initialized.
+    """
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(ALLOWED_EVENTS)
+
+
+@dataclass(frozen=True)
+class InputSnapshot:
+    """
+    The keys held during one simulation tick.
+
+    Attributes:
+        tick (int): The tick the snapshot was taken for
+        pressed (frozenset[int]): The keys held, as pygame key codes
+        changed_at (float | None): When the oldest key press or release in the
+            snapshot was read, from time.perf_counter. None if no key changed
+            since the previous snapshot.
+    """
+
+    tick: int = 0
+    pressed: frozenset[int] = frozenset()
+    changed_at: float | None = None
+
+    def is_pressed(self, key: int) -> bool:
+        """
+        Check whether a key is held
+
+        Args:
+            key (int): The pygame key code
+
+        Returns:
+            bool: True if the key is held
+        """
+        return key in self.pressed
+
+
+class InputState:
+    """
+    The keyboard state, kept up to date from key events instead of polled.
+    Every simulation tick takes one snapshot of it, so all clouds of a tick
+    see the same keys. The time from reading a key event to the snapshot that
+    carries it to the simulation is added to latency.
+    """
+
+    def __init__(self) -> None:
+        self._pressed: set[int] = set()
+        self._tick = 0
+        self._changed_at: float | None = None
+        self._latency = LatencyStats()
+
+    @property
+    def tick(self) -> int:
+        return self._tick
+
+    @property
+    def latency(self) -> LatencyStats:
+        return self._latency
+
+    def handle_event(self, event: pygame.event.Event, now: float | None = None) -> None:
+        """
+        Update the held keys from an event. Other events are ignored.
+        Losing the window focus releases every key: their key ups go elsewhere.
+
+        Args:
+            event (pygame.event.Event): The event
+            now (float | None): When the event was read, from
+                time.perf_counter. Defaults to now.
+        """
+        if event.type == pygame.KEYDOWN:
+            self._pressed.add(event.key)
+        elif event.type == pygame.KEYUP:
+            self._pressed.discard(event.key)
+        elif event.type == pygame.WINDOWFOCUSLOST and self._pressed:
+            self._pressed.clear()
+        else:
+            return
+
+        if self._changed_at is None:
+            self._changed_at = time.perf_counter() if now is None else now
+
+    def snapshot(self, now: float | None = None) -> InputSnapshot:
+        """
+        Take the snapshot of the next simulation tick
+
+        Args:
+            now (float | None): When the tick runs, from time.perf_counter.
+                Defaults to now.
+
+        Returns:
+            InputSnapshot: The keys held
+        """
+        changed_at = self._changed_at
+        if changed_at is not None:
+            now = time.perf_counter() if now is None else now
+            self._latency.record(now - changed_at)
+            self._changed_at = None
+
+        self._tick += 1
+        return InputSnapshot(self._tick, frozenset(self._pressed), changed_at)
@@ -0,0 +1,190 @@
+import logging
+import threading
+import time
+
+from src.utils import constants as c
+from src.utils.assets import get_asset_cache
+
+import pygame.mixer
+
+logger = logging.getLogger(__name__)
+
+
+class MusicPlayer:
+    """
+    Background music, decoded ahead of time and looped on reserved channels.
+    prefetch() decodes every track on a worker thread, so opening an MP3 never
+    stalls a frame. A decoded track loops sample-exact, without the gap
+    pygame.mixer.music leaves at the loop point, and switching tracks fades the
+    old one out on one channel while the new one fades in on the other.
+
+    A track asked for before its decode finished is an underrun: it starts on
+    the first update() after the decode. A track that stops on its own is a
+    dropout and is restarted by the next update().
+
+    Args:
+        tracks (dict[str, str]): Track names mapped to their files
+        channels (tuple[int, int]): The two reserved channels to crossfade on
+        crossfade (int): How long a crossfade takes, in milliseconds
+    """
+
+    def __init__(
+        self,
+        tracks: dict[str, str] = c.MUSIC_TRACKS,
+        channels: tuple[int, int] = c.MUSIC_CHANNELS,
+        crossfade: int = c.MUSIC_CROSSFADE,
+    ) -> None:
+        self._tracks = dict(tracks)
+        self._channels = [pygame.mixer.Channel(channel) for channel in channels]
+        self._crossfade = crossfade
+        # Filled by the worker thread, by path; None for a file that failed
+        self._buffers: dict[str, pygame.mixer.Sound | None] = {}
+        self._worker: threading.Thread | None = None
+        self._current: str | None = None
+        self._playing: str | None = None  # the path on the active channel
+        self._active = 0
+        self._requested_at: float | None = None
+        self._underruns = 0
+        self._underrun_wait = 0.0
+        self._dropouts = 0
+
+    @property
+    def tracks(self) -> tuple:
+        return tuple(self._tracks)
+
+    @property
+    def current(self) -> str | None:
+        return self._current
+
+    @property
+    def underruns(self) -> int:
+        return self._underruns
+
+    @property
+    def underrun_wait(self) -> float:
+        """Seconds tracks spent waiting for their decode, in total"""
+        return self._underrun_wait
+
+    @property
+    def dropouts(self) -> int:
+        return self._dropouts
+
+    def is_ready(self, track: str) -> bool:
+        """
+        Check whether a track is decoded
+
+        Args:
+            track (str): The track name
+
+        Returns:
+            bool: True once the decode finished, also if it failed
+        """
+        return self._tracks[track] in self._buffers
+
+    def prefetch(self) -> None:
+        """
+        Start decoding every track on a worker thread, once.
+        """
+        if self._worker is not None:
+            return
+        self._worker = threading.Thread(
+            target=self._decode_tracks, name="music-prefetch", daemon=True
+        )
+        self._worker.start()
+
+    def wait(self, timeout: float | None = None) -> None:
+        """
+        Wait for the prefetch to finish
+
+        Args:
+            timeout (float | None): How long to wait, in seconds.
+                Defaults to no limit.
+        """
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+    def play(self, track: str) -> None:
+        """
+        Crossfade to a track and loop it.
+        A track that shares its file with the one playing keeps playing.
+
+        Args:
+            track (str): The track name
+        """
+        if track == self._current:
+            return
+        self._current = track
+        if self.is_ready(track):
+            self._start(fade=True)
+        else:
+            self._underruns += 1
+            self._requested_at = time.perf_counter()
+            self.prefetch()
+
+    def stop(self) -> None:
+        """Stop the music."""
+        self._current = None
+        self._playing = None
+        self._requested_at = None
+        for channel in self._channels:
+            channel.stop()
+
+    def set_volume(self, volume: float) -> None:
+        """
+        Set the music volume
+
+        Args:
+            volume (float): The volume, 0 to 1
+        """
+        for channel in self._channels:
+            channel.set_volume(volume)
+
+    def update(self) -> None:
+        """
+        Start a track whose decode just finished, and restart one that stopped.
+        Called once per frame.
+        """
+        if self._current is None:
+            return
+        if self._requested_at is not None:
+            if self.is_ready(self._current):
+                self._underrun_wait += time.perf_counter() - self._requested_at
+                self._requested_at = None
+                self._start(fade=True)
+        elif self._playing is not None and not self._channels[self._active].get_busy():
+            self._dropouts += 1
+            self._playing = None
+            self._start(fade=False)
+
+    def _start(self, fade: bool) -> None:
+        """
+        Start the current track on the idle channel, fading out the active one
+
+        Args:
+            fade (bool): Whether to crossfade or cut straight to the track
+        """
+        path = self._tracks[self._current]
+        sound = self._buffers[path]
+        if path == self._playing or sound is None:
+            return
+
+        fade_ms = self._crossfade if fade else 0
+        outgoing = self._channels[self._active]
+        if outgoing.get_busy():
+            if fade_ms:
+                outgoing.fadeout(fade_ms)
+            else:
+                outgoing.stop()
+        self._active = 1 - self._active
+        self._channels[self._active].play(sound, loops=-1, fade_ms=fade_ms)
+        self._playing = path
+
+    def _decode_tracks(self) -> None:
+        """Decode every track file. Runs on the worker thread."""
+        assets = get_asset_cache()
+        for path in dict.fromkeys(self._tracks.values()):
+            try:
+                self._buffers[path] = assets.sound(path)
+            except (pygame.error, FileNotFoundError) as error:
+                logger.warning("Could not load music %s: %s", path, error)
+                self._buffers[path] = None
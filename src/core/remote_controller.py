@@ -0,0 +1,280 @@
+from collections.abc import Sequence
+import os
+import select
+import socket
+import struct
+import subprocess
+import sys
+import time
+
+from src.core.controllers import Observation
+from src.utils import constants as c
+
+# The game and a remote bot talk in fixed size little-endian frames.
+# Observation, game to bot, 39 bytes: tick uint32, player uint8 (1 or 2),
+# level uint16, then cloud_y, face_x, fox_x, fox_y, fox_velocity_x,
+# fox_velocity_y, fox_width and fox_height as float32, as in Observation.
+# Move, bot to game, 8 bytes: the tick answered uint32, the move float32.
+# The bot answers every observation, in order.
+OBSERVATION_FORMAT = struct.Struct("<IBH8f")
+MOVE_FORMAT = struct.Struct("<If")
+
+# A frozen build's sys.executable is the game itself, not a Python to run the
+# echo bot with: there the bot command must be given
+ECHO_BOT_COMMAND = (
+    None
+    if getattr(sys, "frozen", False)
+    else (sys.executable, "-m", "src.core.echo_bot")
+)
+
+# Frames kept for a bot that stopped reading; newer ones are dropped
+_MAX_PENDING = 64 * OBSERVATION_FORMAT.size
+
+
+def encode_observation(tick: int, observation: Observation) -> bytes:
+    """
+    Pack an observation into a frame
+
+    Args:
+        tick (int): The tick of the observation
+        observation (Observation): The observation
+
+    Returns:
+        bytes: The frame
+    """
+    return OBSERVATION_FORMAT.pack(
+        tick,
+        1 if observation.player == "player1" else 2,
+        observation.level,
+        observation.cloud_y,
+        observation.face_x,
+        observation.fox_x,
+        observation.fox_y,
+        *observation.fox_velocity,
+        observation.fox_width,
+        observation.fox_height,
+    )
+
+
+def decode_observation(frame: bytes) -> tuple[int, Observation]:
+    """
+    Unpack an observation frame
+
+    Args:
+        frame (bytes): The frame
+
+    Returns:
+        tuple[int, Observation]: The tick and the observation
+    """
+    (
+        tick,
+        player,
+        level,
+        cloud_y,
+        face_x,
+        fox_x,
+        fox_y,
+        velocity_x,
+        velocity_y,
+        fox_width,
+        fox_height,
+    ) = OBSERVATION_FORMAT.unpack(frame)
+    return tick, Observation(
+        player=f"player{player}",
+        cloud_y=cloud_y,
+        face_x=face_x,
+        fox_x=fox_x,
+        fox_y=fox_y,
+        fox_velocity=(velocity_x, velocity_y),
+        fox_width=fox_width,
+        fox_height=fox_height,
+        level=level,
+    )
+
+
+def encode_move(tick: int, move: float) -> bytes:
+    """
+    Pack a move into a frame
+
+    Args:
+        tick (int): The tick of the observation answered
+        move (float): The move
+
+    Returns:
+        bytes: The frame
+    """
+    return MOVE_FORMAT.pack(tick, move)
+
+
+def decode_move(frame: bytes) -> tuple[int, float]:
+    """
+    Unpack a move frame
+
+    Args:
+        frame (bytes): The frame
+
+    Returns:
+        tuple[int, float]: The tick answered and the move
+    """
+    return MOVE_FORMAT.unpack(frame)
+
+
+class RemoteController:
+    """
+    A controller whose decisions come from another process, over a pipe (the
+    bot's stdin and stdout) or a Unix socket, so heavy inference neither holds
+    the game's GIL nor stalls a frame. Unix only: the bot is waited on with
+    select.
+
+    observe() sends the tick to the bot without blocking; decide() waits for
+    the answer for at most the given time. An answer that misses it is late:
+    the last move the bot sent is played again and the late tick is counted.
+    Late answers are not lost, they become the move played until the next
+    answer. A bot that exits leaves the cloud on its last move.
+
+    Args:
+        command (Sequence[str] | None): The bot to start, talking over its
+            stdin and stdout. Defaults to the echo bot, except in a frozen build.
+        socket_path (str | None): Connect to a bot listening on this Unix
+            socket instead of starting one
+        wait (float): How long decide() waits for an answer, in microseconds
+
+    Raises:
+        ValueError: If neither a command nor a socket is given in a frozen
+            build, which cannot run the echo bot
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str] | None = None,
+        socket_path: str | None = None,
+        wait: float = c.AI_REMOTE_WAIT,
+    ) -> None:
+        self._process: subprocess.Popen | None = None
+        self._socket: socket.socket | None = None
+        if socket_path is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.connect(socket_path)
+            self._read_fd = self._write_fd = self._socket.fileno()
+        else:
+            command = command or ECHO_BOT_COMMAND
+            if command is None:
+                raise ValueError(
+                    "A frozen build cannot run the echo bot, give a bot command"
+                )
+            self._process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                bufsize=0,
+            )
+            self._read_fd = self._process.stdout.fileno()
+            self._write_fd = self._process.stdin.fileno()
+        os.set_blocking(self._write_fd, False)
+
+        self._wait = wait / 1e6
+        self._tick = 0
+        self._answered = 0  # the newest tick answered
+        self._move = 0.0
+        self._incoming = bytearray()
+        self._outgoing = bytearray()
+        self._connected = True
+        self._late = 0
+        self._dropped = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def move(self) -> float:
+        """The last move the bot sent"""
+        return self._move
+
+    @property
+    def late(self) -> int:
+        """Ticks whose answer did not come in time"""
+        return self._late
+
+    @property
+    def dropped(self) -> int:
+        """Observations not sent because the bot stopped reading"""
+        return self._dropped
+
+    def observe(self, observation: Observation) -> None:
+        self._tick += 1
+        if not self._connected:
+            return
+        if len(self._outgoing) >= _MAX_PENDING:
+            self._dropped += 1
+        else:
+            self._outgoing += encode_observation(self._tick, observation)
+        self._flush()
+
+    def decide(self) -> float:
+        deadline = time.perf_counter() + self._wait
+        while self._connected and self._answered < self._tick:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0 or not self._receive(timeout):
+                break
+        if self._answered < self._tick:
+            self._late += 1
+        return self._move
+
+    def close(self) -> None:
+        """Disconnect from the bot, and stop it if this controller started it."""
+        self._connected = False
+        if self._socket is not None:
+            self._socket.close()
+        if self._process is not None:
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process.stdout.close()
+
+    def _flush(self) -> None:
+        """Send as much of the pending observations as the bot takes."""
+        try:
+            sent = os.write(self._write_fd, self._outgoing)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._connected = False
+            return
+        del self._outgoing[:sent]
+
+    def _receive(self, timeout: float) -> bool:
+        """
+        Read the answers that arrive within a timeout
+
+        Args:
+            timeout (float): How long to wait for data, in seconds
+
+        Returns:
+            bool: True if data arrived, False on a timeout or a closed bot
+        """
+        readable, _, _ = select.select([self._read_fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            data = os.read(self._read_fd, 4096)
+        except OSError:
+            data = b""
+        if not data:
+            self._connected = False
+            return False
+
+        self._incoming += data
+        size = MOVE_FORMAT.size
+        frames = len(self._incoming) // size
+        for index in range(frames):
+            tick, move = MOVE_FORMAT.unpack_from(self._incoming, index * size)
+            self._answered = max(self._answered, tick)
+            self._move = move
+        del self._incoming[: frames * size]
+        if self._outgoing:
+            self._flush()
+        return True
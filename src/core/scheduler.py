@@ -0,0 +1,57 @@
+from collections.abc import Callable, Sequence
+import time
+
+from src.core.input import InputSnapshot
+from src.utils.profiling import LatencyStats
+
+Phase = Callable[[InputSnapshot | None], None]
+
+
+class TickScheduler:
+    """
+    Runs the phases of a simulation tick, always in the same order, and times
+    each of them. A phase is called once per run() with the input snapshot of
+    the tick; what it updates, it updates exactly once per tick.
+
+    Args:
+        phases (Sequence[tuple[str, Phase]]): The phases in the order they run,
+            each a name and a callable taking the input snapshot
+    """
+
+    def __init__(self, phases: Sequence[tuple[str, Phase]]) -> None:
+        self._phases = tuple(phases)
+        self._timings = {name: LatencyStats() for name, _ in self._phases}
+        self._ticks = 0
+
+    @property
+    def phases(self) -> tuple[str, ...]:
+        return tuple(name for name, _ in self._phases)
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def timings(self) -> dict[str, LatencyStats]:
+        """Time spent in each phase per tick, in seconds, in run order"""
+        return dict(self._timings)
+
+    def run(self, inputs: InputSnapshot | None = None) -> None:
+        """
+        Run one tick
+
+        Args:
+            inputs (InputSnapshot | None): The keys held this tick
+        """
+        start = time.perf_counter()
+        for name, phase in self._phases:
+            phase(inputs)
+            end = time.perf_counter()
+            self._timings[name].record(end - start)
+            start = end
+        self._ticks += 1
+
+    def reset_timings(self) -> None:
+        """Forget the timings recorded so far."""
+        self._timings = {name: LatencyStats() for name, _ in self._phases}
+        self._ticks = 0
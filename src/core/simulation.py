@@ -0,0 +1,39 @@
+from src.core.game_state import GameState
+from src.ui.renderer import NullRenderer
+from src.utils import constants as c
+
+
+def create_headless_game(
+    opponent: str = c.AI_OPPONENT, player1: str | None = None
+) -> GameState:
+    """
+    Create a game state that needs no display, mixer or event queue,
+    already in the playing state.
+
+    Args:
+        opponent (str): The controller playing player 2
+        player1 (str | None): The controller playing player 1, None for nobody
+
+    Returns:
+        GameState: The headless game state
+    """
+    game_state = GameState(headless=True, opponent=opponent, player1=player1)
+    game_state.set_state(c.GameStates.PLAYING)
+    return game_state
+
+
+def run_headless(game_state: GameState, ticks: int, renderer=None) -> None:
+    """
+    Advance a headless game by a number of simulation ticks.
+    Nobody is at the keyboard, so player 1 only moves if the caller moves it.
+
+    Args:
+        game_state (GameState): The game state to advance
+        ticks (int): The number of ticks to run
+        renderer: Anything with a render(game_state) method.
+            Defaults to a NullRenderer.
+    """
+    renderer = renderer or NullRenderer()
+    for _ in range(ticks):
+        game_state.update()
+        renderer.render(game_state)
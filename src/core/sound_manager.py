@@ -1,13 +1,32 @@
+from collections import deque
+import time
+
+from src.core.music_player import MusicPlayer
+from src.utils import constants as c
+from src.utils.assets import get_asset_cache
+from src.utils.profiling import LatencyStats
+
 import pygame.mixer
 
 
 class SoundManager:
     """
     The sound manager class.
+    Sounds are decoded to the mixer format when they are loaded, and every
+    sound class has a reserved mixer channel: playing a sound never searches
+    for a free channel, and a burst of one sound can not cut off another.
+    A sound replaces the one of its class that is still playing.
+    The simulation queues its sounds instead of playing them: the queue is
+    played once per frame, so physics never waits on the mixer.
+    Music is decoded off the main thread and looped by a MusicPlayer.
     """
 
     def __init__(self):
         self._sounds = {}
+        self._channels = {}
+        self._music: MusicPlayer | None = None
+        self._queued: deque[tuple[str, float]] = deque()
+        self._play_latency = LatencyStats()
         self._sound_volume = 0.3
         self._music_volume = 0.1
         self._sound_cooldowns = {}
@@ -18,6 +37,7 @@ class SoundManager:
             "bonus": 0,
         }
         self._load_sounds()
+        self._setup_channels()
         self._setup_music()
 
     @property
@@ -48,37 +68,61 @@ class SoundManager:
     def cooldown_times(self) -> tuple:
         return tuple(self._cooldown_times)
 
+    @property
+    def play_latency(self) -> LatencyStats:
+        return self._play_latency
+
+    @property
+    def music(self) -> MusicPlayer | None:
+        return self._music
+
     def _load_sounds(self) -> None:
         """
         Load the sounds.
         """
+        assets = get_asset_cache()
         self._sounds = {
-            "bonus-collect": pygame.mixer.Sound(
-                "assets/sounds/bonus-collect-normalized.wav"
-            ),
-            "fox-bounce": pygame.mixer.Sound("assets/sounds/fox-bounce-normalized.wav"),
-            "fox-fly-away": pygame.mixer.Sound(
-                "assets/sounds/fox-fly-away-normalized.wav"
-            ),
-            "mouse-click": pygame.mixer.Sound(
-                "assets/sounds/mouse-click-normalized.wav"
-            ),
+            "bonus-collect": assets.sound("assets/sounds/bonus-collect-normalized.wav"),
+            "fox-bounce": assets.sound("assets/sounds/fox-bounce-normalized.wav"),
+            "fox-fly-away": assets.sound("assets/sounds/fox-fly-away-normalized.wav"),
+            "mouse-click": assets.sound("assets/sounds/mouse-click-normalized.wav"),
         }
 
         for sound in self._sounds.values():
             sound.set_volume(self.sound_volume)
 
+    def _setup_channels(self) -> None:
+        """
+        Reserve a mixer channel per sound class, and the music channels.
+        """
+        pygame.mixer.set_reserved(
+            max(*c.SOUND_CHANNELS.values(), *c.MUSIC_CHANNELS) + 1
+        )
+        self._channels = {
+            name: pygame.mixer.Channel(channel)
+            for name, channel in c.SOUND_CHANNELS.items()
+        }
+
     def _setup_music(self) -> None:
         """
-        Set up the background music.
+        Set up the background music and start decoding it.
         """
-        pygame.mixer.music.load("assets/sounds/background-music-normalized.mp3")
-        pygame.mixer.music.set_volume(self.music_volume)
+        self._music = MusicPlayer()
+        self._music.set_volume(self.music_volume)
+        self._music.prefetch()
 
-    def play_sound(self, sound_name: str) -> None:
+    def play_sound(self, sound_name: str, requested_at: float | None = None) -> None:
         """
-        Play a sound.
+        Play a sound on the channel of its class.
+        The time from the request to play() is added to play_latency.
+
+        Args:
+            sound_name (str): The sound to play
+            requested_at (float | None): When the sound was asked for, from
+                time.perf_counter, e.g. at the collision. Defaults to now.
         """
+        if requested_at is None:
+            requested_at = time.perf_counter()
         current_time = pygame.time.get_ticks()
 
         if sound_name not in self.sounds:
@@ -90,16 +134,57 @@ class SoundManager:
             if current_time - last_played < cooldown:
                 return
 
-        self._sounds[sound_name].play()
+        channel = self._channels.get(sound_name)
+        if channel is None:
+            self._sounds[sound_name].play()
+        else:
+            channel.play(self._sounds[sound_name])
+        self._play_latency.record(time.perf_counter() - requested_at)
         self._sound_cooldowns[sound_name] = current_time
 
+    def queue_sound(self, sound_name: str) -> None:
+        """
+        Queue a sound to be played by the next play_queued().
+        Appending to the queue takes no lock, so it is safe to call from
+        another thread.
+
+        Args:
+            sound_name (str): The sound to play
+        """
+        self._queued.append((sound_name, time.perf_counter()))
+
+    def play_queued(self) -> None:
+        """
+        Play the sounds queued since the last call, each sound once.
+        A sound queued more than once is played for its first request.
+        """
+        played = set()
+        while self._queued:
+            sound_name, requested_at = self._queued.popleft()
+            if sound_name not in played:
+                played.add(sound_name)
+                self.play_sound(sound_name, requested_at)
+
     def start_music(self) -> None:
-        """Start the background music."""
-        pygame.mixer.music.play(-1)
+        """Start the menu music."""
+        self.play_music("menu")
+
+    def play_music(self, track: str) -> None:
+        """
+        Crossfade to a music track
+
+        Args:
+            track (str): The track, one of c.MUSIC_TRACKS
+        """
+        self._music.play(track)
+
+    def update_music(self) -> None:
+        """Start or restart the music as its buffers allow, once per frame."""
+        self._music.update()
 
     def stop_music(self) -> None:
         """Stop the background music."""
-        pygame.mixer.music.stop()
+        self._music.stop()
 
     def set_sound_volume(self, volume: float) -> None:
         """
@@ -120,7 +205,7 @@ class SoundManager:
             volume (float): The volume to set
         """
         self._music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.music_volume)
+        self._music.set_volume(self.music_volume)
 
     def toggle_sound(self) -> None:
         """
@@ -141,3 +226,51 @@ class SoundManager:
             self.set_music_volume(0.1)
         else:
             self.set_music_volume(0.0)
+
+
+class NullSoundManager(SoundManager):
+    """
+    A sound manager that loads nothing and plays nothing.
+    Used for headless runs, where there is no mixer to talk to.
+    Volume state is still tracked so the toggles behave the same.
+    """
+
+    def _load_sounds(self) -> None:
+        """No sounds to load."""
+        self._sounds = {}
+
+    def _setup_channels(self) -> None:
+        """No channels to reserve."""
+
+    def _setup_music(self) -> None:
+        """No music to set up."""
+
+    def play_sound(self, sound_name: str, requested_at: float | None = None) -> None:
+        """Drop the sound."""
+
+    def queue_sound(self, sound_name: str) -> None:
+        """Drop the sound."""
+
+    def play_queued(self) -> None:
+        """Nothing is ever queued."""
+
+    def start_music(self) -> None:
+        """No music to start."""
+
+    def play_music(self, track: str) -> None:
+        """No music to play."""
+
+    def update_music(self) -> None:
+        """No music to update."""
+
+    def stop_music(self) -> None:
+        """No music to stop."""
+
+    def set_music_volume(self, volume: float) -> None:
+        """
+        Set the music volume without touching the mixer.
+
+        Args:
+            volume (float): The volume to set
+        """
+        self._music_volume = max(0.0, min(1.0, volume))
@@ -0,0 +1,202 @@
+from contextlib import contextmanager
+import importlib
+import logging
+import threading
+import time
+
+from src.ui.loading_screen import LoadingScreen
+from src.utils import constants as c
+from src.utils.assets import AssetCache
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+PRELOADED_IMAGES = (
+    "assets/images/gameplay_screen.png",
+    "assets/images/start_screen.png",
+    "assets/images/button.png",
+    "assets/images/top_scores.png",
+    "assets/images/cloud.png",
+    "assets/images/fox.png",
+    "assets/images/star-bonus.png",
+)
+# Imported on the worker: numpy and the game tree take a while
+PRELOADED_MODULES = ("src.core.game_loop",)
+PRELOADED_SOUNDS = (
+    "assets/sounds/bonus-collect-normalized.wav",
+    "assets/sounds/fox-bounce-normalized.wav",
+    "assets/sounds/fox-fly-away-normalized.wav",
+    "assets/sounds/mouse-click-normalized.wav",
+    # Decoded here, the music starts as soon as the start screen is up
+    *dict.fromkeys(c.MUSIC_TRACKS.values()),
+)
+
+
+class StartupTimer:
+    """
+    Time from launch to the startup milestones, logged as they are reached,
+    and time spent in each startup phase.
+
+    Args:
+        start (float | None): The launch time, from time.perf_counter.
+            Defaults to now.
+    """
+
+    def __init__(self, start: float | None = None) -> None:
+        self._start = time.perf_counter() if start is None else start
+        self._marks: dict[str, float] = {}
+        self._phases: dict[str, float] = {}
+
+    @property
+    def marks(self) -> dict[str, float]:
+        return dict(self._marks)
+
+    @property
+    def phases(self) -> dict[str, float]:
+        return dict(self._phases)
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time a startup phase. Safe to use from the loader thread.
+
+        Args:
+            name (str): The phase, e.g. "pygame.init"
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = time.perf_counter() - start
+
+    def mark(self, milestone: str) -> float:
+        """
+        Record that a milestone was reached, once
+
+        Args:
+            milestone (str): The milestone, e.g. "first frame"
+
+        Returns:
+            float: The seconds since launch
+        """
+        if milestone not in self._marks:
+            self._marks[milestone] = time.perf_counter() - self._start
+            logger.info("%s after %.0f ms", milestone, self._marks[milestone] * 1000)
+        return self._marks[milestone]
+
+
+class AssetLoader:
+    """
+    Imports the game modules, decodes the game's images and sounds and, when
+    system fonts are used, looks them up on a worker thread, so the window
+    stays responsive meanwhile. Images are only decoded there: the asset
+    cache converts them to the display format on the main thread.
+
+    Args:
+        assets (AssetCache): The cache to load into
+        images (tuple[str, ...]): The images to decode
+        sounds (tuple[str, ...]): The sounds to load
+        modules (tuple[str, ...]): The modules to import
+        startup_timer (StartupTimer | None): Times each kind of loading
+    """
+
+    def __init__(
+        self,
+        assets: AssetCache,
+        images: tuple[str, ...] = PRELOADED_IMAGES,
+        sounds: tuple[str, ...] = PRELOADED_SOUNDS,
+        modules: tuple[str, ...] = PRELOADED_MODULES,
+        startup_timer: StartupTimer | None = None,
+    ) -> None:
+        self._assets = assets
+        self._images = images
+        self._sounds = sounds
+        self._modules = modules
+        self._font_discovery = c.FONT_SYSTEM_FALLBACK
+        self._startup_timer = startup_timer or StartupTimer()
+        self._loaded = 0
+        self._error: Exception | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="asset-loader", daemon=True
+        )
+
+    @property
+    def progress(self) -> float:
+        total = len(self._modules) + len(self._images) + len(self._sounds)
+        total += self._font_discovery
+        return self._loaded / total if total else 1.0
+
+    @property
+    def done(self) -> bool:
+        return self._thread.ident is not None and not self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start loading on the worker thread."""
+        self._thread.start()
+
+    def wait(self) -> None:
+        """
+        Wait until everything is loaded
+
+        Raises:
+            Exception: Whatever stopped the worker from loading
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        """Load everything, keeping the first error for wait()."""
+        phase = self._startup_timer.phase
+        try:
+            with phase("import game modules"):
+                for name in self._modules:
+                    importlib.import_module(name)
+                    self._loaded += 1
+            with phase("decode images"):
+                for path in self._images:
+                    self._assets.decode_image(path)
+                    self._loaded += 1
+            with phase("load sounds"):
+                for path in self._sounds:
+                    self._assets.sound(path)
+                    self._loaded += 1
+            if self._font_discovery:
+                with phase("font discovery"):
+                    # The first SysFont call scans the system fonts: do it here
+                    pygame.font.get_fonts()
+                    self._loaded += 1
+        except Exception as error:
+            self._error = error
+
+
+def show_loading_screen(
+    screen: pygame.Surface,
+    clock: pygame.time.Clock,
+    loader: AssetLoader,
+    startup_timer: StartupTimer,
+) -> bool:
+    """
+    Show the loading screen until the loader is done
+
+    Args:
+        screen (pygame.Surface): The screen to draw on
+        clock (pygame.time.Clock): The game clock
+        loader (AssetLoader): The started asset loader
+        startup_timer (StartupTimer): Marks the first frame
+
+    Returns:
+        bool: False if the window was closed while loading
+    """
+    loading_screen = LoadingScreen(screen)
+    while True:
+        loading_screen.draw(loader.progress)
+        startup_timer.mark("first frame")
+        if loader.done:
+            return True
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+        clock.tick(c.LOADING_FRAME_RATE_CAP)
@@ -1,18 +1,71 @@
-from src.effects.particle import Particle
+from src.utils import constants as c
+from src.utils.assets import to_display_format
 
+import numpy as np
 import pygame
 
 
 class ParticleSystem:
     """
-    A simple particle system class that manages a collection of particles.
+    A particle system that keeps its particles in fixed-capacity NumPy columns.
+    Updating moves and ages every particle at once, and dead particles are
+    replaced by live ones from the end, so the live ones are always the first
+    count entries. Drawing blits a pre-rendered stamp per particle, picked by
+    color and alpha level, in one call.
+
+    Args:
+        capacity (int): How many particles can be alive at once.
+            Particles spawned beyond it are dropped.
+        seed (int | None): Seed for the particle velocities and lifetimes
     """
 
-    def __init__(self):
-        self.particles: list = []
-        self.num_particles: int = 10
+    def __init__(self, capacity: int = c.PARTICLE_CAPACITY, seed=None) -> None:
+        self.num_particles: int = c.PARTICLES_PER_SPAWN
+        self._capacity = capacity
+        self._count = 0
+        self._size = c.PARTICLE_SIZE
+        self._rng = np.random.default_rng(seed)
+
+        self._x = np.zeros(capacity)
+        self._y = np.zeros(capacity)
+        self._velocity_x = np.zeros(capacity)
+        self._velocity_y = np.zeros(capacity)
+        self._lifetime = np.zeros(capacity, dtype=np.int32)
+        self._initial_lifetime = np.zeros(capacity, dtype=np.int32)
+        self._alpha = np.zeros(capacity, dtype=np.uint8)
+        self._color_index = np.zeros(capacity, dtype=np.int32)
+        self._columns = (
+            self._x,
+            self._y,
+            self._velocity_x,
+            self._velocity_y,
+            self._lifetime,
+            self._initial_lifetime,
+            self._alpha,
+            self._color_index,
+        )
+
+        self._palette: list[tuple] = []
+        self._palette_indices: dict[tuple, int] = {}
+        self._stamps: list[pygame.Surface] = []
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def positions(self) -> np.ndarray:
+        return np.column_stack((self._x[: self._count], self._y[: self._count]))
 
-    def spawn_particles(self, x: int, y: int, color: tuple) -> None:
+    @property
+    def alphas(self) -> np.ndarray:
+        return self._alpha[: self._count]
+
+    def spawn_particles(self, x: int, y: int, color: tuple, count=None) -> None:
         """
         Spawn a collection of particles at the given position.
 
@@ -20,25 +73,129 @@ class ParticleSystem:
             x (int): The x-coordinate of the spawn position.
             y (int): The y-coordinate of the spawn position.
             color (tuple): The color of the particles.
+            count (int | None): How many particles to spawn.
+                Defaults to num_particles.
         """
-        for _ in range(self.num_particles):
-            self.particles.append(Particle(x, y, color))
+        if count is None:
+            count = self.num_particles
+        start = self._count
+        end = min(start + count, self._capacity)
+        if end <= start:
+            return
+
+        color = tuple(color[:3])
+        if color not in self._palette_indices:
+            self._palette_indices[color] = len(self._palette)
+            self._palette.append(color)
+
+        spawned = end - start
+        lifetime = self._rng.integers(
+            c.PARTICLE_MIN_LIFETIME, c.PARTICLE_MAX_LIFETIME, spawned, endpoint=True
+        )
+        self._x[start:end] = x
+        self._y[start:end] = y
+        self._velocity_x[start:end] = self._rng.uniform(
+            -c.PARTICLE_MAX_SPEED, c.PARTICLE_MAX_SPEED, spawned
+        )
+        self._velocity_y[start:end] = self._rng.uniform(
+            -c.PARTICLE_MAX_SPEED, c.PARTICLE_MAX_SPEED, spawned
+        )
+        self._lifetime[start:end] = lifetime
+        self._initial_lifetime[start:end] = lifetime
+        self._alpha[start:end] = 255
+        self._color_index[start:end] = self._palette_indices[color]
+        self._count = end
 
     def update(self) -> None:
         """
         Update the particles in the system.
         Remove particles that are no longer alive.
         """
-        self.particles = [particle for particle in self.particles if particle.update()]
+        count = self._count
+        if count == 0:
+            return
+
+        self._x[:count] += self._velocity_x[:count]
+        self._y[:count] += self._velocity_y[:count]
+        self._lifetime[:count] -= 1
+        self._alpha[:count] = (
+            self._lifetime[:count] * 255 // self._initial_lifetime[:count]
+        )
+
+        alive = self._lifetime[:count] > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count < count:
+            # Dead particles before alive_count are exactly as many as live
+            # ones after it: move those into the holes.
+            holes = np.flatnonzero(~alive[:alive_count])
+            movers = np.flatnonzero(alive[alive_count:]) + alive_count
+            for column in self._columns:
+                column[holes] = column[movers]
+            self._count = alive_count
 
-    def draw(self, screen) -> None:
+    def clear(self) -> None:
+        """Remove all particles."""
+        self._count = 0
+
+    def draw(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """
+        Draw the particles on the screen, faded by their alpha,
+        in a single Surface.blits call.
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on.
+        """
+        count = self._count
+        if count == 0:
+            return []
+
+        radius = self._size
+        xs = self._x[:count].astype(np.int64) - radius
+        ys = self._y[:count].astype(np.int64) - radius
+        levels = c.PARTICLE_ALPHA_LEVELS
+        stamp_index = (
+            self._color_index[:count] * levels
+            + (self._alpha[:count].astype(np.int32) * (levels - 1) + 127) // 255
+        )
+        stamps = self._stamps_for(screen)
+        screen.blits(
+            zip(
+                [stamps[index] for index in stamp_index.tolist()],
+                zip(xs.tolist(), ys.tolist()),
+            ),
+            doreturn=False,
+        )
+
+        left = int(xs.min())
+        top = int(ys.min())
+        size = 2 * radius
+        area = pygame.Rect(
+            left, top, int(xs.max()) - left + size, int(ys.max()) - top + size
+        ).clip(screen.get_clip())
+        return [area] if area else []
+
+    def _stamps_for(self, screen: pygame.Surface) -> list[pygame.Surface]:
         """
-        Draw the particles on the screen.
+        Get the particle stamps, one per palette color and alpha level,
+        rendering the ones of new colors
+
+        Args:
+            screen (pygame.Surface): The surface the stamps are drawn on
+
+        Returns:
+            list[pygame.Surface]: The stamps, PARTICLE_ALPHA_LEVELS per color
         """
-        for particle in self.particles:
+        levels = c.PARTICLE_ALPHA_LEVELS
+        size = 2 * self._size
+        while len(self._stamps) < len(self._palette) * levels:
+            color_index, level = divmod(len(self._stamps), levels)
+            alpha = level * 255 // (levels - 1)
+            stamp = pygame.Surface((size, size), pygame.SRCALPHA)
             pygame.draw.circle(
-                screen,
-                particle.color,
-                (int(particle.x), int(particle.y)),
-                particle.size,
+                stamp,
+                (*self._palette[color_index], alpha),
+                (self._size, self._size),
+                self._size,
             )
+            self._stamps.append(to_display_format(stamp))
+        return self._stamps
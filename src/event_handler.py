@@ -1,4 +1,5 @@
 from src.core.game_state import GameState
+from src.core.input import InputState
 from src.ui.renderer import Renderer
 from src.utils import constants as c
 from src.utils.helpers import save_current_score
@@ -13,17 +14,26 @@ class EventHandler:
 
     Args:
         game_state (GameState): The current game state
+        input_state (InputState | None): The keyboard state to keep up to date.
+            Defaults to a new one.
 
     Attributes:
         game_state (GameState): The current game state
         screenshot_manager (ScreenshotManager): The screenshot manager
                 to take screenshots
+        input_state (InputState): The keyboard state, snapshotted every tick
     """
 
-    def __init__(self, game_state: GameState, renderer: Renderer) -> None:
+    def __init__(
+        self,
+        game_state: GameState,
+        renderer: Renderer,
+        input_state: InputState | None = None,
+    ) -> None:
         self.game_state = game_state
         self.screenshot_manager = ScreenshotManager()
         self.renderer = renderer
+        self.input_state = input_state or InputState()
 
     def handle_events(self) -> bool:
         """
@@ -33,22 +43,35 @@ class EventHandler:
             bool: True if the game should continue, False if the game should end
         """
         for event in pygame.event.get():
+            self.input_state.handle_event(event)
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mouse_pos = pygame.mouse.get_pos()
-                if self.game_state.current_state == c.GameStates.START:
-                    self._handle_start_screen_click(mouse_pos)
-                elif self.game_state.current_state == c.GameStates.PAUSED:
-                    self._handle_paused_screen_click(mouse_pos)
+                self._handle_click(pygame.mouse.get_pos())
             elif event.type == c.BONUS_SPAWN_EVENT:
-                self.game_state.bonus_star.spawn()
+                self.game_state.spawn_bonus_star()
             elif event.type == c.BONUS_DE_SPAWN_EVENT:
                 self.game_state.bonus_star.despawn()
             elif event.type == pygame.KEYDOWN:
-                return self._handle_keydown(event)
+                # Keep going: a key up later in the queue must not be lost
+                if not self._handle_keydown(event):
+                    return False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.renderer.invalidate()
         return True
 
+    def _handle_click(self, mouse_pos: tuple[int, int]) -> None:
+        """
+        Handle a left click on the screen currently shown
+
+        Args:
+            mouse_pos (tuple[int, int]): The position of the mouse click
+        """
+        if self.game_state.current_state == c.GameStates.START:
+            self._handle_start_screen_click(mouse_pos)
+        elif self.game_state.current_state == c.GameStates.PAUSED:
+            self._handle_paused_screen_click(mouse_pos)
+
     def _handle_start_screen_click(self, mouse_pos: tuple[int, int]) -> None:
         """
         Handle the click events on the start screen
@@ -125,6 +148,7 @@ class EventHandler:
             if self.game_state.multiplayer:
                 scores.append(self.game_state.player2_score)
             save_current_score(scores)
+            self.renderer.invalidate(c.GameStates.GAME_OVER_LEADERBOARD)
         elif self.game_state.current_state == c.GameStates.GAME_OVER_LEADERBOARD:
             self.game_state.set_state(c.GameStates.START)
             self.game_state.reset()
@@ -1,3 +1,5 @@
+from src.ui.fonts import get_font_loader
+
 import pygame
 
 
@@ -8,7 +10,7 @@ class Button:
         self.image = image
         self.rect = self.image.get_rect(center=position)
         self.text = text
-        self.font = pygame.font.SysFont(font_name, font_size)
+        self.font = get_font_loader().get(font_name, font_size)
         self.text_color = text_color
         self.text_surface = self.font.render(text, True, text_color)
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
@@ -52,6 +54,9 @@ class Button:
         Args:
             new_text (str): The new text of the button
         """
+        if new_text == self.text:
+            return
+
         self.text = new_text
         self.text_surface = self.font.render(new_text, True, self.text_color)
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
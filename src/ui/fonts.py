@@ -0,0 +1,91 @@
+from src.utils import constants as c
+
+import pygame
+
+
+class FontLoader:
+    """
+    Fonts loaded straight from the TTF files bundled with the game, so no
+    system font lookup runs and text measures the same on every machine.
+    Each (name, size, bold) font is created once.
+    A font without a bundled file falls back to the system font of that name
+    when system_fallback is set, and to pygame's built-in font otherwise.
+    A bold font without a bold file is the regular file, emboldened.
+
+    Args:
+        font_files (dict[tuple[str, bool], str]): The bundled file per
+            (name, bold)
+        system_fallback (bool): Whether to look up fonts that are not bundled
+            among the system fonts
+    """
+
+    def __init__(
+        self,
+        font_files: dict[tuple[str, bool], str] = c.FONT_FILES,
+        system_fallback: bool = c.FONT_SYSTEM_FALLBACK,
+    ) -> None:
+        self._font_files = font_files
+        self._system_fallback = system_fallback
+        self._fonts: dict[tuple[str, int, bool], pygame.font.Font] = {}
+
+    @property
+    def system_fallback(self) -> bool:
+        return self._system_fallback
+
+    def get(self, name: str, size: int, bold: bool = False) -> pygame.font.Font:
+        """
+        Get a font, loading it on first use
+
+        Args:
+            name (str): The font name, e.g. "courier new"
+            size (int): The font size
+            bold (bool): Whether the font is bold. Defaults to False.
+
+        Returns:
+            pygame.font.Font: The font. Shared: do not change its style.
+        """
+        key = (name.lower(), size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._load(*key)
+            self._fonts[key] = font
+        return font
+
+    def _load(self, name: str, size: int, bold: bool) -> pygame.font.Font:
+        """
+        Load a font from its bundled file, or fall back
+
+        Args:
+            name (str): The lowercase font name
+            size (int): The font size
+            bold (bool): Whether the font is bold
+
+        Returns:
+            pygame.font.Font: The font
+        """
+        path = self._font_files.get((name, bold))
+        if path is not None:
+            return pygame.font.Font(path, size)
+
+        if self._system_fallback:
+            return pygame.font.SysFont(name, size, bold=bold)
+
+        font = pygame.font.Font(self._font_files.get((name, False)), size)
+        font.bold = bold
+        return font
+
+
+_font_loader: FontLoader | None = None
+
+
+def get_font_loader() -> FontLoader:
+    """
+    Get the process-wide font loader
+
+    Returns:
+        FontLoader: The font loader
+    """
+    global _font_loader
+    if _font_loader is None:
+        _font_loader = FontLoader()
+    return _font_loader
@@ -0,0 +1,36 @@
+from src.utils import constants as c
+
+import pygame
+
+
+class LoadingScreen:
+    """
+    The splash shown while the assets load: a caption and a progress bar.
+    It uses no assets and pygame's built-in font, so it can be shown right
+    after the window opens.
+
+    Args:
+        screen (pygame.Surface): The screen to draw on
+    """
+
+    def __init__(self, screen: pygame.Surface) -> None:
+        self.screen = screen
+        font = pygame.font.Font(None, c.LOADING_TEXT_SIZE)
+        self._text = font.render(c.LOADING_TEXT, True, c.LOADING_COLOR)
+        self._text_rect = self._text.get_rect(center=c.LOADING_TEXT_POS)
+        self._bar_rect = pygame.Rect(c.LOADING_BAR_RECT)
+
+    def draw(self, progress: float) -> None:
+        """
+        Draw the loading screen and present it
+
+        Args:
+            progress (float): How much has loaded, 0 to 1
+        """
+        self.screen.fill(c.LOADING_BACKGROUND_COLOR)
+        self.screen.blit(self._text, self._text_rect)
+        filled = self._bar_rect.copy()
+        filled.width = round(self._bar_rect.width * max(0.0, min(1.0, progress)))
+        pygame.draw.rect(self.screen, c.LOADING_COLOR, filled)
+        pygame.draw.rect(self.screen, c.LOADING_COLOR, self._bar_rect, 1)
+        pygame.display.flip()
@@ -1,6 +1,8 @@
 from src.core.game_state import GameState
 from src.ui.button import Button
+from src.ui.text_cache import TextCache
 from src.utils import constants as c
+from src.utils.assets import get_asset_cache
 from src.utils.helpers import get_top_five_scores
 
 import pygame
@@ -12,26 +14,34 @@ class Renderer:
 
     Attributes:
         screen (pygame.Surface): The screen to render on
+        dirty_rects (bool): Whether the playing screen only redraws and pushes
+            the areas that changed, instead of the whole window
     """
 
-    def __init__(self, screen: pygame.Surface) -> None:
+    def __init__(self, screen: pygame.Surface, dirty_rects: bool = False) -> None:
         self.screen = screen
-        self.background_image: pygame.Surface = pygame.image.load(
-            "assets/images/gameplay_screen.png"
-        ).convert()
-        self.start_screen_image: pygame.Surface = pygame.image.load(
-            "assets/images/start_screen.png"
-        ).convert()
-        self.button_template: pygame.Surface = pygame.image.load(
-            "assets/images/button.png"
-        ).convert_alpha()
-
-        self.top_scores_image: pygame.Surface = pygame.image.load(
+        self.dirty_rects = dirty_rects
+        self._previous_rects: list[pygame.Rect] = []
+        self._last_state = None
+        self._static_screens: dict[c.GameStates, tuple[tuple, pygame.Surface]] = {}
+        self._presented_key = None
+        self.text_cache = TextCache()
+        assets = get_asset_cache()
+        self.background_image: pygame.Surface = assets.image(
+            "assets/images/gameplay_screen.png", alpha=False
+        )
+        self.start_screen_image: pygame.Surface = assets.image(
+            "assets/images/start_screen.png", alpha=False
+        )
+        # Buttons only blit their image, so they all share the template
+        self.button_template: pygame.Surface = assets.image("assets/images/button.png")
+
+        self.top_scores_image: pygame.Surface = assets.image(
             "assets/images/top_scores.png"
-        ).convert_alpha()
+        )
 
         self.start_button = Button(
-            self.button_template.copy(),
+            self.button_template,
             c.START_BUTTON_POS,
             c.START_BUTTON_TEXT,
             c.START_BUTTON_FONT,
@@ -40,7 +50,7 @@ class Renderer:
         )
 
         self.multiplayer_button = Button(
-            self.button_template.copy(),
+            self.button_template,
             c.MULTIPLAYER_TOGGLE_BUTTON_POS,
             c.MULTIPLAYER_TOGGLE_BUTTON_TEXT_OFF,
             c.MULTIPLAYER_TOGGLE_BUTTON_FONT,
@@ -49,7 +59,7 @@ class Renderer:
         )
 
         self.sound_button = Button(
-            self.button_template.copy(),
+            self.button_template,
             c.SOUND_TOGGLE_BUTTON_POS,
             c.SOUND_TOGGLE_BUTTON_TEXT_ON,
             c.SOUND_TOGGLE_BUTTON_FONT,
@@ -58,7 +68,7 @@ class Renderer:
         )
 
         self.music_button = Button(
-            self.button_template.copy(),
+            self.button_template,
             c.MUSIC_TOGGLE_BUTTON_POS,
             c.MUSIC_TOGGLE_BUTTON_TEXT_ON,
             c.MUSIC_TOGGLE_BUTTON_FONT,
@@ -66,25 +76,109 @@ class Renderer:
             c.MUSIC_TOGGLE_BUTTON_TEXT_COLOR,
         )
 
-    def render(self, game_state: GameState) -> None:
+    def render(self, game_state: GameState, alpha: float = 1.0) -> None:
         """
         Render the game state on the screen
 
         Args:
             game_state (GameState): The current game state
+            alpha (float): How far the frame is between the last two
+                simulation ticks, 0 to 1. Defaults to 1 (the latest tick).
+        """
+        state = game_state.current_state
+        if (
+            self.dirty_rects
+            and state == c.GameStates.PLAYING
+            and self._last_state == c.GameStates.PLAYING
+        ):
+            pygame.display.update(self._render_playing_screen_dirty(game_state, alpha))
+            return
+
+        self._last_state = state
+        if state == c.GameStates.PLAYING:
+            self._render_playing_screen(game_state, alpha)
+            self._presented_key = None
+            pygame.display.flip()
+            return
+
+        self._place_toggle_buttons(state)
+        key = self._static_screen_key(game_state)
+        if key == self._presented_key:
+            return
+
+        cached_key, cached_screen = self._static_screens.get(state, (None, None))
+        if cached_key == key:
+            self.screen.blit(cached_screen, (0, 0))
+        else:
+            self._compose_static_screen(game_state)
+            self._static_screens[state] = (key, self.screen.copy())
+        self._presented_key = key
+        pygame.display.flip()
+
+    def invalidate(self, state: c.GameStates | None = None) -> None:
+        """
+        Force the next frame to be presented, recomposing the cached screen
+        for the given state (or all of them)
+
+        Args:
+            state (GameStates | None): The screen whose content changed
+        """
+        self._presented_key = None
+        if state is None:
+            self._static_screens.clear()
+        else:
+            self._static_screens.pop(state, None)
+
+    def _static_screen_key(self, game_state: GameState) -> tuple:
+        """
+        Everything the start, pause and game over screens show, apart from
+        the saved scores (see invalidate).
+
+        Args:
+            game_state (GameState): The current game state
+
+        Returns:
+            tuple: Equal keys mean an identical screen
         """
+        return (
+            game_state.current_state,
+            game_state.multiplayer,
+            game_state.sound_manager.sound_muted,
+            game_state.sound_manager.music_muted,
+            game_state.player1_score,
+            game_state.player2_score,
+        )
 
+    def _place_toggle_buttons(self, state: c.GameStates) -> None:
+        """
+        Move the sound and music buttons to where the screen shows them.
+        Done on every frame, apart from composing: a screen blitted from the
+        cache still needs its buttons there for the clicks to land on them.
+
+        Args:
+            state (GameStates): The screen shown
+        """
+        if state == c.GameStates.PAUSED:
+            self.sound_button.set_position(c.PAUSE_SOUND_TOGGLE_BUTTON_POS)
+            self.music_button.set_position(c.PAUSE_MUSIC_TOGGLE_BUTTON_POS)
+        else:
+            self.sound_button.set_position(c.SOUND_TOGGLE_BUTTON_POS)
+            self.music_button.set_position(c.MUSIC_TOGGLE_BUTTON_POS)
+
+    def _compose_static_screen(self, game_state: GameState) -> None:
+        """
+        Draw the start, pause or game over screen
+
+        Args:
+            game_state (GameState): The current game state
+        """
         if game_state.current_state == c.GameStates.START:
             self._render_start_screen(game_state)
-        elif game_state.current_state == c.GameStates.PLAYING:
-            self._render_playing_screen(game_state)
         elif game_state.current_state == c.GameStates.PAUSED:
             self._render_pause_screen(game_state)
         elif game_state.current_state == c.GameStates.GAME_OVER_LEADERBOARD:
             self._render_game_over_leaderboard_screen(game_state)
 
-        pygame.display.flip()
-
     def _render_start_screen(self, game_state: GameState) -> None:
         """
         Render the start screen
@@ -95,8 +189,8 @@ class Renderer:
         self.screen.blit(self.start_screen_image, (0, 0))
         self._render_start_button()
         self._render_multiplayer_toggle_button(game_state)
-        self._render_sound_toggle_button(game_state, c.SOUND_TOGGLE_BUTTON_POS)
-        self._render_music_toggle_button(game_state, c.MUSIC_TOGGLE_BUTTON_POS)
+        self._render_sound_toggle_button(game_state)
+        self._render_music_toggle_button(game_state)
         self._render_controls_info()
 
     def _render_start_button(self) -> None:
@@ -118,17 +212,13 @@ class Renderer:
         self.multiplayer_button.set_text(text)
         self.multiplayer_button.draw(self.screen)
 
-    def _render_sound_toggle_button(self, game_state: GameState, new_pos=None) -> None:
+    def _render_sound_toggle_button(self, game_state: GameState) -> None:
         """
-        Render the sound toggle button
+        Render the sound toggle button, where _place_toggle_buttons put it
 
         Args:
             game_state (GameState): The current game state
-            new_pos (tuple, optional): The new position of the button. Defaults to None.
         """
-        if new_pos:
-            self.sound_button.set_position(new_pos)
-
         text = (
             c.SOUND_TOGGLE_BUTTON_TEXT_ON
             if not game_state.sound_manager.sound_muted
@@ -137,17 +227,13 @@ class Renderer:
         self.sound_button.set_text(text)
         self.sound_button.draw(self.screen)
 
-    def _render_music_toggle_button(self, game_state: GameState, new_pos=None) -> None:
+    def _render_music_toggle_button(self, game_state: GameState) -> None:
         """
-        Render the music toggle button
+        Render the music toggle button, where _place_toggle_buttons put it
 
         Args:
             game_state (GameState): The current game state
-            new_pos (tuple, optional): The new position of the button. Defaults to None.
         """
-        if new_pos:
-            self.music_button.set_position(new_pos)
-
         text = (
             c.MUSIC_TOGGLE_BUTTON_TEXT_ON
             if not game_state.sound_manager.music_muted
@@ -158,64 +244,129 @@ class Renderer:
 
     def _render_controls_info(self) -> None:
         """Render the controls information"""
-        font = pygame.font.SysFont(c.CONTROLS_INFO_FONT, c.CONTROLS_INFO_FONT_SIZE)
-
-        instruction_surface = font.render(
-            c.CONTROLS_INFO_TEXT, True, c.CONTROLS_INFO_TEXT_COLOR
+        instruction_surface = self.text_cache.render(
+            c.CONTROLS_INFO_FONT,
+            c.CONTROLS_INFO_FONT_SIZE,
+            c.CONTROLS_INFO_TEXT,
+            c.CONTROLS_INFO_TEXT_COLOR,
         )
         instruction_rect = instruction_surface.get_rect(center=c.CONTROLS_INFO_POS)
         self.screen.blit(instruction_surface, instruction_rect)
 
-    def _render_playing_screen(self, game_state: GameState) -> None:
+    def _render_playing_screen(self, game_state: GameState, alpha: float) -> None:
         """
         Render the playing screen
 
         Args:
             game_state (GameState): The current game state
+            alpha (float): How far the frame is between the last two ticks
         """
         self.screen.blit(self.background_image, (0, 0))
-        self._render_score_board(game_state)
-        self._render_current_level(game_state)
-        game_state.all_sprites.draw(self.screen)
-        game_state.bonus_star.particle_system.update()
-        game_state.bonus_star.particle_system.draw(self.screen)
+        self._previous_rects = self._render_playing_layer(game_state, alpha)
+
+    def _render_playing_screen_dirty(
+        self, game_state: GameState, alpha: float
+    ) -> list[pygame.Rect]:
+        """
+        Render the playing screen over the previous frame: restore the
+        background only where something was drawn last frame, then draw
+        everything that moves or changes.
+
+        Args:
+            game_state (GameState): The current game state
+            alpha (float): How far the frame is between the last two ticks
+
+        Returns:
+            list[pygame.Rect]: The areas of the screen that changed
+        """
+        for rect in self._previous_rects:
+            self.screen.blit(self.background_image, rect, rect)
+        rects = self._render_playing_layer(game_state, alpha)
+        changed = self._previous_rects + rects
+        self._previous_rects = rects
+        return changed
+
+    def _render_playing_layer(
+        self, game_state: GameState, alpha: float
+    ) -> list[pygame.Rect]:
+        """
+        Render everything on the playing screen except the background
+
+        Args:
+            game_state (GameState): The current game state
+            alpha (float): How far the frame is between the last two ticks
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on
+        """
+        rects = self._render_score_board(game_state)
+        rects += self._render_current_level(game_state)
+        rects += self._render_sprites(game_state, alpha)
+        rects += game_state.bonus_star.particle_system.draw(self.screen)
+        return rects
+
+    def _render_sprites(self, game_state: GameState, alpha: float) -> list[pygame.Rect]:
+        """
+        Render the sprites at their interpolated positions
+
+        Args:
+            game_state (GameState): The current game state
+            alpha (float): How far the frame is between the last two ticks
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on
+        """
+        rects = []
+        for sprite in game_state.all_sprites:
+            center = game_state.interpolated_center(sprite, alpha)
+            rects.append(
+                self.screen.blit(sprite.image, sprite.image.get_rect(center=center))
+            )
+        return rects
 
-    def _render_score_board(self, game_state: GameState) -> None:
+    def _render_score_board(self, game_state: GameState) -> list[pygame.Rect]:
         """
         Render the score board
 
         Args:
             game_state (GameState): The current game state
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on
         """
-        font = pygame.font.SysFont(c.SCORE_FONT, c.SCORE_FONT_SIZE)
-        text = font.render(
+        text = self.text_cache.render(
+            c.SCORE_FONT,
+            c.SCORE_FONT_SIZE,
             f"PLAYER 1: {game_state.player1_score}",
-            True,
             c.SCORE_TEXT_COLOR,
         )
-        self.screen.blit(text, c.SCORE_POS_PLAYER1)
+        player1_rect = self.screen.blit(text, c.SCORE_POS_PLAYER1)
 
-        text = font.render(
+        text = self.text_cache.render(
+            c.SCORE_FONT,
+            c.SCORE_FONT_SIZE,
             f"Player 2: {game_state.player2_score}",
-            True,
             c.SCORE_TEXT_COLOR,
         )
-        self.screen.blit(text, c.SCORE_POS_PLAYER2)
+        return [player1_rect, self.screen.blit(text, c.SCORE_POS_PLAYER2)]
 
-    def _render_current_level(self, game_state: GameState) -> None:
+    def _render_current_level(self, game_state: GameState) -> list[pygame.Rect]:
         """
         Render the current level
 
         Args:
             game_state (GameState): The current game state
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on
         """
-        font = pygame.font.SysFont(c.LEVEL_FONT, c.LEVEL_FONT_SIZE)
-        text = font.render(
+        text = self.text_cache.render(
+            c.LEVEL_FONT,
+            c.LEVEL_FONT_SIZE,
             f"{c.LEVEL_TEXT} {game_state.level}",
-            True,
             c.SCORE_TEXT_COLOR,
         )
-        self.screen.blit(text, c.LEVEL_POS)
+        return [self.screen.blit(text, c.LEVEL_POS)]
 
     def _render_pause_screen(self, game_state: GameState) -> None:
         """
@@ -225,22 +376,27 @@ class Renderer:
             game_state (GameState): The current game state
         """
         self.screen.blit(self.background_image, (0, 0))
-        self._render_sound_toggle_button(game_state, c.PAUSE_SOUND_TOGGLE_BUTTON_POS)
-        self._render_music_toggle_button(game_state, c.PAUSE_MUSIC_TOGGLE_BUTTON_POS)
+        self._render_sound_toggle_button(game_state)
+        self._render_music_toggle_button(game_state)
         self._render_pause_title()
         self._render_pause_info()
 
     def _render_pause_title(self) -> None:
         """Render the pause title"""
-        font = pygame.font.SysFont(c.PAUSE_FONT, c.PAUSE_FONT_SIZE)
-        text = font.render(c.PAUSE_TEXT, True, c.PAUSE_TEXT_COLOR)
+        text = self.text_cache.render(
+            c.PAUSE_FONT, c.PAUSE_FONT_SIZE, c.PAUSE_TEXT, c.PAUSE_TEXT_COLOR
+        )
         text_rect = text.get_rect(center=c.PAUSE_TEXT_POS)
         self.screen.blit(text, text_rect)
 
     def _render_pause_info(self) -> None:
         """Render the pause information"""
-        font = pygame.font.SysFont(c.PAUSE_SUBTEXT_FONT, c.PAUSE_SUBTEXT_FONT_SIZE)
-        text = font.render(c.PAUSE_SUBTEXT, True, c.PAUSE_SUBTEXT_COLOR)
+        text = self.text_cache.render(
+            c.PAUSE_SUBTEXT_FONT,
+            c.PAUSE_SUBTEXT_FONT_SIZE,
+            c.PAUSE_SUBTEXT,
+            c.PAUSE_SUBTEXT_COLOR,
+        )
         text_rect = text.get_rect(center=c.PAUSE_SUBTEXT_POS)
         self.screen.blit(text, text_rect)
 
@@ -258,15 +414,21 @@ class Renderer:
 
     def _render_text(self) -> None:
         """Render the game over text"""
-        font = pygame.font.SysFont(c.GAME_OVER_FONT, c.GAME_OVER_FONT_SIZE)
-        text = font.render(c.GAME_OVER_TITLE, True, c.GAME_OVER_TEXT_COLOR)
+        text = self.text_cache.render(
+            c.GAME_OVER_FONT,
+            c.GAME_OVER_FONT_SIZE,
+            c.GAME_OVER_TITLE,
+            c.GAME_OVER_TEXT_COLOR,
+        )
         text_rect = text.get_rect(center=c.GAME_OVER_POS)
         self.screen.blit(text, text_rect)
 
-        font = pygame.font.SysFont(
-            c.GAME_OVER_SUBTEXT_FONT, c.GAME_OVER_SUBTEXT_FONT_SIZE
+        text = self.text_cache.render(
+            c.GAME_OVER_SUBTEXT_FONT,
+            c.GAME_OVER_SUBTEXT_FONT_SIZE,
+            c.GAME_OVER_SUBTEXT,
+            c.GAME_OVER_SUBTEXT_COLOR,
         )
-        text = font.render(c.GAME_OVER_SUBTEXT, True, c.GAME_OVER_SUBTEXT_COLOR)
         text_rect = text.get_rect(center=c.GAME_OVER_SUBTEXT_POS)
         self.screen.blit(text, text_rect)
 
@@ -277,20 +439,19 @@ class Renderer:
         Args:
             game_state (GameState): The current game state
         """
-        font = pygame.font.SysFont(
-            c.GAME_OVER_CURRENT_SCORE_FONT, c.GAME_OVER_CURRENT_SCORE_FONT_SIZE
-        )
-        text = font.render(
+        text = self.text_cache.render(
+            c.GAME_OVER_CURRENT_SCORE_FONT,
+            c.GAME_OVER_CURRENT_SCORE_FONT_SIZE,
             f"Player 1: {game_state.player1_score}",
-            True,
             c.GAME_OVER_CURRENT_SCORE_TEXT_COLOR,
         )
         self.screen.blit(text, c.GAME_OVER_CURRENT_SCORE_P1_POS)
 
         if game_state.multiplayer:
-            text = font.render(
+            text = self.text_cache.render(
+                c.GAME_OVER_CURRENT_SCORE_FONT,
+                c.GAME_OVER_CURRENT_SCORE_FONT_SIZE,
                 f"Player 2: {game_state.player2_score}",
-                True,
                 c.GAME_OVER_CURRENT_SCORE_TEXT_COLOR,
             )
             self.screen.blit(text, c.GAME_OVER_CURRENT_SCORE_P2_POS)
@@ -300,11 +461,12 @@ class Renderer:
         image_rect = self.top_scores_image.get_rect(center=c.TOP_SCORES_RECT_POS)
         self.screen.blit(self.top_scores_image, image_rect)
 
-        font = pygame.font.SysFont(c.TOP_SCORES_FONT, c.TOP_SCORES_FONT_SIZE, bold=True)
-        text = font.render(
+        text = self.text_cache.render(
+            c.TOP_SCORES_FONT,
+            c.TOP_SCORES_FONT_SIZE,
             c.TOP_SCORES_TEXT,
-            True,
             c.TOP_SCORES_TEXT_COLOR,
+            bold=True,
         )
         text_rect = text.get_rect(center=c.TOP_SCORES_POS)
         self.screen.blit(text, text_rect)
@@ -313,10 +475,32 @@ class Renderer:
         top_scores_str = [f"{score.date}: {score.score} points" for score in top_scores]
 
         for i, score in enumerate(top_scores_str):
-            text = font.render(
+            text = self.text_cache.render(
+                c.TOP_SCORES_FONT,
+                c.TOP_SCORES_FONT_SIZE,
                 score,
-                True,
                 c.TOP_SCORES_TEXT_COLOR,
+                bold=True,
             )
             text_rect = text.get_rect(center=(c.WIDTH // 2, c.HEIGHT // 2 + i * 30))
             self.screen.blit(text, text_rect)
+
+
+class NullRenderer:
+    """
+    Renderer stand-in for headless runs. It draws nothing and only counts
+    the frames it was asked to render.
+    """
+
+    def __init__(self) -> None:
+        self.frames_rendered = 0
+
+    def render(self, game_state: GameState, alpha: float = 1.0) -> None:
+        """
+        Accept a frame without drawing it
+
+        Args:
+            game_state (GameState): The current game state
+            alpha (float): How far the frame is between the last two ticks
+        """
+        self.frames_rendered += 1
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+from src.ui.fonts import FontLoader, get_font_loader
+from src.utils import constants as c
+
+import pygame
+
+
+class TextCache:
+    """
+    Cache for rendered text surfaces.
+    Fonts come from the font loader, which keeps each one for good.
+    Text surfaces are keyed by (font, text, color) and the least recently used
+    one is dropped once there are more than max_surfaces of them.
+
+    Args:
+        max_surfaces (int): How many rendered text surfaces to keep
+        font_loader (FontLoader | None): Where fonts come from.
+            Defaults to the process-wide font loader.
+    """
+
+    def __init__(
+        self,
+        max_surfaces: int = c.TEXT_CACHE_SIZE,
+        font_loader: FontLoader | None = None,
+    ) -> None:
+        self._max_surfaces = max_surfaces
+        self._font_loader = font_loader or get_font_loader()
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def size(self) -> int:
+        return len(self._surfaces)
+
+    def get_font(self, name: str, size: int, bold: bool = False) -> pygame.font.Font:
+        """
+        Get a font from the font loader
+
+        Args:
+            name (str): The font name
+            size (int): The font size
+            bold (bool): Whether the font is bold. Defaults to False.
+
+        Returns:
+            pygame.font.Font: The font
+        """
+        return self._font_loader.get(name, size, bold)
+
+    def render(
+        self, name: str, size: int, text: str, color: tuple, bold: bool = False
+    ) -> pygame.Surface:
+        """
+        Get the antialiased surface for a text, rendering it only on a miss
+
+        Args:
+            name (str): The font name
+            size (int): The font size
+            text (str): The text to render
+            color (tuple): The text color
+            bold (bool): Whether the font is bold. Defaults to False.
+
+        Returns:
+            pygame.Surface: The rendered text. Shared: do not draw on it.
+        """
+        key = ((name, size, bold), text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self._misses += 1
+        surface = self.get_font(name, size, bold).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self._max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surface
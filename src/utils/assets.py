@@ -0,0 +1,226 @@
+from dataclasses import dataclass
+import time
+from typing import Any, Callable
+
+import pygame
+
+
+def to_display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """
+    Convert a surface to the display pixel format, so blitting it is fast.
+    Without a display the surface is returned as is.
+
+    Args:
+        surface (pygame.Surface): The surface to convert
+        alpha (bool): Whether to keep per-pixel alpha. Defaults to True.
+
+    Returns:
+        pygame.Surface: The converted surface
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+@dataclass
+class AssetStats:
+    """
+    The memory use and load time of one cached asset
+
+    Attributes:
+        path (str): The file the asset comes from
+        transform (tuple): What was done to the file, e.g. ("rotozoom", 5)
+        size (int): The memory the asset holds on to, in bytes
+        load_time (float): How long building the asset took, in seconds
+    """
+
+    path: str
+    transform: tuple
+    size: int
+    load_time: float
+
+
+def _asset_size(asset) -> int:
+    """
+    Get the memory an asset holds on to
+
+    Args:
+        asset: A surface, a sound or a tuple of those
+
+    Returns:
+        int: The size in bytes
+    """
+    if isinstance(asset, tuple):
+        return sum(_asset_size(item) for item in asset)
+    if isinstance(asset, pygame.Surface):
+        return asset.get_pitch() * asset.get_height()
+    return len(asset.get_raw())
+
+
+class AssetCache:
+    """
+    Images, transformed images and sounds, each loaded once per process.
+    Assets are keyed by (path, transform) and shared by everyone who asks for
+    them, so they must not be drawn on. Images loaded before the display
+    exists are loaded again, converted, once it does.
+    """
+
+    def __init__(self) -> None:
+        self._assets: dict[tuple, Any] = {}
+        self._load_times: dict[tuple, float] = {}
+        self._decoded: dict[str, pygame.Surface] = {}
+
+    def get(self, path: str, transform: tuple, build: Callable[[], Any]):
+        """
+        Get an asset, building it on first use
+
+        Args:
+            path (str): The file the asset comes from
+            transform (tuple): What was done to the file, e.g. ("rotozoom", 5)
+            build (Callable[[], Any]): Builds the asset on a miss
+
+        Returns:
+            Any: The asset. Shared: do not modify it.
+        """
+        key = (path, transform, pygame.display.get_surface() is not None)
+        asset = self._assets.get(key)
+        if asset is None:
+            start = time.perf_counter()
+            asset = build()
+            self._load_times[key] = time.perf_counter() - start
+            self._assets[key] = asset
+        return asset
+
+    def image(self, path: str, alpha: bool = True) -> pygame.Surface:
+        """
+        Get an image in the display pixel format
+
+        Args:
+            path (str): The path to the image
+            alpha (bool): Whether to keep per-pixel alpha. Defaults to True.
+
+        Returns:
+            pygame.Surface: The image. Shared: do not draw on it.
+        """
+        return self.get(
+            path, ("image", alpha), lambda: to_display_format(self._decode(path), alpha)
+        )
+
+    def decode_image(self, path: str) -> None:
+        """
+        Decode an image ahead of time, without converting it.
+        Safe to call from a worker thread: the display conversion happens on
+        the thread that first asks image() for it.
+
+        Args:
+            path (str): The path to the image
+        """
+        self._decoded[path] = pygame.image.load(path)
+
+    def _decode(self, path: str) -> pygame.Surface:
+        """
+        Get an image decoded ahead of time, or decode it now
+
+        Args:
+            path (str): The path to the image
+
+        Returns:
+            pygame.Surface: The decoded image
+        """
+        surface = self._decoded.pop(path, None)
+        if surface is None:
+            surface = pygame.image.load(path)
+        return surface
+
+    def rotated(self, path: str, angle: float) -> pygame.Surface:
+        """
+        Get an image rotated by an angle, with per-pixel alpha
+
+        Args:
+            path (str): The path to the image
+            angle (float): The angle in degrees, counterclockwise
+
+        Returns:
+            pygame.Surface: The rotated image. Shared: do not draw on it.
+        """
+        image = self.image(path)
+        return self.get(
+            path,
+            ("rotozoom", angle),
+            lambda: to_display_format(pygame.transform.rotozoom(image, angle, 1)),
+        )
+
+    def rotations(self, path: str, steps: int) -> tuple[pygame.Surface, ...]:
+        """
+        Get an image rotated at every step of a full turn, with per-pixel alpha
+
+        Args:
+            path (str): The path to the image
+            steps (int): How many rotations; frame i is rotated by i * 360 / steps
+
+        Returns:
+            tuple[pygame.Surface, ...]: The rotated images. Shared: do not draw on them.
+        """
+        image = self.image(path)
+        step = 360 / steps
+        return self.get(
+            path,
+            ("rotations", steps),
+            lambda: tuple(
+                to_display_format(pygame.transform.rotozoom(image, i * step, 1))
+                for i in range(steps)
+            ),
+        )
+
+    def sound(self, path: str) -> pygame.mixer.Sound:
+        """
+        Get a sound
+
+        Args:
+            path (str): The path to the sound
+
+        Returns:
+            pygame.mixer.Sound: The sound, shared by everyone who plays it
+        """
+        return self.get(path, ("sound",), lambda: pygame.mixer.Sound(path))
+
+    def stats(self) -> list[AssetStats]:
+        """
+        Get the memory use and load time of every cached asset
+
+        Returns:
+            list[AssetStats]: One entry per asset, in load order
+        """
+        stats = []
+        for key, asset in self._assets.items():
+            path, transform, _ = key
+            stats.append(
+                AssetStats(path, transform, _asset_size(asset), self._load_times[key])
+            )
+        return stats
+
+    @property
+    def size(self) -> int:
+        return len(self._assets)
+
+    def clear(self) -> None:
+        """Drop every cached asset."""
+        self._assets.clear()
+        self._load_times.clear()
+        self._decoded.clear()
+
+
+_asset_cache: AssetCache | None = None
+
+
+def get_asset_cache() -> AssetCache:
+    """
+    Get the process-wide asset cache
+
+    Returns:
+        AssetCache: The asset cache
+    """
+    global _asset_cache
+    if _asset_cache is None:
+        _asset_cache = AssetCache()
+    return _asset_cache
@@ -2,16 +2,29 @@ from enum import Enum
 import os
 import sys
 
-import pygame
-
 # WINDOW -----------------------------------------------------------------------
 WIDTH = 640
 HEIGHT = 480
 
+# GAME LOOP -------------------------------------------------------------------
+# The simulation runs at a fixed 60 ticks per second. It is not a setting:
+# every speed, AI delay and cooldown in the game counts ticks, so another rate
+# would change how fast the game plays, not how finely it is simulated.
+_TICK_RATE = 60
+TICK_DURATION = 1000 / _TICK_RATE  # milliseconds
+MAX_FRAME_TIME = 250  # milliseconds, longer frames are clamped
+FRAME_RATE_CAP = 240  # frames per second, on top of vsync
+MENU_FRAME_RATE_CAP = 60  # frames per second outside of gameplay
+
+# RENDERING -------------------------------------------------------------------
+TEXT_CACHE_SIZE = 128  # rendered text surfaces kept by the renderer
+
 # FOX -------------------------------------------------------------------------
 BASE_SPEED = 6
 MAX_SPEED = 20
 FOX_HITBOX_DIFF = 15
+FOX_SPIN_SPEED = 0.1  # degrees per tick
+FOX_ROTATION_STEPS = 360  # pre-rendered frames per full turn
 
 # CLOUD -----------------------------------------------------------------------
 # PLAYER1
@@ -26,17 +39,91 @@ CLOUD_Y = HEIGHT // 2
 CLOUD_HITBOX_WIDTH_DIFF = 26
 CLOUD_HITBOX_HEIGHT_DIFF = 10
 
+# AI --------------------------------------------------------------------------
+# Single player opponent, a controller name from src.core.controllers:
+# "predictive" aims where the fox will cross its side, "tracker" follows the
+# fox's current height
+AI_OPPONENT = "predictive"
+# Time an AI may take to decide its move, in microseconds. A decision that
+# takes longer is dropped and the previous move is played again.
+AI_DECISION_BUDGET = 200
+# How long a remote AI, running in its own process, has to answer a tick, in
+# microseconds. Kept under AI_DECISION_BUDGET: waiting counts toward it.
+AI_REMOTE_WAIT = 150
+# Spread (standard deviation) of the predictive AI's aiming error, in pixels.
+# It narrows by a step per level down to a floor.
+AI_PREDICTION_ERROR = 60
+AI_PREDICTION_ERROR_STEP = 6
+AI_PREDICTION_ERROR_MIN = 6
+
 # BONUS STAR ------------------------------------------------------------------
 # We set something like IDs for the events
-BONUS_SPAWN_EVENT = (
-    pygame.USEREVENT + 1
-)  # (32769) - a special event type with number 32768
-BONUS_DE_SPAWN_EVENT = pygame.USEREVENT + 2  # (32770)
+# pygame.USEREVENT in pygame 2, spelled out so that importing constants does not
+# import pygame
+USEREVENT = 32866
+BONUS_SPAWN_EVENT = USEREVENT + 1
+BONUS_DE_SPAWN_EVENT = USEREVENT + 2
 BONUS_SPAWN_INTERVAL = 20 * 1000  # 20 * 1000 milliseconds
 BONUS_LIFETIME = 5 * 1000  # 5 * 1000 milliseconds
 BONUS_POINTS = 2
 BONUS_HITBOX_DIFF = 5
 
+# PARTICLES -------------------------------------------------------------------
+PARTICLE_CAPACITY = 50_000  # particles alive at once, extra spawns are dropped
+PARTICLES_PER_SPAWN = 10
+PARTICLE_MAX_SPEED = 2  # pixels per update, on each axis
+PARTICLE_MIN_LIFETIME = 30  # updates
+PARTICLE_MAX_LIFETIME = 60  # updates
+PARTICLE_SIZE = 2  # radius
+PARTICLE_ALPHA_LEVELS = 16  # pre-rendered stamps per color, from clear to opaque
+
+# FONTS ------------------------------------------------------------------------
+# Font names used below, mapped to the TTF files bundled in assets/fonts.
+# The DejaVu fonts stand in for the system fonts the names refer to.
+FONT_FILES = {
+    ("courier new", False): "assets/fonts/DejaVuSansMono.ttf",
+    ("courier new", True): "assets/fonts/DejaVuSansMono-Bold.ttf",
+    ("arial", False): "assets/fonts/DejaVuSans.ttf",
+}
+# Use the system font of that name when a font is not bundled, instead of
+# pygame's built-in font. The first system font lookup scans every font on
+# the machine, so it is off by default.
+FONT_SYSTEM_FALLBACK = False
+
+# AUDIO ------------------------------------------------------------------------
+# Mixer settings, applied before pygame.init. A smaller buffer plays sounds
+# sooner after play() at the cost of more mixer callbacks.
+AUDIO_FREQUENCY = 44100
+AUDIO_SIZE = -16  # signed 16-bit samples
+AUDIO_CHANNELS = 2  # stereo
+AUDIO_BUFFER_SIZE = 256  # samples, about 6 ms at 44100 Hz
+# Reserved mixer channel per sound class
+SOUND_CHANNELS = {
+    "fox-bounce": 0,
+    "fox-fly-away": 1,
+    "bonus-collect": 2,
+    "mouse-click": 3,
+}
+
+# MUSIC ------------------------------------------------------------------------
+# Music tracks by game screen. Both use the one track the game ships with;
+# point them at different files to give each screen its own music.
+MUSIC_TRACKS = {
+    "menu": "assets/sounds/background-music-normalized.mp3",
+    "gameplay": "assets/sounds/background-music-normalized.mp3",
+}
+MUSIC_CHANNELS = (4, 5)  # reserved, after SOUND_CHANNELS; crossfades use both
+MUSIC_CROSSFADE = 1000  # milliseconds
+
+# LOADING SCREEN ---------------------------------------------------------------
+LOADING_BACKGROUND_COLOR = (34, 32, 52)
+LOADING_COLOR = (249, 182, 154)
+LOADING_TEXT = "Loading..."
+LOADING_TEXT_SIZE = 36  # pygame's built-in font, so no font lookup is needed
+LOADING_TEXT_POS = (WIDTH // 2, HEIGHT // 2 - 30)
+LOADING_BAR_RECT = (WIDTH // 2 - 150, HEIGHT // 2 + 10, 300, 12)
+LOADING_FRAME_RATE_CAP = 30
+
 # COLORS -----------------------------------------------------------------------
 STAR_PARTICLES_COLOR = (249, 182, 154)  # for particles
 WARM_GREY = (155, 155, 155)
@@ -159,12 +246,13 @@ TOP_SCORES_POS = (WIDTH // 2, HEIGHT // 2 - 50)
 
 # TOP SCORES RECTANGLE
 TOP_SCORES_RECT_POS = (WIDTH // 2, HEIGHT // 2 + 40)
+LEADERBOARD_SIZE = 5
 # PATHS -----------------------------------------------------------------------
 # В constants.py
 if getattr(sys, "frozen", False):
     home = os.path.expanduser("~")
-    scores_dir = os.path.join(home, ".sleepyfox")
-    os.makedirs(scores_dir, exist_ok=True)
-    SCORES_FILE = os.path.join(scores_dir, "scores.pkl")
+    scores_dir = os.path.join(home, ".sleepyfox")  # created on first use
 else:
-    SCORES_FILE = "assets/scores/scores.pkl"
+    scores_dir = "assets/scores"
+SCORES_FILE = os.path.join(scores_dir, "scores.db")
+LEGACY_SCORES_FILE = os.path.join(scores_dir, "scores.pkl")  # migrated on first use
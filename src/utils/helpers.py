@@ -1,10 +1,14 @@
-from dataclasses import dataclass
 from datetime import datetime
 import os
-import pickle
 import random
 
 from src.utils import constants as c
+from src.utils.score_store import (
+    Score,
+    ScoreStore,
+    SqliteScoreStore,
+    migrate_pickle_scores,
+)
 
 
 def get_random_position() -> list[int]:
@@ -17,53 +21,114 @@ def get_random_position() -> list[int]:
     return [random.randint(50, c.WIDTH - 50), random.randint(50, c.HEIGHT - 50)]
 
 
-@dataclass
-class Score:
-    date: str
-    score: int
+class Leaderboard:
+    """
+    The top scores of a score store, kept in memory.
+    The store is queried once; saved scores are merged in as they come, and
+    the store is only queried again when another process saved scores.
+
+    Args:
+        store (ScoreStore): Where the scores are saved
+        size (int): How many scores to keep
+    """
+
+    def __init__(self, store: ScoreStore, size: int) -> None:
+        self._store = store
+        self._size = size
+        self._top: list[Score] = []
+        self._version = None
+        self._loaded = False
+
+    @property
+    def store(self) -> ScoreStore:
+        return self._store
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def top_scores(self) -> list[Score]:
+        """
+        Get the top scores, best first. Equal scores keep their saved order.
+
+        Returns:
+            list[Score]: The top scores
+        """
+        if not self.is_current():
+            self._reload()
+        return list(self._top)
+
+    def is_current(self) -> bool:
+        """
+        Check whether the top scores match the store
+
+        Returns:
+            bool: False if the store was never queried or changed since
+        """
+        return self._loaded and self._store.version() == self._version
+
+    def save(self, scores: list[Score]) -> None:
+        """
+        Save scores to the store and merge them into the top scores
+
+        Args:
+            scores (list[Score]): The scores, in the order they are saved
+        """
+        is_current = self.is_current()
+        self._store.add(scores)
+        if not is_current:
+            return
+
+        for score in scores:
+            index = len(self._top)
+            while index > 0 and self._top[index - 1].score < score.score:
+                index -= 1
+            if index < self._size:
+                self._top.insert(index, score)
+                del self._top[self._size :]
+        self._version = self._store.version()
+
+    def _reload(self) -> None:
+        """Query the top scores from the store."""
+        self._version = self._store.version()
+        self._top = self._store.top(self._size)
+        self._loaded = True
+
+
+_leaderboard: Leaderboard | None = None
+
+
+def get_leaderboard() -> Leaderboard:
+    """
+    Get the leaderboard, opening the scores database on first use.
+    Scores of an old scores.pkl are moved into the database the first time.
+
+    Returns:
+        Leaderboard: The leaderboard
+    """
+    global _leaderboard
+    if _leaderboard is None:
+        os.makedirs(os.path.dirname(c.SCORES_FILE), exist_ok=True)
+        store = SqliteScoreStore(c.SCORES_FILE)
+        migrate_pickle_scores(c.LEGACY_SCORES_FILE, store)
+        _leaderboard = Leaderboard(store, c.LEADERBOARD_SIZE)
+    return _leaderboard
 
 
 def get_top_five_scores() -> list[Score]:
     """
-    Get the top five scores from the scores file
+    Get the top five scores, from memory
 
     Returns:
         list[Score]: A list with the top five Score objects
     """
-    try:
-        if os.path.isfile(c.SCORES_FILE):
-            with open(c.SCORES_FILE, "rb") as file:
-                scores = pickle.load(file)
-                if not scores:
-                    return []
-                return sorted(scores, key=lambda x: x.score, reverse=True)[:5]
-    except (EOFError, FileNotFoundError, pickle.UnpicklingError):
-        if os.path.exists(c.SCORES_FILE):
-            os.remove(c.SCORES_FILE)
-        return []
-
-    return []
+    return get_leaderboard().top_scores()
 
 
 def save_current_score(scores: list):
     """
-    Save the current score to the scores file
+    Save the current score to the scores database
     """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
     new_score_objects = [Score(date=timestamp, score=score) for score in scores]
-
-    scores_dir = os.path.dirname(c.SCORES_FILE)
-    os.makedirs(scores_dir, exist_ok=True)
-
-    existing_scores = []
-    try:
-        if os.path.isfile(c.SCORES_FILE):
-            with open(c.SCORES_FILE, "rb") as file:
-                existing_scores = pickle.load(file)
-    except (EOFError, pickle.UnpicklingError):
-        existing_scores = []
-
-    all_scores = existing_scores + new_score_objects
-
-    with open(c.SCORES_FILE, "wb") as file:
-        pickle.dump(all_scores, file)
+    get_leaderboard().save(new_score_objects)
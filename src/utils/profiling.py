@@ -0,0 +1,175 @@
+import sys
+import threading
+import time
+
+
+class _TimedLoader:
+    """
+    Wraps a module loader so that creating and running the module is timed.
+    Everything else is passed through to the wrapped loader.
+    """
+
+    def __init__(self, loader, name: str, import_timer: "ImportTimer") -> None:
+        self._loader = loader
+        self._name = name
+        self._import_timer = import_timer
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._loader, attribute)
+
+    def create_module(self, spec):
+        return self._import_timer._time(
+            self._name, lambda: self._loader.create_module(spec)
+        )
+
+    def exec_module(self, module) -> None:
+        self._import_timer._time(self._name, lambda: self._loader.exec_module(module))
+
+
+class ImportTimer:
+    """
+    Times every module imported while it is installed, like python -X
+    importtime but from inside the process, so it works in bundled builds too.
+    It sits first on sys.meta_path and wraps the loaders the other finders
+    return. Self time leaves out the imports a module triggers; cumulative
+    time includes them.
+    """
+
+    def __init__(self) -> None:
+        self._times: dict[str, tuple[float, float]] = {}
+        self._local = threading.local()
+
+    @property
+    def times(self) -> dict[str, tuple[float, float]]:
+        return dict(self._times)
+
+    def install(self) -> None:
+        """Start timing imports."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        """Stop timing imports."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name: str, path=None, target=None):
+        """
+        Find a module with the other finders and time its loader
+
+        Args:
+            name (str): The full module name
+            path: The parent package's __path__, for submodules
+            target: The module being reloaded, if any
+
+        Returns:
+            ModuleSpec | None: The spec the other finders found
+        """
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, name, self)
+            return spec
+        return None
+
+    def _time(self, name: str, load):
+        """
+        Run part of loading a module and add its time to the module
+
+        Args:
+            name (str): The module name
+            load (Callable): Creates or runs the module
+
+        Returns:
+            Any: What load returned
+        """
+        nested = getattr(self._local, "nested", None)
+        if nested is None:
+            nested = self._local.nested = []
+        nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            return load()
+        finally:
+            elapsed = time.perf_counter() - start
+            children = nested.pop()
+            self_time, cumulative = self._times.get(name, (0.0, 0.0))
+            self._times[name] = (self_time + elapsed - children, cumulative + elapsed)
+            if nested:
+                nested[-1] += elapsed
+
+
+def format_startup_report(
+    import_times: dict[str, tuple[float, float]],
+    phases: dict[str, float],
+    milestones: dict[str, float],
+    top: int = 25,
+) -> str:
+    """
+    Format the startup profile as a plain text report
+
+    Args:
+        import_times (dict[str, tuple[float, float]]): Self and cumulative
+            seconds per imported module
+        phases (dict[str, float]): Seconds spent per startup phase
+        milestones (dict[str, float]): Seconds since launch per milestone
+        top (int): How many of the slowest imports to list. Defaults to 25.
+
+    Returns:
+        str: The report
+    """
+    lines = [f"{'self ms':>9} {'cumul ms':>9}  slowest imports"]
+    slowest = sorted(import_times.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_time, cumulative) in slowest[:top]:
+        lines.append(f"{self_time * 1e3:9.1f} {cumulative * 1e3:9.1f}  {name}")
+    total = sum(self_time for self_time, _ in import_times.values())
+    lines.append(f"{total * 1e3:9.1f} {'':>9}  all {len(import_times)} imports")
+
+    lines.append("")
+    lines.append(f"{'ms':>9}  phases")
+    for name, seconds in phases.items():
+        lines.append(f"{seconds * 1e3:9.1f}  {name}")
+
+    lines.append("")
+    lines.append(f"{'ms':>9}  since launch")
+    for name, seconds in milestones.items():
+        lines.append(f"{seconds * 1e3:9.1f}  {name}")
+    return "\n".join(lines)
+
+
+class LatencyStats:
+    """
+    Count, mean and worst of a series of latencies.
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._total = 0.0
+        self._worst = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count else 0.0
+
+    @property
+    def worst(self) -> float:
+        return self._worst
+
+    def record(self, seconds: float) -> None:
+        """
+        Add a latency
+
+        Args:
+            seconds (float): The latency
+        """
+        self._count += 1
+        self._total += seconds
+        self._worst = max(self._worst, seconds)
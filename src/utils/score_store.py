@@ -0,0 +1,181 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import os
+import pickle
+import sqlite3
+
+
+@dataclass
+class Score:
+    date: str
+    score: int
+
+
+class ScoreStore(ABC):
+    """
+    Where saved scores live. Stores append scores and answer top-score queries;
+    they never rewrite what was already saved.
+    """
+
+    @abstractmethod
+    def add(self, scores: list[Score]) -> None:
+        """
+        Append scores, all or nothing
+
+        Args:
+            scores (list[Score]): The scores to save, in order
+        """
+
+    @abstractmethod
+    def top(self, count: int) -> list[Score]:
+        """
+        Get the best scores, best first. Equal scores keep their saved order.
+
+        Args:
+            count (int): How many scores to return
+
+        Returns:
+            list[Score]: The best scores
+        """
+
+    @abstractmethod
+    def version(self):
+        """
+        Get a value that changes whenever another process saves scores
+
+        Returns:
+            Any: The current version
+        """
+
+
+class SqliteScoreStore(ScoreStore):
+    """
+    Scores in an SQLite table with an index on the score.
+    Saving is one insert and the top scores are read straight off the index,
+    however many scores there are. Every save is a transaction, so a crash
+    can not leave a half written file behind.
+
+    Args:
+        path (str): The database file
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                "id INTEGER PRIMARY KEY, date TEXT NOT NULL, score INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id)"
+            )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def add(self, scores: list[Score]) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO scores (date, score) VALUES (?, ?)",
+                [(score.date, score.score) for score in scores],
+            )
+
+    def top(self, count: int) -> list[Score]:
+        rows = self._connection.execute(
+            "SELECT date, score FROM scores ORDER BY score DESC, id LIMIT ?", (count,)
+        )
+        return [Score(date=date, score=score) for date, score in rows]
+
+    def count(self) -> int:
+        """
+        Get the number of saved scores
+
+        Returns:
+            int: The number of saved scores
+        """
+        return self._connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def version(self) -> int:
+        return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+class PickleScoreStore(ScoreStore):
+    """
+    Scores as one pickled list of Score objects, the original scores.pkl format.
+    Every save reads and rewrites the whole list (to a temporary file that
+    then replaces the old one), so it gets slower as the history grows.
+
+    Args:
+        path (str): The pickle file
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def load(self) -> list[Score]:
+        """
+        Load every saved score. A corrupt file is removed.
+
+        Returns:
+            list[Score]: The saved scores, oldest first
+        """
+        try:
+            if os.path.isfile(self._path):
+                with open(self._path, "rb") as file:
+                    return pickle.load(file) or []
+        except (EOFError, FileNotFoundError, pickle.UnpicklingError):
+            if os.path.exists(self._path):
+                os.remove(self._path)
+            return []
+
+        return []
+
+    def add(self, scores: list[Score]) -> None:
+        all_scores = self.load() + scores
+        temporary_path = f"{self._path}.tmp"
+        with open(temporary_path, "wb") as file:
+            pickle.dump(all_scores, file)
+        os.replace(temporary_path, self._path)
+
+    def top(self, count: int) -> list[Score]:
+        return sorted(self.load(), key=lambda x: x.score, reverse=True)[:count]
+
+    def version(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+def migrate_pickle_scores(pickle_path: str, store: ScoreStore) -> int:
+    """
+    Move the scores of an old scores.pkl into a store, once.
+    The pickle file is renamed afterwards, so it is not migrated again.
+
+    Args:
+        pickle_path (str): The old scores file
+        store (ScoreStore): The store to move the scores into
+
+    Returns:
+        int: The number of migrated scores
+    """
+    if not os.path.isfile(pickle_path):
+        return 0
+
+    scores = PickleScoreStore(pickle_path).load()
+    if scores:
+        store.add(scores)
+    if os.path.exists(pickle_path):
+        os.replace(pickle_path, f"{pickle_path}.migrated")
+    return len(scores)
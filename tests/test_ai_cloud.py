@@ -2,13 +2,24 @@ import unittest
 from unittest.mock import Mock, PropertyMock, patch
 
 from src.core.ai_cloud import AICloud
+from src.core.controllers import (
+    ControllerHarness,
+    PredictiveController,
+    ReplayController,
+    TrackerController,
+)
 from src.utils import constants as c
+from src.utils.assets import get_asset_cache
+
+import pygame
 
 
 class AICloudShould(unittest.TestCase):
     @patch("pygame.transform.rotozoom")
     @patch("pygame.image.load")
     def setUp(self, mock_load, mock_rotozoom):
+        get_asset_cache().clear()
+        self.addCleanup(get_asset_cache().clear)
         mock_surface = Mock()
         mock_converted_surface = Mock()
         mock_rotated_surface = Mock()
@@ -27,14 +38,21 @@ class AICloudShould(unittest.TestCase):
     def test_init_setsSpeed(self):
         self.assertEqual(c.BASE_SPEED * 0.8, self.ai_cloud.speed)
 
-    def test_init_setsDeadZone(self):
-        self.assertEqual(10, self.ai_cloud.dead_zone)
+    def test_init_createsTrackerController_byDefault(self):
+        self.assertIsInstance(self.ai_cloud.controller, TrackerController)
+        self.assertEqual(c.AI_DECISION_BUDGET, self.ai_cloud.harness.budget)
+
+    def test_init_createsNamedController(self):
+        with patch("pygame.transform.rotozoom"), patch("pygame.image.load"):
+            ai_cloud = AICloud(controller="predictive")
+
+        self.assertIsInstance(ai_cloud.controller, PredictiveController)
 
-    def test_init_setsReactionDelay(self):
-        self.assertEqual(2, self.ai_cloud.reaction_delay)
+    def test_adaptToDifficulty_setsSpeedAndLevel(self):
+        self.ai_cloud.adapt_to_difficulty(10, 4)
 
-    def test_init_setsDelayCounter(self):
-        self.assertEqual(0, self.ai_cloud.delay_counter)
+        self.assertEqual(6, self.ai_cloud.speed)
+        self.assertEqual(4, self.ai_cloud.level)
 
     @patch("src.core.cloud.Cloud.update")
     def test_update_callsHandleAIMovement(self, mock_super_update):
@@ -47,49 +65,38 @@ class AICloudShould(unittest.TestCase):
             mock_super_update.assert_called_once_with(fox)
             mock_handle_ai_movement.assert_called_once_with(fox)
 
-    def test_handleAiMovement_incrementsDelayCounter(self):
-        self.ai_cloud.delay_counter = 0
-
-        self.ai_cloud._handle_ai_movement(None)
-        self.assertEqual(1, self.ai_cloud.delay_counter)
-
-    def test_handleAiMovement_setsDelayCounterToZero_whenCounterIsEqualToReaction(self):
-        with patch.object(self.ai_cloud, "_move_with_speed"):
-            fox = Mock()
-            fox.rect.centery = 9
-            self.ai_cloud.rect.centery = 0
-            self.ai_cloud.delay_counter = 2
-
-            self.ai_cloud._handle_ai_movement(fox)
-            self.assertEqual(0, self.ai_cloud.delay_counter)
-
-    def test_handleAiMovement_movesUp_whenFoxIsAboveCloud(self):
-        with patch.object(self.ai_cloud, "_move_with_speed") as mock_move_with_speed:
-            fox = Mock()
-            fox.rect.centery = -100
-            self.ai_cloud.rect.centery = 10
-            self.ai_cloud.delay_counter = 2
-
+    def drive(self, *moves: float) -> Mock:
+        self.ai_cloud._harness = ControllerHarness(ReplayController(moves), None)
+        fox = Mock()
+        fox.rect = pygame.Rect(0, 0, 40, 40)
+        fox.hitbox = pygame.Rect(0, 0, 30, 30)
+        fox.velocity = pygame.math.Vector2(1, 1)
+        return fox
+
+    def test_handleAiMovement_movesUp_whenControllerDecidesUp(self):
+        fox = self.drive(-0.5)
+        with (
+            patch.object(self.ai_cloud, "_observe"),
+            patch.object(self.ai_cloud, "_move_with_speed") as mock_move_with_speed,
+        ):
             self.ai_cloud._handle_ai_movement(fox)
-            mock_move_with_speed.assert_called_once_with("up", 1.0)
-
-    def test_handleAiMovement_movesDown_whenFoxIsBelowCloud(self):
-        with patch.object(self.ai_cloud, "_move_with_speed") as mock_move_with_speed:
-            fox = Mock()
-            fox.rect.centery = 110
-            self.ai_cloud.rect.centery = 10
-            self.ai_cloud.delay_counter = 2
-
+            mock_move_with_speed.assert_called_once_with("up", 0.5)
+
+    def test_handleAiMovement_movesDown_whenControllerDecidesDown(self):
+        fox = self.drive(1.0)
+        with (
+            patch.object(self.ai_cloud, "_observe"),
+            patch.object(self.ai_cloud, "_move_with_speed") as mock_move_with_speed,
+        ):
             self.ai_cloud._handle_ai_movement(fox)
             mock_move_with_speed.assert_called_once_with("down", 1.0)
 
-    def test_handleAiMovement_doesNotMove_whenFoxIsWithinDeadZone(self):
-        with patch.object(self.ai_cloud, "_move_with_speed") as mock_move_with_speed:
-            fox = Mock()
-            fox.rect.centery = 10
-            self.ai_cloud.rect.centery = 10
-            self.ai_cloud.delay_counter = 2
-
+    def test_handleAiMovement_doesNotMove_whenControllerHoldsStill(self):
+        fox = self.drive(0.0)
+        with (
+            patch.object(self.ai_cloud, "_observe"),
+            patch.object(self.ai_cloud, "_move_with_speed") as mock_move_with_speed,
+        ):
             self.ai_cloud._handle_ai_movement(fox)
             mock_move_with_speed.assert_not_called()
 
@@ -160,3 +167,65 @@ class AICloudShould(unittest.TestCase):
             self.ai_cloud._move_with_speed("down", speed_factor)
 
             self.assertEqual(self.ai_cloud.rect.y, initial_y)
+
+
+class AICloudObservationShould(unittest.TestCase):
+    def setUp(self):
+        get_asset_cache().clear()
+        self.addCleanup(get_asset_cache().clear)
+        self.fox = Mock()
+        self.fox.rect = pygame.Rect(100, 200, 40, 44)
+        self.fox.hitbox = pygame.Rect(105, 207, 30, 30)
+        self.fox.velocity = pygame.math.Vector2(-3, 4)
+
+    def test_observe_describesFoxAndFaceOfPlayer2Cloud(self):
+        ai_cloud = AICloud(headless=True)
+        ai_cloud.adapt_to_difficulty(c.BASE_SPEED, 3)
+
+        observation = ai_cloud._observe(self.fox)
+
+        self.assertEqual("player2", observation.player)
+        self.assertEqual(ai_cloud.hitbox.left, observation.face_x)
+        self.assertEqual(ai_cloud.rect.centery, observation.cloud_y)
+        self.assertEqual((120, 222), (observation.fox_x, observation.fox_y))
+        self.assertEqual((-3, 4), observation.fox_velocity)
+        self.assertEqual((30, 44), (observation.fox_width, observation.fox_height))
+        self.assertEqual(3, observation.level)
+
+    def test_observe_usesRightFace_forPlayer1Cloud(self):
+        ai_cloud = AICloud(headless=True, player="player1")
+
+        observation = ai_cloud._observe(self.fox)
+
+        self.assertEqual("player1", observation.player)
+        self.assertEqual(ai_cloud.hitbox.right, observation.face_x)
+
+    def test_init_enforcesNoBudget_whenHeadless(self):
+        ai_cloud = AICloud(headless=True, budget=100)
+
+        self.assertIsNone(ai_cloud.harness.budget)
+
+    def test_close_closesControllerItCreated(self):
+        controller = Mock()
+        with patch("src.core.ai_cloud.create_controller", return_value=controller):
+            ai_cloud = AICloud(headless=True, controller="remote")
+
+        ai_cloud.close()
+
+        controller.close.assert_called_once()
+
+    def test_close_leavesControllerPassedInOpen(self):
+        controller = Mock()
+        ai_cloud = AICloud(headless=True, controller=controller)
+
+        ai_cloud.close()
+
+        controller.close.assert_not_called()
+
+    def test_reset_resetsLevel(self):
+        ai_cloud = AICloud(headless=True)
+        ai_cloud.adapt_to_difficulty(c.BASE_SPEED, 3)
+
+        ai_cloud.reset()
+
+        self.assertEqual(1, ai_cloud.level)
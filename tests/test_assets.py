@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.utils.assets import AssetCache
+
+import pygame
+
+
+class AssetCacheShould(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "image.png")
+        pygame.image.save(pygame.Surface((20, 10)), self.path)
+        self.asset_cache = AssetCache()
+
+    def test_image_loadsEachImageOnce(self):
+        with patch("pygame.image.load", wraps=pygame.image.load) as load:
+            first = self.asset_cache.image(self.path)
+            second = self.asset_cache.image(self.path)
+
+        self.assertIs(first, second)
+        load.assert_called_once_with(self.path)
+
+    def test_rotated_rotatesOncePerAngle(self):
+        with patch(
+            "pygame.transform.rotozoom", wraps=pygame.transform.rotozoom
+        ) as rotozoom:
+            first = self.asset_cache.rotated(self.path, 90)
+            second = self.asset_cache.rotated(self.path, 90)
+            other = self.asset_cache.rotated(self.path, 45)
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(2, rotozoom.call_count)
+        expected = pygame.transform.rotozoom(self.asset_cache.image(self.path), 90, 1)
+        self.assertEqual(expected.get_size(), first.get_size())
+
+    def test_rotations_rendersOneFramePerStep(self):
+        frames = self.asset_cache.rotations(self.path, 8)
+
+        self.assertEqual(8, len(frames))
+        self.assertIs(frames, self.asset_cache.rotations(self.path, 8))
+        expected = pygame.transform.rotozoom(self.asset_cache.image(self.path), 90, 1)
+        self.assertEqual(expected.get_size(), frames[2].get_size())
+
+    def test_stats_reportsSizeAndLoadTimePerAsset(self):
+        image = self.asset_cache.image(self.path)
+        self.asset_cache.rotated(self.path, 90)
+
+        stats = self.asset_cache.stats()
+
+        self.assertEqual(
+            [("image", True), ("rotozoom", 90)], [entry.transform for entry in stats]
+        )
+        self.assertEqual(image.get_pitch() * 10, stats[0].size)
+        self.assertTrue(all(entry.load_time >= 0 for entry in stats))
+
+    def test_clear_dropsAssets(self):
+        first = self.asset_cache.image(self.path)
+
+        self.asset_cache.clear()
+
+        self.assertEqual(0, self.asset_cache.size)
+        self.assertIsNot(first, self.asset_cache.image(self.path))
@@ -0,0 +1,128 @@
+import unittest
+
+from src.core.ai_cloud import AICloud
+from src.core.batch_simulation import BatchSimulation, _rotated_size
+from src.core.cloud import Cloud
+from src.core.controllers import TrackerController
+from src.core.fox import Fox
+from src.core.simulation import create_headless_game
+from src.utils import constants as c
+
+import numpy as np
+import pygame
+
+
+class BatchSimulationShould(unittest.TestCase):
+    def setUp(self):
+        self.simulation = BatchSimulation(4, seed=0)
+
+    def test_init_startsEveryMatchTheSame(self):
+        self.assertTrue(np.all(self.simulation.fox_x == self.simulation.fox_x[0]))
+        self.assertTrue(np.all(self.simulation.player1_score == 0))
+        self.assertTrue(np.all(self.simulation.level == 1))
+
+    def test_init_readsSpriteSizesFromTheGameSprites(self):
+        fox = Fox(c.BASE_SPEED)
+        cloud1 = Cloud("player1", is_multiplayer=False, headless=True)
+        cloud2 = AICloud(headless=True, controller=TrackerController())
+
+        self.assertEqual(fox.rect.width, self.simulation.fox_image_size)
+        self.assertEqual(
+            cloud1.rect.size,
+            (self.simulation.cloud1_width, self.simulation.cloud1_height),
+        )
+        self.assertEqual(
+            cloud2.rect.size,
+            (self.simulation.cloud2_width, self.simulation.cloud2_height),
+        )
+
+    def test_rotatedSize_matchesRotozoom(self):
+        image = pygame.Surface((64, 64))
+        angle = 0.0
+        for _ in range(1000):
+            angle += 0.1
+            expected = pygame.transform.rotozoom(image, angle, 1).get_width()
+            self.assertEqual(expected, _rotated_size(64, np.array([angle]))[0])
+
+    def test_step_matchesHeadlessGameStateTickForTick(self):
+        # BatchSimulation plays the tracker AI
+        game_state = create_headless_game(opponent="tracker")
+        points = 0
+
+        for _ in range(3000):
+            game_state.update()
+            self.simulation.step()
+            if game_state.player1_score + game_state.player2_score != points:
+                # Serves are random: take the reference serve over
+                points = game_state.player1_score + game_state.player2_score
+                self.simulation.velocity_x[0] = game_state.fox.velocity.x
+                self.simulation.velocity_y[0] = game_state.fox.velocity.y
+                self.simulation.fox_x[0] = game_state.fox.rect.x
+                self.simulation.fox_y[0] = game_state.fox.rect.y
+
+            self.assertEqual(game_state.fox.rect.x, self.simulation.fox_x[0])
+            self.assertEqual(game_state.fox.rect.y, self.simulation.fox_y[0])
+            self.assertEqual(game_state.fox.rect.width, self.simulation.fox_size[0])
+            self.assertEqual(
+                game_state.cloud_player2.rect.y, self.simulation.cloud2_y[0]
+            )
+            self.assertAlmostEqual(
+                game_state.fox.velocity.x, self.simulation.velocity_x[0]
+            )
+            self.assertAlmostEqual(
+                game_state.fox.velocity.y, self.simulation.velocity_y[0]
+            )
+            self.assertEqual(game_state.player1_score, self.simulation.player1_score[0])
+            self.assertEqual(game_state.player2_score, self.simulation.player2_score[0])
+
+        self.assertGreater(points, 0)
+
+    def test_run_raisesDifficulty_whenPointsAreScored(self):
+        self.simulation.run(5000)
+
+        total = self.simulation.player1_score + self.simulation.player2_score
+        self.assertTrue(np.all(total > 0))
+        expected = np.minimum(c.BASE_SPEED + total / 10, c.MAX_SPEED)
+        np.testing.assert_allclose(expected, self.simulation.current_speed)
+
+    def test_run_countsTicks(self):
+        self.simulation.run(10)
+
+        self.assertEqual(10, self.simulation.ticks)
+
+    def test_step_fastFoxBouncesOffCloud_insteadOfPassingThrough(self):
+        size = self.simulation.fox_size
+        self.simulation.fox_x[:] = 140 - size // 2
+        self.simulation.fox_y[:] = (
+            self.simulation.cloud1_y + self.simulation.cloud1_height // 2 - size // 2
+        )
+        self.simulation.velocity_x[:] = -160
+        self.simulation.velocity_y[:] = 0
+
+        self.simulation.step()
+
+        self.assertTrue(np.all(self.simulation.velocity_x > 0))
+        self.assertTrue(np.all(self.simulation.player2_score == 0))
+
+    def test_step_fastFoxFromJustOutsideCloud_bouncesInsteadOfScoring(self):
+        for speed in (35, 100):
+            with self.subTest(speed=speed):
+                simulation = BatchSimulation(4, seed=0)
+                size = simulation.fox_size
+                hitbox_right = (
+                    c.CLOUD_PLAYER1_X
+                    + simulation.cloud1_width
+                    - c.CLOUD_HITBOX_WIDTH_DIFF
+                )
+                diameter = size - c.FOX_HITBOX_DIFF
+                simulation.fox_x[:] = hitbox_right + 1 + diameter // 2 - size // 2
+                simulation.fox_y[:] = (
+                    simulation.cloud1_y + simulation.cloud1_height // 2 - size // 2
+                )
+                simulation.velocity_x[:] = -speed
+                simulation.velocity_y[:] = 0
+
+                simulation.step()
+
+                self.assertTrue(np.all(simulation.velocity_x > 0))
+                self.assertTrue(np.all(simulation.player2_score == 0))
@@ -3,12 +3,15 @@ from unittest.mock import Mock, PropertyMock, patch
 
 from src.core.bonus_star import BonusStar
 from src.utils import constants as c
+from src.utils.assets import get_asset_cache
 
 
 class BonusStarShould(unittest.TestCase):
     @patch("pygame.transform.rotozoom")
     @patch("pygame.image.load")
     def setUp(self, mock_load, mock_rotozoom):
+        get_asset_cache().clear()
+        self.addCleanup(get_asset_cache().clear)
         mock_surface = Mock()
         mock_converted_surface = Mock()
         mock_rotated_surface = Mock()
@@ -2,7 +2,9 @@ import unittest
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 from src.core.cloud import Cloud
+from src.core.input import InputSnapshot
 from src.utils import constants as c
+from src.utils.assets import get_asset_cache
 
 import pygame
 
@@ -11,6 +13,8 @@ class CloudShould(unittest.TestCase):
     @patch("pygame.transform.rotozoom")
     @patch("pygame.image.load")
     def setUp(self, mock_load, mock_rotozoom):
+        get_asset_cache().clear()
+        self.addCleanup(get_asset_cache().clear)
         mock_surface = Mock()
         mock_converted_surface = Mock()
         mock_rotated_surface = Mock()
@@ -21,7 +25,7 @@ class CloudShould(unittest.TestCase):
 
         mock_rotated_surface.get_rect.return_value = Mock()
 
-        self.cloud = Cloud("player1")
+        self.cloud = Cloud("player1", is_multiplayer=False)
 
     def test_init_initializesSuccessfully(self):
         self.assertIsNotNone(self.cloud)
@@ -33,7 +37,7 @@ class CloudShould(unittest.TestCase):
         self.assertEqual(0, self.cloud.collision_cooldown)
 
     def test_init_setsShakeDuration(self):
-        self.assertEqual(20, self.cloud.shake_duration)
+        self.assertEqual(30, self.cloud.shake_duration)
 
     def test_init_setsShakeIntensity(self):
         self.assertEqual(1, self.cloud.shake_intensity)
@@ -57,63 +61,43 @@ class CloudShould(unittest.TestCase):
         self.assertIsNotNone(self.cloud.rect)
 
     def test_hitbox_returnsCorrectHitbox(self):
-        mock_rect = Mock()
-        mock_rect.width = 100
-        mock_rect.height = 80
-        mock_rect.center = (50, 40)
-        mock_rect.left = 0
-
-        mock_copy = Mock()
-        mock_rect.copy.return_value = mock_copy
-
-        self.cloud.rect = mock_rect
-        self.cloud.player = "player1"
+        self.cloud.rect = pygame.Rect(0, 0, 100, 80)
+        self.cloud._player = "player1"
 
-        _ = self.cloud.hitbox
-        mock_rect.copy.assert_called_once()
+        hitbox = self.cloud.hitbox
 
-        self.assertEqual(mock_rect.width - c.CLOUD_HITBOX_WIDTH_DIFF, mock_copy.width)
-        self.assertEqual(
-            mock_rect.height + c.CLOUD_HITBOX_HEIGHT_DIFF, mock_copy.height
-        )
-        self.assertEqual(mock_rect.left, mock_copy.left)
+        self.assertEqual(100 - c.CLOUD_HITBOX_WIDTH_DIFF, hitbox.width)
+        self.assertEqual(80 + c.CLOUD_HITBOX_HEIGHT_DIFF, hitbox.height)
+        self.assertEqual(self.cloud.rect.left, hitbox.left)
+        self.assertEqual(self.cloud.rect.centery, hitbox.centery)
 
     def test_update_callsUpdateShake(self):
         with (
             patch.object(self.cloud, "update_shake") as mock_update_shake,
-            patch("pygame.key.get_pressed"),
             patch.object(self.cloud, "move"),
         ):
-            self.cloud.update(Mock())
+            self.cloud.update(Mock(), InputSnapshot())
             mock_update_shake.assert_called_once()
 
     def test_update_movesCloudUp(self):
-        self.cloud.player = "player1"
+        self.cloud._player = "player1"
         self.cloud.move = Mock()
 
-        keys = [0] * 500
-        keys[pygame.K_w] = 1
+        inputs = InputSnapshot(pressed=frozenset({pygame.K_w}))
 
-        with (
-            patch.object(self.cloud, "update_shake"),
-            patch("pygame.key.get_pressed", return_value=keys),
-        ):
-            self.cloud.update(Mock())
+        with patch.object(self.cloud, "update_shake"):
+            self.cloud.update(Mock(), inputs)
 
         self.cloud.move.assert_called_once_with("up")
 
     def test_update_movesCloudDown(self):
-        self.cloud.player = "player1"
+        self.cloud._player = "player1"
         self.cloud.move = Mock()
 
-        keys = [0] * 500
-        keys[pygame.K_s] = 1
+        inputs = InputSnapshot(pressed=frozenset({pygame.K_s}))
 
-        with (
-            patch.object(self.cloud, "update_shake"),
-            patch("pygame.key.get_pressed", return_value=keys),
-        ):
-            self.cloud.update(Mock())
+        with patch.object(self.cloud, "update_shake"):
+            self.cloud.update(Mock(), inputs)
 
         self.cloud.move.assert_called_once_with("down")
 
@@ -228,12 +212,12 @@ class CloudShould(unittest.TestCase):
             self.assertTrue(self.cloud.handle_fox_collision(fox))
 
     def test_initCollisionState_setsIsShakingToTrue(self):
-        self.cloud.is_shaking = False
+        self.cloud._is_shaking = False
         self.cloud._init_collision_state()
         self.assertTrue(self.cloud.is_shaking)
 
     def test_initCollisionState_setsShakeStartToCurrentTime(self):
-        self.cloud.shake_start = 0
+        self.cloud._shake_start = 0
         self.cloud._init_collision_state()
         self.assertEqual(pygame.time.get_ticks(), self.cloud.shake_start)
 
@@ -299,7 +283,7 @@ class CloudShould(unittest.TestCase):
     def test_isValidSideHit_returnsTrue_whenPlayer1AndFoxIsToRight(self):
         fox = Mock()
         fox.hitbox.centerx = 100
-        self.cloud.player = "player1"
+        self.cloud._player = "player1"
 
         mock_rect = MagicMock()
         mock_rect.width = 100
@@ -316,7 +300,7 @@ class CloudShould(unittest.TestCase):
     def test_isValidSideHit_returnsFalse_whenPlayer1AndFoxIsToLeft(self):
         fox = Mock()
         fox.hitbox.centerx = 50
-        self.cloud.player = "player1"
+        self.cloud._player = "player1"
 
         mock_rect = MagicMock()
         mock_rect.width = 100
@@ -333,7 +317,7 @@ class CloudShould(unittest.TestCase):
     def test_isValidSideHit_returnsTrue_whenPlayer2AndFoxIsToLeft(self):
         fox = Mock()
         fox.hitbox.centerx = 50
-        self.cloud.player = "player2"
+        self.cloud._player = "player2"
 
         mock_rect = MagicMock()
         mock_rect.width = 100
@@ -350,7 +334,7 @@ class CloudShould(unittest.TestCase):
     def test_isValidSideHit_returnsFalse_whenPlayer2AndFoxIsToRight(self):
         fox = Mock()
         fox.hitbox.centerx = 100
-        self.cloud.player = "player2"
+        self.cloud._player = "player2"
 
         mock_rect = MagicMock()
         mock_rect.width = 100
@@ -365,7 +349,7 @@ class CloudShould(unittest.TestCase):
             self.assertFalse(result)
 
     def test_applySideBounce_setsPositiveVelocityX_whenPlayer1(self):
-        self.cloud.player = "player1"
+        self.cloud._player = "player1"
         fox = MagicMock()
         fox.velocity.x = -5
         fox.velocity.length.return_value = 10
@@ -379,7 +363,7 @@ class CloudShould(unittest.TestCase):
             fox.velocity.scale_to_length.assert_called_once_with(10)
 
     def test_applySideBounce_setsNegativeVelocityX_whenPlayer2(self):
-        self.cloud.player = "player2"
+        self.cloud._player = "player2"
         fox = MagicMock()
         fox.velocity.x = 5
         fox.velocity.length.return_value = 10
@@ -392,7 +376,7 @@ class CloudShould(unittest.TestCase):
             fox.velocity.scale_to_length.assert_called_once_with(10)
 
     def test_applySideBounce_scalesVelocityToOriginalLength(self):
-        self.cloud.player = "player1"
+        self.cloud._player = "player1"
         fox = MagicMock()
         fox.velocity.x = 3
         fox.velocity.length.return_value = 5
@@ -404,7 +388,7 @@ class CloudShould(unittest.TestCase):
             fox.velocity.scale_to_length.assert_called_once_with(5)
 
     def test_applySideBounce_usesCalculatedVerticalBounce(self):
-        self.cloud.player = "player1"
+        self.cloud._player = "player1"
         fox = MagicMock()
         expected_bounce = 2.5
 
@@ -481,7 +465,7 @@ class CloudShould(unittest.TestCase):
             self.assertEqual(expected_bounce, result)
 
     def test_fixInvalidSideHit_setsPositiveVelocityX_whenPlayer1AndFoxRight(self):
-        self.cloud.player = "player1"
+        self.cloud._player = "player1"
         fox = MagicMock()
         fox.velocity.x = -5
 
@@ -496,7 +480,7 @@ class CloudShould(unittest.TestCase):
             self.assertEqual(5, fox.velocity.x)
 
     def test_fixInvalidSideHit_setsNegativeVelocityX_whenPlayer2AndFoxLeft(self):
-        self.cloud.player = "player2"
+        self.cloud._player = "player2"
         fox = MagicMock()
         fox.velocity.x = 5
 
@@ -547,7 +531,7 @@ class CloudShould(unittest.TestCase):
             self.assertEqual(3, self.cloud.collision_cooldown)
 
     def test_reset_resetsPositionAndCooldown(self):
-        self.cloud.collision_cooldown = 5
+        self.cloud._collision_cooldown = 5
         mock_set_position = MagicMock()
         self.cloud._set_position = mock_set_position
 
@@ -557,9 +541,11 @@ class CloudShould(unittest.TestCase):
         self.assertEqual(0, self.cloud.collision_cooldown)
 
     def test_updateShake_stopsShakingAfterDuration(self):
-        self.cloud.is_shaking = True
-        self.cloud.shake_start = pygame.time.get_ticks() - self.cloud.shake_duration - 1
-        self.cloud.original_pos = MagicMock()
+        self.cloud._is_shaking = True
+        self.cloud._shake_start = (
+            pygame.time.get_ticks() - self.cloud.shake_duration - 1
+        )
+        self.cloud._original_pos = MagicMock()
         self.cloud.original_pos.center = (100, 100)
 
         self.cloud.update_shake()
@@ -569,9 +555,9 @@ class CloudShould(unittest.TestCase):
 
     @patch("random.randint")
     def test_updateShake_appliesRandomOffset(self, mock_randint):
-        self.cloud.is_shaking = True
-        self.cloud.shake_start = pygame.time.get_ticks()
-        self.cloud.original_pos = MagicMock()
+        self.cloud._is_shaking = True
+        self.cloud._shake_start = pygame.time.get_ticks()
+        self.cloud._original_pos = MagicMock()
         self.cloud.original_pos.centerx = 100
         self.cloud.original_pos.centery = 100
         mock_randint.side_effect = [2, -3]  # За x и y offset
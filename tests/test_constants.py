@@ -0,0 +1,10 @@
+import unittest
+
+from src.utils import constants as c
+
+import pygame
+
+
+class ConstantsShould(unittest.TestCase):
+    def test_userEvent_matchesPygame(self):
+        self.assertEqual(pygame.USEREVENT, c.USEREVENT)
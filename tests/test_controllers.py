@@ -0,0 +1,266 @@
+import random
+import unittest
+from unittest.mock import Mock, patch
+
+from src.core.controllers import (
+    CONTROLLERS,
+    ControllerHarness,
+    Observation,
+    PredictiveController,
+    RandomController,
+    ReplayController,
+    TrackerController,
+    create_controller,
+    intercept_y,
+    register_controller,
+)
+from src.utils import constants as c
+
+FACE_X = 700
+
+
+def observe(
+    fox: tuple[float, float] = (400, 200),
+    velocity: tuple[float, float] = (10, 3),
+    cloud_y: float = c.CLOUD_Y,
+    player: str = "player2",
+    face_x: float = FACE_X,
+    level: int = 1,
+) -> Observation:
+    return Observation(
+        player=player,
+        cloud_y=cloud_y,
+        face_x=face_x,
+        fox_x=fox[0],
+        fox_y=fox[1],
+        fox_velocity=velocity,
+        fox_width=30,
+        fox_height=40,
+        level=level,
+    )
+
+
+class TrackerControllerShould(unittest.TestCase):
+    def setUp(self):
+        self.controller = TrackerController()
+
+    def test_init_setsDeadZoneAndReactionDelay(self):
+        self.assertEqual(10, self.controller.dead_zone)
+        self.assertEqual(2, self.controller.reaction_delay)
+        self.assertEqual(0, self.controller.delay_counter)
+
+    def test_decide_holdsStill_untilReactionDelayPassed(self):
+        self.controller.observe(observe(fox=(0, -100), cloud_y=10))
+
+        self.assertEqual(0, self.controller.decide())
+        self.assertEqual(1, self.controller.delay_counter)
+
+    def test_decide_resetsDelayCounter_whenItMoves(self):
+        self.controller.observe(observe(fox=(0, 110), cloud_y=10))
+        self.controller.decide()
+
+        self.assertEqual(1.0, self.controller.decide())
+        self.assertEqual(0, self.controller.delay_counter)
+
+    def test_decide_movesUp_slowingDownCloseToFox(self):
+        self.controller.observe(observe(fox=(0, -40), cloud_y=10))
+        self.controller.decide()
+
+        self.assertEqual(-0.5, self.controller.decide())
+
+    def test_decide_holdsStill_whenFoxIsWithinDeadZone(self):
+        self.controller.observe(observe(fox=(0, 20), cloud_y=10))
+        self.controller.decide()
+
+        self.assertEqual(0, self.controller.decide())
+
+
+class InterceptYShould(unittest.TestCase):
+    def test_interceptY_keepsHeightBetweenWalls(self):
+        self.assertEqual(100, intercept_y(100, 20))
+
+    def test_interceptY_foldsBounceOffEachWall(self):
+        self.assertEqual(50, intercept_y(-10, 20))
+        self.assertEqual(c.HEIGHT - 50, intercept_y(c.HEIGHT + 10, 20))
+        self.assertEqual(100, intercept_y(100 + 2 * (c.HEIGHT - 40), 20))
+
+
+class PredictiveControllerShould(unittest.TestCase):
+    def setUp(self):
+        self.controller = PredictiveController(seed=0)
+
+    def solve(self, observation: Observation) -> float:
+        # A fox already heading toward the cloud: no new aiming error
+        self.controller._solved_for = (observation.fox_velocity[0], 0.0)
+        self.controller._error = 0.0
+        self.controller.observe(observation)
+        return self.controller.target_y
+
+    def test_observe_aimsAtStraightCrossing(self):
+        contact_x = FACE_X - 15
+
+        target_y = self.solve(observe(fox=(contact_x - 100, 200), velocity=(10, 3)))
+
+        self.assertAlmostEqual(230, target_y)
+
+    def test_observe_aimsAtCrossingAfterWallBounce(self):
+        contact_x = FACE_X - 15
+
+        target_y = self.solve(observe(fox=(contact_x - 100, 40), velocity=(10, -4)))
+
+        # Flies 40 up to y = 0, bounces off the top at y = 20 and comes back
+        self.assertAlmostEqual(20 + 20, target_y)
+
+    def test_observe_aimsAtCrossingOnLeftSide_forPlayer1(self):
+        contact_x = 100 + 15
+
+        target_y = self.solve(
+            observe(
+                fox=(contact_x + 100, 200),
+                velocity=(-10, 3),
+                player="player1",
+                face_x=100,
+            )
+        )
+
+        self.assertAlmostEqual(230, target_y)
+
+    def test_observe_aimsAtMiddle_whenFoxFliesAway(self):
+        target_y = self.solve(observe(velocity=(-10, 4)))
+
+        self.assertEqual(c.HEIGHT // 2, target_y)
+
+    def test_observe_solvesOncePerVelocity(self):
+        with patch.object(
+            self.controller, "_solve_target", wraps=self.controller._solve_target
+        ) as solve:
+            for x in range(100, 150, 10):
+                self.controller.observe(observe(fox=(x, 200), velocity=(10, 3)))
+                self.controller.decide()
+            self.controller.observe(observe(fox=(150, 200), velocity=(10, -3)))
+
+        self.assertEqual(2, solve.call_count)
+
+    def test_decide_movesTowardTarget(self):
+        self.solve(observe(fox=(FACE_X - 115, c.HEIGHT - 60), velocity=(10, 1)))
+
+        self.assertGreater(self.controller.decide(), 0)
+
+    def test_errorSpread_narrowsWithLevel_downToMinimum(self):
+        self.assertEqual(c.AI_PREDICTION_ERROR, self.controller.error_spread)
+
+        self.controller.observe(observe(level=2))
+        self.assertEqual(
+            c.AI_PREDICTION_ERROR - c.AI_PREDICTION_ERROR_STEP,
+            self.controller.error_spread,
+        )
+
+        self.controller.observe(observe(level=1000))
+        self.assertEqual(c.AI_PREDICTION_ERROR_MIN, self.controller.error_spread)
+
+    def test_observe_drawsNewError_onlyWhenFoxTurnsTowardCloud(self):
+        self.controller.observe(observe(velocity=(10, 3)))
+        error = self.controller._error
+
+        self.controller.observe(observe(velocity=(10, -3)))
+        self.assertEqual(error, self.controller._error)
+
+        self.controller.observe(observe(velocity=(-10, -3)))
+        self.controller.observe(observe(velocity=(10, -3)))
+        self.assertNotEqual(error, self.controller._error)
+
+    def test_init_seedsErrorFromRandomModule_whenNoSeedGiven(self):
+        errors = []
+        for _ in range(2):
+            random.seed(0)
+            controller = PredictiveController()
+            controller.observe(observe(velocity=(10, 3)))
+            errors.append(controller._error)
+
+        self.assertEqual(errors[0], errors[1])
+
+
+class RandomControllerShould(unittest.TestCase):
+    def test_decide_holdsEachMoveForSomeTicks(self):
+        controller = RandomController(hold=3, seed=0)
+
+        moves = [controller.decide() for _ in range(6)]
+
+        self.assertEqual(1, len(set(moves[:3])))
+        self.assertNotEqual(moves[0], moves[3])
+        self.assertTrue(all(-1 <= move <= 1 for move in moves))
+
+    def test_decide_repeatsForSameSeed(self):
+        first = RandomController(seed=1)
+        second = RandomController(seed=1)
+
+        self.assertEqual(
+            [first.decide() for _ in range(50)], [second.decide() for _ in range(50)]
+        )
+
+
+class ReplayControllerShould(unittest.TestCase):
+    def test_decide_playsMovesInOrder_thenHoldsStill(self):
+        controller = ReplayController((1.0, -0.5))
+
+        self.assertEqual([1.0, -0.5, 0.0], [controller.decide() for _ in range(3)])
+
+    def test_decide_startsOver_whenLooping(self):
+        controller = ReplayController((1.0, -0.5), loop=True)
+
+        self.assertEqual([1.0, -0.5, 1.0], [controller.decide() for _ in range(3)])
+
+
+class ControllerRegistryShould(unittest.TestCase):
+    def test_createController_createsBuiltInControllers(self):
+        self.assertIsInstance(create_controller("tracker"), TrackerController)
+        self.assertIsInstance(create_controller("predictive"), PredictiveController)
+        self.assertIsInstance(create_controller("random"), RandomController)
+        self.assertIsInstance(create_controller("replay"), ReplayController)
+
+    def test_createController_passesOptions(self):
+        controller = create_controller("tracker", dead_zone=3)
+
+        self.assertEqual(3, controller.dead_zone)
+
+    def test_createController_raisesValueError_forUnknownName(self):
+        with self.assertRaises(ValueError):
+            create_controller("unknown")
+
+    def test_registerController_makesControllerAvailableByName(self):
+        self.addCleanup(CONTROLLERS.pop, "still", None)
+
+        register_controller("still", lambda: ReplayController())
+
+        self.assertIsInstance(create_controller("still"), ReplayController)
+
+
+class ControllerHarnessShould(unittest.TestCase):
+    def setUp(self):
+        self.controller = Mock()
+        self.controller.decide.side_effect = [1.0, -1.0]
+        self.observation = observe()
+
+    def test_decide_returnsDecision_andTimesIt(self):
+        harness = ControllerHarness(self.controller, budget=None)
+
+        self.assertEqual(1.0, harness.decide(self.observation))
+        self.controller.observe.assert_called_once_with(self.observation)
+        self.assertEqual(1, harness.decisions)
+        self.assertEqual(1, harness.timings.count)
+        self.assertEqual(0, harness.overruns)
+
+    @patch("src.core.controllers.time.perf_counter")
+    def test_decide_keepsPreviousDecision_whenOverBudget(self, perf_counter):
+        # 10 us for the first decision, 500 us for the second
+        perf_counter.side_effect = [0.0, 10e-6, 1.0, 1.0 + 500e-6]
+        harness = ControllerHarness(self.controller, budget=100)
+
+        harness.decide(self.observation)
+        decision = harness.decide(self.observation)
+
+        self.assertEqual(1.0, decision)
+        self.assertEqual(1.0, harness.decision)
+        self.assertEqual(1, harness.overruns)
+        self.assertEqual(2, harness.decisions)
+        self.assertAlmostEqual(500e-6, harness.timings.worst)
@@ -0,0 +1,34 @@
+import io
+import unittest
+
+from src.core.controllers import Observation
+from src.core.echo_bot import answer, serve
+from src.core.remote_controller import decode_move, encode_observation
+
+OBSERVATION = Observation(
+    player="player2",
+    cloud_y=240,
+    face_x=600,
+    fox_x=300,
+    fox_y=190,
+    fox_velocity=(5.5, -3.25),
+    fox_width=30,
+    fox_height=44,
+)
+
+
+class EchoBotShould(unittest.TestCase):
+    def test_answer_headsForFox_slowingDownCloseToIt(self):
+        self.assertEqual(-0.5, answer(OBSERVATION))
+
+    def test_serve_answersEveryObservation_untilGameHangsUp(self):
+        reader = io.BytesIO(
+            encode_observation(1, OBSERVATION) + encode_observation(2, OBSERVATION)
+        )
+        writer = io.BytesIO()
+
+        serve(reader, writer)
+
+        moves = writer.getvalue()
+        self.assertEqual((1, -0.5), decode_move(moves[:8]))
+        self.assertEqual((2, -0.5), decode_move(moves[8:]))
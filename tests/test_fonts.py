@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import patch
+
+from src.ui.fonts import FontLoader
+
+import pygame
+
+
+class FontLoaderShould(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.font_files = {
+            ("courier new", False): "assets/fonts/DejaVuSansMono.ttf",
+            ("courier new", True): "assets/fonts/DejaVuSansMono-Bold.ttf",
+        }
+
+    def test_get_loadsBundledFileOnce(self):
+        font_loader = FontLoader(self.font_files)
+
+        with patch("pygame.font.Font", wraps=pygame.font.Font) as font:
+            first = font_loader.get("Courier New", 20)
+            second = font_loader.get("courier new", 20)
+
+        self.assertIs(first, second)
+        font.assert_called_once_with("assets/fonts/DejaVuSansMono.ttf", 20)
+
+    def test_get_loadsBoldFile_whenBundled(self):
+        font_loader = FontLoader(self.font_files)
+
+        with patch("pygame.font.Font", wraps=pygame.font.Font) as font:
+            font_loader.get("courier new", 20, bold=True)
+
+        font.assert_called_once_with("assets/fonts/DejaVuSansMono-Bold.ttf", 20)
+
+    def test_get_usesBuiltInFont_withoutBundledFile(self):
+        font_loader = FontLoader(self.font_files)
+
+        with (
+            patch("pygame.font.Font", wraps=pygame.font.Font) as font,
+            patch("pygame.font.SysFont") as sys_font,
+        ):
+            bold = font_loader.get("arial", 20, bold=True)
+
+        font.assert_called_once_with(None, 20)
+        sys_font.assert_not_called()
+        self.assertTrue(bold.bold)
+
+    def test_get_usesSystemFont_whenConfigured(self):
+        font_loader = FontLoader(self.font_files, system_fallback=True)
+
+        with patch("pygame.font.SysFont") as sys_font:
+            font_loader.get("arial", 20)
+
+        sys_font.assert_called_once_with("arial", 20, bold=False)
@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch
 
 from src.core.fox import Fox
 from src.utils import constants as c
+from src.utils.assets import get_asset_cache
 
 import pygame
 
@@ -79,23 +80,57 @@ class FoxShould(unittest.TestCase):
         self.assertEqual(1, self.fox.rect.y)
 
     def test_rotateImage_rotatesImage(self):
-        self.fox.original_image = pygame.Surface((64, 64))
-        self.fox.image = self.fox.original_image
+        self.fox._build_rotation_frames()
+        self.fox.image = self.fox.rotation_frames[0]
         self.fox.rect = self.fox.image.get_rect()
         self.fox.rect.center = (c.WIDTH // 2, c.HEIGHT // 2)
-        self.fox.angle = 0
+        self.fox.angle = 360 / c.FOX_ROTATION_STEPS - c.FOX_SPIN_SPEED
 
         self.fox._rotate_image()
 
-        self.assertNotEqual(self.fox.image, self.fox.original_image)
+        self.assertIs(self.fox.rotation_frames[1], self.fox.image)
         self.assertNotEqual(self.fox.rect, self.fox.image.get_rect())
 
+    def test_buildRotationFrames_rendersOneFramePerStep(self):
+        self.fox._build_rotation_frames()
+
+        self.assertEqual(c.FOX_ROTATION_STEPS, len(self.fox.rotation_frames))
+
+    def test_buildRotationFrames_sharesCachedFrames(self):
+        self.fox._build_rotation_frames()
+
+        frames = get_asset_cache().rotations(
+            "assets/images/fox.png", c.FOX_ROTATION_STEPS
+        )
+        self.assertIs(frames, self.fox.rotation_frames)
+
+    def test_rotateImage_usesNearestFrameAndKeepsCenter(self):
+        self.fox._build_rotation_frames()
+        self.fox.rect = self.fox.rotation_frames[0].get_rect(center=(100, 100))
+        self.fox.angle = 45 - c.FOX_SPIN_SPEED
+
+        self.fox._rotate_image()
+
+        frame = round(45 * c.FOX_ROTATION_STEPS / 360)
+        self.assertIs(self.fox.rotation_frames[frame], self.fox.image)
+        self.assertEqual((100, 100), self.fox.rect.center)
+
+    def test_rotateImage_wrapsAngle(self):
+        self.fox._build_rotation_frames()
+        self.fox.rect = self.fox.rotation_frames[0].get_rect()
+        self.fox.angle = 359.95
+
+        self.fox._rotate_image()
+
+        self.assertLess(self.fox.angle, 360)
+        self.assertIs(self.fox.rotation_frames[0], self.fox.image)
+
     def test_checkForCollision_returnsPlayer1_whenFoxIsOutOfBounds(self):
         self.fox.rect.left = c.WIDTH + 10
         self.fox.rect.right = 0
 
         sound_manager = Mock()
-        sound_manager.play_sound = Mock()
+        sound_manager.queue_sound = Mock()
 
         result = self.fox._check_for_collision(sound_manager)
 
@@ -106,7 +141,7 @@ class FoxShould(unittest.TestCase):
         self.fox.rect.right = -10
 
         sound_manager = Mock()
-        sound_manager.play_sound = Mock()
+        sound_manager.queue_sound = Mock()
 
         result = self.fox._check_for_collision(sound_manager)
 
@@ -117,18 +152,18 @@ class FoxShould(unittest.TestCase):
         self.fox.rect.right = -10
 
         sound_manager = Mock()
-        sound_manager.play_sound = Mock()
+        sound_manager.queue_sound = Mock()
 
         self.fox._check_for_collision(sound_manager)
 
-        sound_manager.play_sound.assert_called_once()
+        sound_manager.queue_sound.assert_called_once()
 
     def test_checkForCollision_returnsNone_whenFoxIsNotOutOfBounds(self):
         self.fox.rect.left = 0
         self.fox.rect.right = c.WIDTH
 
         sound_manager = Mock()
-        sound_manager.play_sound = Mock()
+        sound_manager.queue_sound = Mock()
 
         result = self.fox._check_for_collision(sound_manager)
 
@@ -111,6 +111,31 @@ class GameStateShould(unittest.TestCase):
             mock_check_for_fox_cloud_collision.assert_called_once()
             mock_check_for_bonus_star_fox_collision.assert_called_once()
 
+    def test_update_updatesEachCloudOncePerTick(self):
+        game_state = GameState()
+        game_state._current_state = c.GameStates.PLAYING
+        game_state.fox.update.return_value = None
+        game_state.bonus_star.handle_fox_collision.return_value = 0
+        game_state.cloud_player1.handle_fox_collision.return_value = False
+        game_state.cloud_player2.handle_fox_collision.return_value = False
+
+        game_state.update()
+
+        game_state.cloud_player1.update.assert_called_once()
+        game_state.cloud_player2.update.assert_called_once()
+        game_state.fox.update.assert_called_once()
+        game_state.bonus_star.particle_system.update.assert_called_once()
+        self.assertEqual(1, game_state.scheduler.ticks)
+
+    def test_update_runsNoPhase_whenCurrentStateIsNotPlaying(self):
+        game_state = GameState()
+        game_state._current_state = c.GameStates.PAUSED
+
+        game_state.update()
+
+        self.assertEqual(0, game_state.scheduler.ticks)
+        game_state.bonus_star.particle_system.update.assert_not_called()
+
     def test_setState_setsCurrentState(self):
         game_state = GameState()
 
@@ -118,6 +143,44 @@ class GameStateShould(unittest.TestCase):
 
         self.assertEqual(game_state._current_state, c.GameStates.PLAYING)
 
+    def test_update_storesPreviousCenters_whenCurrentStateIsNotPlaying(self):
+        game_state = GameState()
+        game_state.fox.rect.center = (10, 20)
+
+        game_state.update()
+
+        self.assertEqual((10, 20), game_state._previous_centers[game_state.fox])
+
+    def test_interpolatedCenter_returnsPointBetweenTicks(self):
+        game_state = GameState()
+        sprite = Mock()
+        game_state._previous_centers[sprite] = (0, 0)
+        sprite.rect.center = (10, 20)
+
+        center = game_state.interpolated_center(sprite, 0.5)
+
+        self.assertEqual((5, 10), center)
+
+    def test_spawnBonusStar_drawsStarWhereItSpawned(self):
+        game_state = GameState()
+        star = game_state.bonus_star
+        game_state._previous_centers[star] = (0, 0)
+        star.spawn.side_effect = lambda: setattr(star.rect, "center", (187, 341))
+
+        game_state.spawn_bonus_star()
+
+        star.spawn.assert_called_once()
+        self.assertEqual((187, 341), game_state.interpolated_center(star, 0.25))
+
+    def test_interpolatedCenter_returnsCurrentCenter_whenNoPreviousTick(self):
+        game_state = GameState()
+        sprite = Mock()
+        sprite.rect.center = (10, 20)
+
+        center = game_state.interpolated_center(sprite, 0.5)
+
+        self.assertEqual((10, 20), center)
+
     def test_checkForWinner_increasesPlayer1Score_whenWinnerIsPlayer1(self):
         game_state = GameState()
 
@@ -156,6 +219,18 @@ class GameStateShould(unittest.TestCase):
 
             mock_play_again.assert_called_once()
 
+    def test_init_createsAiCloud_withOpponentController(self):
+        game_state = GameState(opponent="tracker")
+
+        self.ai_cloud_mock.assert_called_once_with(False, "tracker")
+        self.assertIs(self.ai_cloud_mock.return_value, game_state.cloud_player2)
+
+    def test_init_createsAiCloudForPlayer1_whenPlayer1ControllerIsSet(self):
+        game_state = GameState(player1="random")
+
+        self.ai_cloud_mock.assert_any_call(False, "random", player="player1")
+        self.assertIs(self.ai_cloud_mock.return_value, game_state.cloud_player1)
+
     def test_checkForWinner_increasesPlayer2Score_whenWinnerIsPlayer2(self):
         game_state = GameState()
 
@@ -209,6 +284,33 @@ class GameStateShould(unittest.TestCase):
         self.assertEqual(game_state.current_speed, c.BASE_SPEED)
         self.assertEqual(level, floor(c.BASE_SPEED) - 5)
 
+    def test_toggleMultiplayer_closesReplacedCloud(self):
+        game_state = GameState()
+        ai_cloud = game_state.cloud_player2
+
+        game_state.toggle_multiplayer()
+
+        ai_cloud.close.assert_called_once()
+
+    def test_close_closesBothClouds(self):
+        game_state = GameState()
+
+        game_state.close()
+
+        game_state.cloud_player1.close.assert_called_once()
+        game_state.cloud_player2.close.assert_called_once()
+
+    def test_gameDifficultyUpdate_adaptsBothClouds(self):
+        game_state = GameState()
+        game_state.player1_score = 10
+
+        level = game_state._game_difficulty_update()
+
+        for cloud in (game_state.cloud_player1, game_state.cloud_player2):
+            cloud.adapt_to_difficulty.assert_called_once_with(
+                game_state.current_speed, level
+            )
+
     def test_checkForFoxCloudCollision_handlesPlayer1Collision(self):
         game_state = GameState()
         game_state.cloud_player1.handle_fox_collision.return_value = True
@@ -217,7 +319,7 @@ class GameStateShould(unittest.TestCase):
         game_state._check_for_fox_cloud_collision()
 
         self.assertEqual(game_state._last_player, game_state.player1_score)
-        game_state.sound_manager.play_sound.assert_called_once_with("fox-bounce")
+        game_state.sound_manager.queue_sound.assert_called_once_with("fox-bounce")
         self.assertTrue(game_state.is_first_throw)
         game_state.fox.velocity.scale_to_length.assert_called_once_with(
             game_state.current_speed
@@ -232,7 +334,7 @@ class GameStateShould(unittest.TestCase):
         game_state._check_for_fox_cloud_collision()
 
         self.assertEqual(game_state._last_player, game_state.player2_score)
-        game_state.sound_manager.play_sound.assert_called_once_with("fox-bounce")
+        game_state.sound_manager.queue_sound.assert_called_once_with("fox-bounce")
         self.assertTrue(game_state.is_first_throw)
         game_state.fox.velocity.scale_to_length.assert_called_once_with(
             game_state.current_speed
@@ -249,7 +351,7 @@ class GameStateShould(unittest.TestCase):
         game_state._check_for_bonus_star_fox_collision()
 
         self.assertEqual(game_state.player1_score, initial_score + 2)
-        game_state.sound_manager.play_sound.assert_called_once_with("bonus-collect")
+        game_state.sound_manager.queue_sound.assert_called_once_with("bonus-collect")
 
     def test_playAgain_resetsPositionAndDespawnsStar(self):
         game_state = GameState()
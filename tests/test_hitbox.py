@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import Mock
+
+from src.core.hitbox import HitboxCache, time_of_impact
+
+import pygame
+
+
+def shrink(rect: pygame.Rect, box: pygame.Rect) -> None:
+    box.size = (rect.width - 2, rect.height - 2)
+    box.center = rect.center
+
+
+class HitboxCacheShould(unittest.TestCase):
+    def setUp(self):
+        self.build = Mock(side_effect=shrink)
+        self.cache = HitboxCache(self.build)
+        self.rect = pygame.Rect(10, 10, 20, 20)
+
+    def test_get_buildsHitboxFromRect(self):
+        self.assertEqual(pygame.Rect(11, 11, 18, 18), self.cache.get(self.rect))
+
+    def test_get_reusesHitbox_whileRectIsUnchanged(self):
+        first = self.cache.get(self.rect)
+        second = self.cache.get(self.rect)
+
+        self.assertIs(first, second)
+        self.assertEqual(1, self.cache.builds)
+
+    def test_get_rebuilds_whenRectMovesInPlace(self):
+        self.cache.get(self.rect)
+
+        self.rect.x += 5
+
+        self.assertEqual(pygame.Rect(16, 11, 18, 18), self.cache.get(self.rect))
+        self.assertEqual(2, self.cache.builds)
+
+    def test_get_rebuilds_whenRectIsReplacedBySizeChange(self):
+        self.cache.get(self.rect)
+
+        rect = pygame.Rect(0, 0, 24, 24)
+        rect.center = self.rect.center
+
+        self.assertEqual(22, self.cache.get(rect).width)
+
+    def test_invalidate_rebuildsOnNextRead(self):
+        self.cache.get(self.rect)
+
+        self.cache.invalidate()
+        self.cache.get(self.rect)
+
+        self.assertEqual(2, self.build.call_count)
+
+
+class TimeOfImpactShould(unittest.TestCase):
+    def setUp(self):
+        self.target = pygame.Rect(100, 100, 10, 50)
+
+    def test_timeOfImpact_catchesBoxThatPassedThroughTarget(self):
+        box = pygame.Rect(40, 110, 20, 20)  # moved 100 to the left
+
+        self.assertEqual((0.3, "x"), time_of_impact(box, -100, 0, self.target))
+
+    def test_timeOfImpact_findsVerticalHit(self):
+        box = pygame.Rect(95, 140, 20, 20)  # moved 80 down
+
+        self.assertEqual((0.25, "y"), time_of_impact(box, 0, 80, self.target))
+
+    def test_timeOfImpact_missesBoxThatPassedBeside(self):
+        box = pygame.Rect(40, 200, 20, 20)
+
+        self.assertIsNone(time_of_impact(box, -100, 0, self.target))
+
+    def test_timeOfImpact_ignoresBoxMovingOutOfTarget(self):
+        box = pygame.Rect(115, 110, 20, 20)  # started inside, moved right
+
+        self.assertIsNone(time_of_impact(box, 10, 0, self.target))
@@ -0,0 +1,86 @@
+import unittest
+from unittest.mock import patch
+
+from src.core.input import ALLOWED_EVENTS, InputSnapshot, InputState, filter_events
+
+import pygame
+
+
+def key_event(event_type: int, key: int) -> pygame.event.Event:
+    return pygame.event.Event(event_type, key=key)
+
+
+class InputStateShould(unittest.TestCase):
+    def setUp(self):
+        self.input_state = InputState()
+
+    def test_snapshot_holdsKeysPressedAndNotReleased(self):
+        self.input_state.handle_event(key_event(pygame.KEYDOWN, pygame.K_w), now=1.0)
+        self.input_state.handle_event(key_event(pygame.KEYDOWN, pygame.K_s), now=1.0)
+        self.input_state.handle_event(key_event(pygame.KEYUP, pygame.K_s), now=1.0)
+
+        snapshot = self.input_state.snapshot(now=1.0)
+
+        self.assertTrue(snapshot.is_pressed(pygame.K_w))
+        self.assertFalse(snapshot.is_pressed(pygame.K_s))
+
+    def test_snapshot_isNotChangedByLaterEvents(self):
+        self.input_state.handle_event(key_event(pygame.KEYDOWN, pygame.K_w), now=1.0)
+        snapshot = self.input_state.snapshot(now=1.0)
+
+        self.input_state.handle_event(key_event(pygame.KEYUP, pygame.K_w), now=2.0)
+
+        self.assertTrue(snapshot.is_pressed(pygame.K_w))
+
+    def test_snapshot_countsTicks(self):
+        self.assertEqual(1, self.input_state.snapshot().tick)
+        self.assertEqual(2, self.input_state.snapshot().tick)
+
+    def test_snapshot_recordsLatencyOfOldestChange(self):
+        self.input_state.handle_event(key_event(pygame.KEYDOWN, pygame.K_w), now=1.0)
+        self.input_state.handle_event(key_event(pygame.KEYUP, pygame.K_w), now=1.5)
+
+        first = self.input_state.snapshot(now=1.25 + 1.0)
+        second = self.input_state.snapshot(now=3.0)
+
+        self.assertEqual(1.0, first.changed_at)
+        self.assertIsNone(second.changed_at)
+        self.assertEqual(1, self.input_state.latency.count)
+        self.assertAlmostEqual(1.25, self.input_state.latency.worst)
+
+    def test_handleEvent_focusLost_releasesEveryKey(self):
+        self.input_state.handle_event(key_event(pygame.KEYDOWN, pygame.K_w), now=1.0)
+        self.input_state.handle_event(
+            pygame.event.Event(pygame.WINDOWFOCUSLOST), now=1.0
+        )
+
+        self.assertEqual(frozenset(), self.input_state.snapshot(now=1.0).pressed)
+
+    def test_handleEvent_ignoresOtherEvents(self):
+        self.input_state.handle_event(
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1), now=1.0
+        )
+
+        self.assertIsNone(self.input_state.snapshot(now=2.0).changed_at)
+        self.assertEqual(0, self.input_state.latency.count)
+
+
+class FilterEventsShould(unittest.TestCase):
+    def test_filterEvents_allowsOnlyGameEvents(self):
+        with (
+            patch("pygame.event.set_blocked") as set_blocked,
+            patch("pygame.event.set_allowed") as set_allowed,
+        ):
+            filter_events()
+
+        set_blocked.assert_called_once_with(None)
+        set_allowed.assert_called_once_with(ALLOWED_EVENTS)
+        self.assertNotIn(pygame.MOUSEMOTION, ALLOWED_EVENTS)
+
+
+class InputSnapshotShould(unittest.TestCase):
+    def test_snapshot_isImmutable(self):
+        snapshot = InputSnapshot()
+
+        with self.assertRaises(AttributeError):
+            snapshot.pressed = frozenset({pygame.K_w})
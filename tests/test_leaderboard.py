@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.utils.helpers import Leaderboard
+from src.utils.score_store import Score, SqliteScoreStore
+
+
+class LeaderboardShould(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "scores.db")
+        self.store = SqliteScoreStore(self.path)
+        self.leaderboard = Leaderboard(self.store, 3)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def _scores(self, scores):
+        return [Score("2025-01-01 10:00", score) for score in scores]
+
+    def test_topScores_returnsEmptyList_whenNothingIsSaved(self):
+        self.assertEqual([], self.leaderboard.top_scores())
+
+    def test_topScores_returnsBestScoresFirst(self):
+        self.store.add(self._scores([1, 5, 3, 4]))
+
+        scores = [score.score for score in self.leaderboard.top_scores()]
+
+        self.assertEqual([5, 4, 3], scores)
+
+    def test_topScores_queriesStoreOnce_whenStoreIsUnchanged(self):
+        self.store.add(self._scores([1, 2]))
+        self.leaderboard.top_scores()
+
+        with patch.object(self.store, "top") as mock_top:
+            self.leaderboard.top_scores()
+
+            mock_top.assert_not_called()
+
+    def test_topScores_reloads_whenAnotherConnectionSaves(self):
+        self.store.add(self._scores([1, 2]))
+        self.leaderboard.top_scores()
+
+        other = SqliteScoreStore(self.path)
+        other.add(self._scores([9]))
+        other.close()
+
+        self.assertEqual(9, self.leaderboard.top_scores()[0].score)
+
+    def test_save_mergesScoresKeepingSavedOrderForTies(self):
+        self.store.add(self._scores([4, 2]))
+        self.leaderboard.top_scores()
+        first = Score("2025-01-02 10:00", 4)
+        second = Score("2025-01-03 10:00", 3)
+
+        with patch.object(self.store, "top") as mock_top:
+            self.leaderboard.save([first, second])
+            top_scores = self.leaderboard.top_scores()
+
+            mock_top.assert_not_called()
+        self.assertEqual([4, 4, 3], [score.score for score in top_scores])
+        self.assertIs(first, top_scores[1])
+
+    def test_save_matchesStoreQuery(self):
+        self.leaderboard.top_scores()
+
+        self.leaderboard.save(self._scores([3, 8, 1, 8, 5]))
+
+        self.assertEqual(self.store.top(3), self.leaderboard.top_scores())
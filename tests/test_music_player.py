@@ -0,0 +1,119 @@
+import os
+import unittest
+from unittest.mock import Mock
+
+from src.core.music_player import MusicPlayer
+from src.utils import constants as c
+from src.utils.assets import get_asset_cache
+
+import pygame
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+MENU = "assets/sounds/mouse-click-normalized.wav"
+GAMEPLAY = "assets/sounds/fox-bounce-normalized.wav"
+
+
+class MusicPlayerShould(unittest.TestCase):
+    def setUp(self):
+        pygame.mixer.init(
+            c.AUDIO_FREQUENCY, c.AUDIO_SIZE, c.AUDIO_CHANNELS, c.AUDIO_BUFFER_SIZE
+        )
+        get_asset_cache().clear()
+        self.addCleanup(pygame.mixer.quit)
+        self.addCleanup(get_asset_cache().clear)
+        self.player = MusicPlayer(
+            {"menu": MENU, "gameplay": GAMEPLAY, "same": MENU}, c.MUSIC_CHANNELS
+        )
+        self.addCleanup(self.player.wait)
+        self.channels = self.player._channels = [Mock(), Mock()]
+        for channel in self.channels:
+            channel.get_busy.return_value = False
+
+    def prefetched(self) -> MusicPlayer:
+        self.player.prefetch()
+        self.player.wait()
+        return self.player
+
+    def test_prefetch_decodesEveryTrackOffTheCallingThread(self):
+        self.assertFalse(self.player.is_ready("menu"))
+
+        self.prefetched()
+
+        self.assertTrue(self.player.is_ready("menu"))
+        self.assertTrue(self.player.is_ready("gameplay"))
+        self.assertEqual("music-prefetch", self.player._worker.name)
+
+    def test_play_loopsDecodedTrackWithoutUnderrun(self):
+        self.prefetched().play("menu")
+
+        self.channels[1].play.assert_called_once_with(
+            get_asset_cache().sound(MENU), loops=-1, fade_ms=c.MUSIC_CROSSFADE
+        )
+        self.assertEqual(0, self.player.underruns)
+
+    def test_play_beforeDecode_countsUnderrun_andStartsOnUpdate(self):
+        self.player.play("menu")
+
+        self.assertEqual(1, self.player.underruns)
+        self.channels[1].play.assert_not_called()
+
+        self.player.wait()
+        self.player.update()
+
+        self.channels[1].play.assert_called_once()
+        self.assertGreater(self.player.underrun_wait, 0)
+
+    def test_play_otherTrack_crossfades(self):
+        self.prefetched().play("menu")
+        self.channels[1].get_busy.return_value = True
+
+        self.player.play("gameplay")
+
+        self.channels[1].fadeout.assert_called_once_with(c.MUSIC_CROSSFADE)
+        self.channels[0].play.assert_called_once_with(
+            get_asset_cache().sound(GAMEPLAY), loops=-1, fade_ms=c.MUSIC_CROSSFADE
+        )
+
+    def test_play_trackOfSameFile_keepsPlaying(self):
+        self.prefetched().play("menu")
+        self.channels[1].get_busy.return_value = True
+
+        self.player.play("same")
+
+        self.channels[1].fadeout.assert_not_called()
+        self.channels[0].play.assert_not_called()
+
+    def test_update_restartsStoppedTrack_andCountsDropout(self):
+        self.prefetched().play("menu")
+
+        self.player.update()
+
+        self.assertEqual(1, self.player.dropouts)
+        self.channels[0].play.assert_called_once_with(
+            get_asset_cache().sound(MENU), loops=-1, fade_ms=0
+        )
+
+    def test_stop_stopsBothChannels(self):
+        self.prefetched().play("menu")
+
+        self.player.stop()
+        self.player.update()
+
+        self.assertIsNone(self.player.current)
+        for channel in self.channels:
+            channel.stop.assert_called_once()
+        self.assertEqual(0, self.player.dropouts)
+
+    def test_missingFile_isReadyButSilent(self):
+        player = MusicPlayer({"menu": "assets/sounds/missing.mp3"}, c.MUSIC_CHANNELS)
+        player._channels = [Mock(), Mock()]
+        player.prefetch()
+        player.wait()
+
+        player.play("menu")
+        player.update()
+
+        self.assertTrue(player.is_ready("menu"))
+        for channel in player._channels:
+            channel.play.assert_not_called()
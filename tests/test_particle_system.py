@@ -0,0 +1,98 @@
+import unittest
+
+from src.effects.particle_system import ParticleSystem
+from src.utils import constants as c
+
+import numpy as np
+import pygame
+
+
+class ParticleSystemShould(unittest.TestCase):
+    def setUp(self):
+        self.particle_system = ParticleSystem(capacity=100, seed=0)
+
+    def test_spawnParticles_spawnsNumParticlesAtPosition(self):
+        self.particle_system.spawn_particles(10, 20, c.STAR_PARTICLES_COLOR)
+
+        self.assertEqual(c.PARTICLES_PER_SPAWN, self.particle_system.count)
+        self.assertTrue(np.all(self.particle_system.positions == (10, 20)))
+        self.assertTrue(np.all(self.particle_system.alphas == 255))
+
+    def test_spawnParticles_dropsParticlesBeyondCapacity(self):
+        self.particle_system.spawn_particles(0, 0, (1, 2, 3), count=80)
+        self.particle_system.spawn_particles(0, 0, (1, 2, 3), count=80)
+
+        self.assertEqual(100, self.particle_system.count)
+
+    def test_update_fadesParticlesOut(self):
+        self.particle_system.spawn_particles(0, 0, (1, 2, 3))
+
+        self.particle_system.update()
+
+        self.assertTrue(np.all(self.particle_system.alphas < 255))
+
+    def test_update_removesDeadParticles_keepingLiveOnes(self):
+        self.particle_system.spawn_particles(0, 0, (1, 2, 3), count=50)
+        lifetimes = self.particle_system._lifetime[:50].copy()
+
+        for tick in range(1, c.PARTICLE_MAX_LIFETIME + 1):
+            self.particle_system.update()
+            count = self.particle_system.count
+            self.assertEqual(np.count_nonzero(lifetimes > tick), count)
+            self.assertTrue(np.all(self.particle_system._lifetime[:count] > 0))
+
+        self.assertEqual(0, self.particle_system.count)
+
+    def test_draw_drawsNewParticlesOpaque(self):
+        screen = pygame.Surface((100, 100), depth=32)
+        reference = pygame.Surface((100, 100), depth=32)
+        self.particle_system.spawn_particles(50, 50, (200, 100, 50), count=1)
+
+        self.particle_system.draw(screen)
+        pygame.draw.circle(reference, (200, 100, 50), (50, 50), c.PARTICLE_SIZE)
+
+        self.assertTrue(
+            np.array_equal(
+                pygame.surfarray.array2d(reference), pygame.surfarray.array2d(screen)
+            )
+        )
+
+    def test_draw_fadesParticlesByAlpha(self):
+        screen = pygame.Surface((100, 100), depth=32)
+        self.particle_system.spawn_particles(50, 50, (200, 200, 200), count=1)
+        self.particle_system._velocity_x[0] = 0
+        self.particle_system._velocity_y[0] = 0
+        lifetime = self.particle_system._lifetime[0]
+        for _ in range(lifetime // 2):
+            self.particle_system.update()
+
+        self.particle_system.draw(screen)
+
+        self.assertLess(screen.get_at((50, 50)).r, 150)
+        self.assertGreater(screen.get_at((50, 50)).r, 50)
+
+    def test_draw_rendersStampsOncePerColor(self):
+        screen = pygame.Surface((100, 100), depth=32)
+        self.particle_system.spawn_particles(10, 10, (1, 2, 3))
+        self.particle_system.spawn_particles(20, 20, (1, 2, 3))
+        self.particle_system.spawn_particles(30, 30, (3, 2, 1))
+
+        self.particle_system.draw(screen)
+        self.particle_system.draw(screen)
+
+        self.assertEqual(2 * c.PARTICLE_ALPHA_LEVELS, len(self.particle_system._stamps))
+
+    def test_draw_returnsRectsCoveringDrawnPixels(self):
+        screen = pygame.Surface((100, 100), depth=32)
+        self.particle_system.spawn_particles(50, 50, (200, 100, 50), count=60)
+        self.particle_system.spawn_particles(1, 98, (10, 20, 30), count=40)
+        for _ in range(10):
+            self.particle_system.update()
+
+        rects = self.particle_system.draw(screen)
+
+        for x, y in zip(*np.nonzero(pygame.surfarray.array2d(screen))):
+            self.assertNotEqual(-1, pygame.Rect(x, y, 1, 1).collidelist(rects))
+
+    def test_draw_returnsNoRects_withoutParticles(self):
+        self.assertEqual([], self.particle_system.draw(pygame.Surface((10, 10))))
@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+import unittest
+
+from src.utils.profiling import ImportTimer, LatencyStats, format_startup_report
+
+
+class ImportTimerShould(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        with open(os.path.join(directory.name, "timed_parent.py"), "w") as file:
+            file.write("import timed_child\n")
+        with open(os.path.join(directory.name, "timed_child.py"), "w") as file:
+            file.write("VALUE = 1\n")
+        sys.path.insert(0, directory.name)
+        self.addCleanup(sys.path.remove, directory.name)
+        for name in ("timed_parent", "timed_child"):
+            self.addCleanup(sys.modules.pop, name, None)
+
+        self.import_timer = ImportTimer()
+        self.addCleanup(self.import_timer.uninstall)
+
+    def test_install_timesImportedModules(self):
+        self.import_timer.install()
+
+        import timed_parent  # noqa: F401
+
+        times = self.import_timer.times
+        self.assertIn("timed_parent", times)
+        self.assertIn("timed_child", times)
+        parent_self, parent_cumulative = times["timed_parent"]
+        _, child_cumulative = times["timed_child"]
+        self.assertGreaterEqual(parent_cumulative, parent_self + child_cumulative)
+
+    def test_uninstall_stopsTiming(self):
+        self.import_timer.install()
+        self.import_timer.uninstall()
+
+        import timed_parent  # noqa: F401
+
+        self.assertEqual({}, self.import_timer.times)
+        self.assertNotIn(self.import_timer, sys.meta_path)
+
+
+class FormatStartupReportShould(unittest.TestCase):
+    def test_formatStartupReport_listsSlowestImportsFirst(self):
+        report = format_startup_report(
+            {"fast": (0.001, 0.001), "slow": (0.002, 0.010)},
+            {"pygame.init": 0.004},
+            {"first frame": 0.020},
+        )
+
+        self.assertLess(report.index("slow"), report.index("fast"))
+        self.assertIn("pygame.init", report)
+        self.assertIn("20.0  first frame", report)
+
+
+class LatencyStatsShould(unittest.TestCase):
+    def test_record_tracksMeanAndWorst(self):
+        stats = LatencyStats()
+
+        stats.record(0.001)
+        stats.record(0.003)
+
+        self.assertEqual(2, stats.count)
+        self.assertAlmostEqual(0.002, stats.mean)
+        self.assertAlmostEqual(0.003, stats.worst)
@@ -0,0 +1,127 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.core import echo_bot
+from src.core.controllers import Observation, create_controller
+from src.core.remote_controller import (
+    MOVE_FORMAT,
+    OBSERVATION_FORMAT,
+    RemoteController,
+    decode_move,
+    decode_observation,
+    encode_move,
+    encode_observation,
+)
+
+OBSERVATION = Observation(
+    player="player2",
+    cloud_y=240,
+    face_x=600,
+    fox_x=300,
+    fox_y=190,
+    fox_velocity=(5.5, -3.25),
+    fox_width=30,
+    fox_height=44,
+    level=3,
+)
+# Long enough for a bot process to answer on a busy machine
+PATIENT = 5_000_000
+
+
+class ProtocolShould(unittest.TestCase):
+    def test_observation_roundTrips(self):
+        frame = encode_observation(7, OBSERVATION)
+
+        self.assertEqual(OBSERVATION_FORMAT.size, len(frame))
+        self.assertEqual((7, OBSERVATION), decode_observation(frame))
+
+    def test_move_roundTrips(self):
+        frame = encode_move(7, -0.5)
+
+        self.assertEqual(MOVE_FORMAT.size, len(frame))
+        self.assertEqual((7, -0.5), decode_move(frame))
+
+
+class RemoteControllerShould(unittest.TestCase):
+    def start(self, *options: str, wait: float = PATIENT) -> RemoteController:
+        command = [sys.executable, "-m", "src.core.echo_bot", *options]
+        controller = RemoteController(command, wait=wait)
+        self.addCleanup(controller.close)
+        return controller
+
+    def test_decide_returnsBotAnswer(self):
+        controller = self.start()
+
+        for _ in range(3):
+            controller.observe(OBSERVATION)
+            self.assertEqual(-0.5, controller.decide())
+
+        self.assertEqual(0, controller.late)
+
+    def test_decide_reusesLastMove_andCountsLateAnswer(self):
+        controller = self.start("--delay", "200", wait=0)
+
+        controller.observe(OBSERVATION)
+
+        self.assertEqual(0.0, controller.decide())
+        self.assertEqual(1, controller.late)
+
+    def test_decide_playsLateAnswer_onceItArrives(self):
+        controller = self.start("--delay", "200", wait=0)
+        controller.observe(OBSERVATION)
+        controller.decide()
+
+        controller.observe(OBSERVATION)
+        controller._wait = PATIENT / 1e6
+        controller.decide()
+
+        self.assertEqual(-0.5, controller.move)
+        self.assertEqual(1, controller.late)
+
+    def test_decide_keepsLastMove_whenBotExits(self):
+        controller = self.start()
+        controller.observe(OBSERVATION)
+        controller.decide()
+
+        controller._process.kill()
+        controller._process.wait()
+        controller.observe(OBSERVATION)
+
+        self.assertEqual(-0.5, controller.decide())
+        self.assertFalse(controller.connected)
+
+    def test_init_connectsToBotOnUnixSocket(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "bot.sock")
+        server = echo_bot.listen(path)
+        self.addCleanup(os.rmdir, directory)
+        self.addCleanup(os.unlink, path)
+        self.addCleanup(server.close)
+        bot = threading.Thread(target=echo_bot.serve_connection, args=(server,))
+        bot.start()
+
+        controller = RemoteController(socket_path=path, wait=PATIENT)
+        controller.observe(OBSERVATION)
+        move = controller.decide()
+        controller.close()
+        bot.join(5)
+
+        self.assertEqual(-0.5, move)
+        self.assertFalse(bot.is_alive())
+
+    def test_createController_startsEchoBot_forRemote(self):
+        controller = create_controller("remote", wait=PATIENT)
+        self.addCleanup(controller.close)
+
+        controller.observe(OBSERVATION)
+
+        self.assertEqual(-0.5, controller.decide())
+
+    def test_init_raisesValueError_withoutCommandInFrozenBuild(self):
+        with patch("src.core.remote_controller.ECHO_BOT_COMMAND", None):
+            with self.assertRaises(ValueError):
+                RemoteController()
@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import patch
+
+from src.core.simulation import create_headless_game
+from src.ui.renderer import Renderer
+from src.utils import constants as c
+
+import pygame
+
+
+class RendererShould(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        patcher = patch("pygame.display.flip")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.renderer = Renderer(pygame.Surface((c.WIDTH, c.HEIGHT)))
+        self.game_state = create_headless_game()
+
+    def test_render_movesToggleButtonsBack_whenStartScreenComesFromCache(self):
+        for state in (
+            c.GameStates.START,
+            c.GameStates.PAUSED,
+            c.GameStates.START,
+        ):
+            self.game_state.set_state(state)
+            self.renderer.render(self.game_state)
+
+        self.assertEqual(
+            c.SOUND_TOGGLE_BUTTON_POS, self.renderer.sound_button.rect.center
+        )
+        self.assertEqual(
+            c.MUSIC_TOGGLE_BUTTON_POS, self.renderer.music_button.rect.center
+        )
+
+    def test_render_movesToggleButtons_onPauseScreen(self):
+        self.game_state.set_state(c.GameStates.PAUSED)
+
+        self.renderer.render(self.game_state)
+
+        self.assertEqual(
+            c.PAUSE_SOUND_TOGGLE_BUTTON_POS, self.renderer.sound_button.rect.center
+        )
+        self.assertEqual(
+            c.PAUSE_MUSIC_TOGGLE_BUTTON_POS, self.renderer.music_button.rect.center
+        )
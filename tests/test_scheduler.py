@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import Mock
+
+from src.core.input import InputSnapshot
+from src.core.scheduler import TickScheduler
+
+
+class TickSchedulerShould(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.scheduler = TickScheduler(
+            (
+                ("input", lambda inputs: self.calls.append(("input", inputs))),
+                ("fox", lambda inputs: self.calls.append(("fox", inputs))),
+            )
+        )
+
+    def test_run_callsEveryPhaseOnceInOrder_withTheInputs(self):
+        inputs = InputSnapshot(tick=1)
+
+        self.scheduler.run(inputs)
+
+        self.assertEqual([("input", inputs), ("fox", inputs)], self.calls)
+        self.assertEqual(1, self.scheduler.ticks)
+
+    def test_run_timesEveryPhase(self):
+        self.scheduler.run()
+        self.scheduler.run()
+
+        self.assertEqual(("input", "fox"), tuple(self.scheduler.timings))
+        for stats in self.scheduler.timings.values():
+            self.assertEqual(2, stats.count)
+            self.assertGreaterEqual(stats.worst, 0.0)
+
+    def test_resetTimings_forgetsRecordedTicks(self):
+        self.scheduler.run()
+
+        self.scheduler.reset_timings()
+
+        self.assertEqual(0, self.scheduler.ticks)
+        self.assertEqual(0, self.scheduler.timings["fox"].count)
+
+    def test_phases_areListedInRunOrder(self):
+        scheduler = TickScheduler((("b", Mock()), ("a", Mock())))
+
+        self.assertEqual(("b", "a"), scheduler.phases)
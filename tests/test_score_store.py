@@ -0,0 +1,106 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from src.utils.score_store import (
+    PickleScoreStore,
+    Score,
+    ScoreStore,
+    SqliteScoreStore,
+    migrate_pickle_scores,
+)
+
+
+class ScoreStoreShould(unittest.TestCase):
+    def test_init_raisesTypeError_withoutImplementation(self):
+        with self.assertRaises(TypeError):
+            ScoreStore()
+
+
+class SqliteScoreStoreShould(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = SqliteScoreStore(os.path.join(self.directory.name, "scores.db"))
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_add_appendsScores(self):
+        self.store.add([Score("a", 1), Score("b", 2)])
+        self.store.add([Score("c", 3)])
+
+        self.assertEqual(3, self.store.count())
+
+    def test_top_returnsBestScoresFirstAndTiesInSavedOrder(self):
+        self.store.add([Score("a", 1), Score("b", 5), Score("c", 5), Score("d", 3)])
+
+        self.assertEqual(
+            [Score("b", 5), Score("c", 5), Score("d", 3)], self.store.top(3)
+        )
+
+    def test_top_usesScoreIndex(self):
+        plan = self.store._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT date, score FROM scores "
+            "ORDER BY score DESC, id LIMIT 5"
+        ).fetchall()
+
+        self.assertIn("scores_by_score", str(plan))
+
+
+class PickleScoreStoreShould(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "scores.pkl")
+        self.store = PickleScoreStore(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_add_keepsExistingScores(self):
+        self.store.add([Score("a", 1)])
+        self.store.add([Score("b", 2)])
+
+        self.assertEqual([Score("a", 1), Score("b", 2)], self.store.load())
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+    def test_load_removesCorruptFile(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a pickle")
+
+        self.assertEqual([], self.store.load())
+        self.assertFalse(os.path.exists(self.path))
+
+
+class MigratePickleScoresShould(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.pickle_path = os.path.join(self.directory.name, "scores.pkl")
+        self.store = SqliteScoreStore(os.path.join(self.directory.name, "scores.db"))
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_migrate_movesScoresOnce(self):
+        with open(self.pickle_path, "wb") as file:
+            pickle.dump([Score("a", 1), Score("b", 7)], file)
+
+        self.assertEqual(2, migrate_pickle_scores(self.pickle_path, self.store))
+        self.assertEqual(0, migrate_pickle_scores(self.pickle_path, self.store))
+
+        self.assertEqual([Score("b", 7), Score("a", 1)], self.store.top(5))
+        self.assertFalse(os.path.exists(self.pickle_path))
+        self.assertTrue(os.path.exists(f"{self.pickle_path}.migrated"))
+
+    def test_migrate_readsScoresPickledByOlderVersions(self):
+        legacy = pickle.dumps([Score("a", 4)], protocol=0).replace(
+            b"src.utils.score_store", b"src.utils.helpers"
+        )
+        with open(self.pickle_path, "wb") as file:
+            file.write(legacy)
+
+        migrate_pickle_scores(self.pickle_path, self.store)
+
+        self.assertEqual([Score("a", 4)], self.store.top(5))
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import Mock
+
+from src.core.ai_cloud import AICloud
+from src.core.simulation import create_headless_game, run_headless
+from src.core.sound_manager import NullSoundManager
+from src.utils import constants as c
+
+
+class SimulationShould(unittest.TestCase):
+    def setUp(self):
+        self.game_state = create_headless_game()
+
+    def test_createHeadlessGame_usesNullSoundManager(self):
+        self.assertIsInstance(self.game_state.sound_manager, NullSoundManager)
+
+    def test_createHeadlessGame_startsInPlayingState(self):
+        self.assertEqual(c.GameStates.PLAYING, self.game_state.current_state)
+
+    def test_createHeadlessGame_usesHeadlessClouds(self):
+        self.assertTrue(self.game_state.cloud_player1.headless)
+        self.assertIsInstance(self.game_state.cloud_player2, AICloud)
+        self.assertTrue(self.game_state.cloud_player2.headless)
+
+    def test_runHeadless_rendersEveryTick(self):
+        renderer = Mock()
+
+        run_headless(self.game_state, 10, renderer)
+
+        self.assertEqual(10, renderer.render.call_count)
+
+    def test_runHeadless_scoresPoints(self):
+        run_headless(self.game_state, 2000)
+
+        total = self.game_state.player1_score + self.game_state.player2_score
+        self.assertGreater(total, 0)
+
+    def test_runHeadless_survivesBonusStarAndMultiplayerToggle(self):
+        self.game_state.bonus_star.spawn()
+        self.game_state.toggle_multiplayer()
+
+        run_headless(self.game_state, 500)
+
+        self.assertTrue(self.game_state.cloud_player2.is_multiplayer)
+        self.assertTrue(self.game_state.cloud_player2.headless)
+
+    def test_update_fastFoxBouncesOffCloud_insteadOfPassingThrough(self):
+        fox = self.game_state.fox
+        cloud = self.game_state.cloud_player1
+        fox.rect.center = (140, cloud.rect.centery)
+        fox.velocity.update(-160, 0)
+
+        self.game_state.update()
+
+        self.assertGreater(fox.velocity.x, 0)
+        self.assertGreaterEqual(fox.hitbox.left, cloud.hitbox.right - 1)
+        self.assertEqual(0, self.game_state.player2_score)
+
+    def test_update_fastFoxFromJustOutsideCloud_bouncesInsteadOfScoring(self):
+        for speed in (35, 100):
+            with self.subTest(speed=speed):
+                game_state = create_headless_game()
+                fox = game_state.fox
+                cloud = game_state.cloud_player1
+                fox.rect.center = (
+                    cloud.hitbox.right + 1 + fox.hitbox.width // 2,
+                    cloud.rect.centery,
+                )
+                game_state.update()  # start the tick clear of the cloud
+                fox.velocity.update(-speed, 0)
+
+                game_state.update()
+
+                self.assertGreater(fox.velocity.x, 0)
+                self.assertGreaterEqual(fox.hitbox.left, cloud.hitbox.right - 1)
+                self.assertEqual(0, game_state.player2_score)
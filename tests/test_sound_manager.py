@@ -0,0 +1,97 @@
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+from src.core.sound_manager import NullSoundManager, SoundManager
+from src.utils import constants as c
+from src.utils.assets import get_asset_cache
+
+import pygame
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+class SoundManagerShould(unittest.TestCase):
+    def setUp(self):
+        pygame.mixer.init(
+            c.AUDIO_FREQUENCY, c.AUDIO_SIZE, c.AUDIO_CHANNELS, c.AUDIO_BUFFER_SIZE
+        )
+        get_asset_cache().clear()
+        self.addCleanup(pygame.mixer.quit)
+        self.addCleanup(get_asset_cache().clear)
+        self.sound_manager = SoundManager()
+        self.addCleanup(self.sound_manager.music.wait)
+
+    def test_init_reservesChannelPerSoundClass(self):
+        self.assertEqual(
+            len(set(c.SOUND_CHANNELS.values())),
+            len(set(self.sound_manager._channels.values())),
+        )
+
+    def test_playSound_playsOnChannelOfItsClass(self):
+        channel = self.sound_manager._channels["fox-bounce"] = Mock()
+
+        self.sound_manager.play_sound("fox-bounce")
+
+        channel.play.assert_called_once_with(self.sound_manager._sounds["fox-bounce"])
+
+    def test_playSound_keepsCooldown(self):
+        channel = self.sound_manager._channels["fox-bounce"] = Mock()
+
+        self.sound_manager.play_sound("fox-bounce")
+        self.sound_manager.play_sound("fox-bounce")
+
+        channel.play.assert_called_once()
+
+    def test_playSound_recordsLatencySinceRequest(self):
+        with patch("time.perf_counter", side_effect=[10.5]):
+            self.sound_manager.play_sound("mouse-click", requested_at=10.0)
+
+        self.assertEqual(1, self.sound_manager.play_latency.count)
+        self.assertAlmostEqual(0.5, self.sound_manager.play_latency.worst)
+
+    def test_queueSound_doesNotPlayUntilPlayQueued(self):
+        channel = self.sound_manager._channels["fox-bounce"] = Mock()
+
+        self.sound_manager.queue_sound("fox-bounce")
+        channel.play.assert_not_called()
+
+        self.sound_manager.play_queued()
+        channel.play.assert_called_once()
+
+    def test_playQueued_playsEachSoundOnce_forItsFirstRequest(self):
+        bounce = self.sound_manager._channels["fox-bounce"] = Mock()
+        bonus = self.sound_manager._channels["bonus-collect"] = Mock()
+        with patch("time.perf_counter", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0]):
+            self.sound_manager.queue_sound("fox-bounce")
+            self.sound_manager.queue_sound("bonus-collect")
+            self.sound_manager.queue_sound("fox-bounce")
+            self.sound_manager.play_queued()
+
+        bounce.play.assert_called_once()
+        bonus.play.assert_called_once()
+        self.assertEqual(2, self.sound_manager.play_latency.count)
+        self.assertAlmostEqual(3.0, self.sound_manager.play_latency.worst)
+
+    def test_init_prefetchesMusic(self):
+        self.sound_manager.music.wait()
+
+        self.assertTrue(self.sound_manager.music.is_ready("menu"))
+
+    def test_setMusicVolume_setsMusicChannelVolume(self):
+        channels = self.sound_manager.music._channels = [Mock(), Mock()]
+
+        self.sound_manager.set_music_volume(0.5)
+
+        for channel in channels:
+            channel.set_volume.assert_called_once_with(0.5)
+
+
+class NullSoundManagerShould(unittest.TestCase):
+    def test_queueSound_dropsSounds(self):
+        sound_manager = NullSoundManager()
+
+        sound_manager.queue_sound("fox-bounce")
+        sound_manager.play_queued()
+
+        self.assertEqual(0, len(sound_manager._queued))
@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import patch
+
+from src.core.startup import AssetLoader, StartupTimer
+from src.utils.assets import AssetCache
+
+
+class AssetLoaderShould(unittest.TestCase):
+    def setUp(self):
+        self.assets = AssetCache()
+
+    def test_start_decodesImagesForTheCache(self):
+        loader = AssetLoader(self.assets, ("assets/images/fox.png",), (), ())
+
+        loader.start()
+        loader.wait()
+
+        self.assertTrue(loader.done)
+        self.assertEqual(1.0, loader.progress)
+        with patch("pygame.image.load") as load:
+            self.assets.image("assets/images/fox.png")
+        load.assert_not_called()
+
+    def test_wait_raisesWorkerError(self):
+        loader = AssetLoader(self.assets, ("assets/images/missing.png",), (), ())
+
+        loader.start()
+
+        with self.assertRaises(FileNotFoundError):
+            loader.wait()
+
+    def test_done_isFalse_beforeStart(self):
+        loader = AssetLoader(self.assets, (), (), ())
+
+        self.assertFalse(loader.done)
+
+
+class StartupTimerShould(unittest.TestCase):
+    def test_mark_recordsEachMilestoneOnce(self):
+        startup_timer = StartupTimer()
+
+        first = startup_timer.mark("first frame")
+        again = startup_timer.mark("first frame")
+
+        self.assertEqual(first, again)
+        self.assertEqual({"first frame": first}, startup_timer.marks)
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import patch
+
+from src.ui.fonts import FontLoader
+from src.ui.text_cache import TextCache
+from src.utils import constants as c
+
+
+class TextCacheShould(unittest.TestCase):
+    def setUp(self):
+        self.font_patch = patch("pygame.font.Font").start()
+        self.text_cache = TextCache(max_surfaces=2, font_loader=FontLoader())
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_getFont_createsEachFontOnce(self):
+        first = self.text_cache.get_font("arial", 20)
+        second = self.text_cache.get_font("arial", 20)
+
+        self.assertIs(first, second)
+        self.font_patch.assert_called_once_with(c.FONT_FILES[("arial", False)], 20)
+
+    def test_getFont_keysOnBold(self):
+        self.text_cache.get_font("arial", 20)
+        self.text_cache.get_font("arial", 20, bold=True)
+
+        self.assertEqual(2, self.font_patch.call_count)
+
+    def test_render_rendersOnMissOnly(self):
+        first = self.text_cache.render("arial", 20, "SCORE", (1, 2, 3))
+        second = self.text_cache.render("arial", 20, "SCORE", (1, 2, 3))
+
+        self.assertIs(first, second)
+        self.assertEqual(1, self.text_cache.misses)
+        self.assertEqual(1, self.text_cache.hits)
+        self.font_patch.return_value.render.assert_called_once_with(
+            "SCORE", True, (1, 2, 3)
+        )
+
+    def test_render_keysOnColor(self):
+        self.text_cache.render("arial", 20, "SCORE", (1, 2, 3))
+        self.text_cache.render("arial", 20, "SCORE", (3, 2, 1))
+
+        self.assertEqual(2, self.text_cache.misses)
+
+    def test_render_evictsLeastRecentlyUsed_whenFull(self):
+        self.text_cache.render("arial", 20, "a", (0, 0, 0))
+        self.text_cache.render("arial", 20, "b", (0, 0, 0))
+        self.text_cache.render("arial", 20, "a", (0, 0, 0))
+        self.text_cache.render("arial", 20, "c", (0, 0, 0))
+
+        self.assertEqual(2, self.text_cache.size)
+        self.text_cache.render("arial", 20, "a", (0, 0, 0))
+        self.assertEqual(2, self.text_cache.hits)
+        self.text_cache.render("arial", 20, "b", (0, 0, 0))
+        self.assertEqual(4, self.text_cache.misses)